@@ -0,0 +1,13 @@
+"""
+Benchmarks of blaise's hot paths: the ciphers, crackers, scorers, segmenter, data loading and import time.
+
+Run them and save the results, then compare two runs to find regressions::
+
+    python -m benchmarks run -o before.json
+    python -m benchmarks run -o after.json
+    python -m benchmarks compare before.json after.json
+
+``-k`` runs only the cases whose identifiers contain a string, such as ``-k vigenere.crack``, and ``--quick``
+runs only the first case of each benchmark. The inputs are sampled from :mod:`benchmarks.corpus` with fixed
+seeds, so every run times the same work.
+"""
@@ -0,0 +1,54 @@
+import argparse
+import sys
+
+from . import bench_ciphers, bench_data, bench_import, bench_scores, bench_strings  # noqa: F401
+from .harness import compare, load, run, save
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description=sys.modules[__package__].__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("-o", "--output", help="save the results to this JSON file")
+    run_parser.add_argument("-k", "--filter", help="only run cases whose identifiers contain this")
+    run_parser.add_argument("--quick", action="store_true", help="only run the first case of each benchmark")
+    run_parser.add_argument("--repeat", type=int, default=5, help="times to repeat each case (default 5)")
+    run_parser.add_argument("--min-time", type=float, default=0.2, help="minimum seconds per repeat (default 0.2)")
+    run_parser.add_argument("--compare", metavar="BASELINE", help="compare the results to a saved run")
+
+    compare_parser = commands.add_parser("compare", help="compare two saved runs")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+
+    for p in run_parser, compare_parser:
+        p.add_argument(
+            "--threshold", type=float, default=1.1, help="ratio of fastest times counted as a regression (default 1.1)"
+        )
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(args.filter, repeat=args.repeat, min_time=args.min_time, quick=args.quick)
+        if args.output:
+            save(results, args.output)
+        if not args.compare:
+            return 0
+        baseline, current = load(args.compare), {"results": results}
+    else:
+        baseline, current = load(args.baseline), load(args.current)
+
+    lines, regressions = compare(baseline, current, args.threshold)
+    print(f"{'baseline':>10}  {'current':>10}  {'ratio':>7}  case")
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower by more than {args.threshold}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,51 @@
+import polars as pl
+
+from blaise.ciphers import Caesar, Playfair, Vigenere
+
+from .corpus import random_key, sample_text, sample_texts
+from .harness import benchmark
+
+CIPHERS = {
+    "caesar": (Caesar(), 7),
+    "vigenere": (Vigenere(), "LEMON"),
+    "playfair": (Playfair(), "PLAYFAIREXAMPLE"),
+}
+
+
+@benchmark("cipher.encrypt", cipher=list(CIPHERS), text_length=[1_000, 100_000])
+def encrypt(cipher, text_length):
+    cipher, key = CIPHERS[cipher]
+    text = sample_text(text_length)
+    return lambda: cipher.encrypt(text, key)
+
+
+@benchmark("cipher.decrypt", cipher=list(CIPHERS), text_length=[1_000, 100_000])
+def decrypt(cipher, text_length):
+    cipher, key = CIPHERS[cipher]
+    ciphertext = cipher.encrypt(sample_text(text_length), key)
+    return lambda: cipher.decrypt(ciphertext, key)
+
+
+@benchmark("cipher.encrypt_series", cipher=list(CIPHERS), n_rows=[10_000], n_jobs=[1, -1])
+def encrypt_series(cipher, n_rows, n_jobs):
+    cipher, key = CIPHERS[cipher]
+    texts = pl.Series("text", sample_texts(n_rows, 40))
+    return lambda: cipher.encrypt_series(texts, key, n_jobs=n_jobs)
+
+
+@benchmark("caesar.crack", text_length=[100, 1_000, 10_000])
+def caesar_crack(text_length):
+    ciphertext = Caesar().encrypt(sample_text(text_length), 7)
+    return lambda: Caesar().crack(ciphertext)
+
+
+@benchmark("vigenere.crack", text_length=[200, 1_000], key_length=[3, 5, 7])
+def vigenere_crack(text_length, key_length):
+    ciphertext = Vigenere().encrypt(sample_text(text_length), random_key(key_length))
+    return lambda: Vigenere().crack(ciphertext, key_length=key_length)
+
+
+@benchmark("playfair.crack", text_length=[200, 1_000])
+def playfair_crack(text_length):
+    ciphertext = Playfair().encrypt(sample_text(text_length), "PLAYFAIREXAMPLE")
+    return lambda: Playfair().crack(ciphertext, n_restarts=2, n_iters=5_000, seed=0)
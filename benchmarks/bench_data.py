@@ -0,0 +1,53 @@
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from .corpus import word_dist
+from .harness import Subprocess, benchmark
+
+_folder: tempfile.TemporaryDirectory | None = None
+
+
+def data_path() -> str:
+    """A user data folder for the benchmarks, holding the benchmark word distribution, removed on exit."""
+    global _folder
+    if _folder is None:
+        _folder = tempfile.TemporaryDirectory(prefix="blaise-bench-")
+        os.makedirs(os.path.join(_folder.name, "word_dist"))
+        with open(os.path.join(_folder.name, "word_dist", "bench.json"), "w") as f:
+            json.dump(word_dist(), f)
+    return _folder.name
+
+
+def clear_cache() -> None:
+    shutil.rmtree(os.path.join(data_path(), "cache"), ignore_errors=True)
+
+
+def load_case(setup: str, statement: str, state: str) -> Subprocess:
+    """
+    Times loading data in a fresh interpreter, either ``cold``, with the native cache cleared before each run, or
+    ``warm``, from a cache filled by a previous process.
+    """
+    env = {"BLAISE_DATA_PATH": data_path()}
+    clear_cache()
+    if state == "warm":
+        subprocess.run([sys.executable, "-c", f"{setup}\n{statement}"], env={**os.environ, **env}, check=True)
+    return Subprocess(statement, setup, before=clear_cache if state == "cold" else None, env=env)
+
+
+@benchmark("data.load_ngram_table", state=["cold", "warm"], n=[3, 2, 1])
+def load_ngram_table(state, n):
+    return load_case("from blaise.data.ngram import load_ngram_table", f"load_ngram_table('en_wiki', {n})", state)
+
+
+@benchmark("data.load_word_index", state=["cold", "warm"])
+def load_word_index(state):
+    return load_case("from blaise.data.worddist import load_word_index", "load_word_index('bench')", state)
+
+
+@benchmark("data.ngram_scorer", state=["cold", "warm"])
+def ngram_scorer(state):
+    return load_case("from blaise.scores import NGramScorer", "NGramScorer(3, 'en_wiki')", state)
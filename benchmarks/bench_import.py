@@ -0,0 +1,16 @@
+from .harness import Subprocess, benchmark
+
+# Each statement is timed in fresh interpreters, as a worker or CLI tool would run it.
+STATEMENTS = [
+    "import blaise",
+    "from blaise.strings import normalize_string",
+    "from blaise.ciphers import Caesar; Caesar().encrypt('HELLO', 3)",
+    "from blaise.ciphers import Vigenere",
+    "from blaise.scores import NGramScorer",
+    "from blaise.strings import Segmenter",
+]
+
+
+@benchmark("import", statement=STATEMENTS)
+def import_time(statement):
+    return Subprocess(statement)
@@ -0,0 +1,25 @@
+from blaise.scores import LogProbNGramScorer, NGramScorer
+from blaise.scores.ngram import _PyNGramScorer
+
+from .corpus import sample_letters, sample_texts
+from .harness import benchmark
+
+SCORERS = {
+    "ngram": NGramScorer,
+    "logprob": LogProbNGramScorer,
+    "python": _PyNGramScorer,
+}
+
+
+@benchmark("score.score", scorer=list(SCORERS), n=[3, 2, 1], text_length=[100, 10_000])
+def score(scorer, n, text_length):
+    scorer = SCORERS[scorer](n, "en_wiki")
+    text = sample_letters(text_length)
+    return lambda: scorer.score(text)
+
+
+@benchmark("score.score_many", scorer=["ngram", "logprob"], n_texts=[1_000], n_jobs=[1, -1])
+def score_many(scorer, n_texts, n_jobs):
+    scorer = SCORERS[scorer](3, "en_wiki")
+    texts = sample_texts(n_texts, 100)
+    return lambda: scorer.score_many(texts, n_jobs=n_jobs)
@@ -0,0 +1,32 @@
+from blaise.strings import Segmenter, normalize_string, normalize_strings, restore_string
+
+from .corpus import sample_text, sample_texts, word_dist
+from .harness import benchmark
+
+
+@benchmark("strings.normalize_string", text_length=[100, 100_000])
+def normalize(text_length):
+    text = sample_text(text_length)
+    return lambda: normalize_string(text)
+
+
+@benchmark("strings.normalize_strings", n_texts=[10_000], n_jobs=[1, -1])
+def normalize_many(n_texts, n_jobs):
+    texts = sample_texts(n_texts, 40)
+    return lambda: normalize_strings(texts, n_jobs=n_jobs)
+
+
+@benchmark("strings.restore_string", text_length=[1_000])
+def restore(text_length):
+    # restore_string only keeps the places of ASCII letters.
+    text = sample_text(text_length).encode("ascii", "ignore").decode()
+    letters = normalize_string(text)
+    return lambda: restore_string(text, letters)
+
+
+@benchmark("segmenter.segment", text_length=[25, 100, 400, 1_000], n_best=[1, 10])
+def segment(text_length, n_best):
+    segmenter = Segmenter(word_dist())
+    # Whole sampled words, so that every text has a segmentation.
+    text = normalize_string(sample_text(text_length))
+    return lambda: segmenter.segment(text, n_best)
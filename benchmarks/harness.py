@@ -0,0 +1,216 @@
+"""
+Registering, running and comparing benchmarks.
+
+A benchmark is a setup function registered with :func:`benchmark`, called once for each combination of its
+parameters. It returns either the callable to time, which is timed in this process, or a :class:`Subprocess`
+to time in fresh interpreters, for anything that depends on the state of a new process such as imports and
+cold caches.
+"""
+
+import itertools
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@dataclass
+class Subprocess:
+    """
+    A statement to time in fresh interpreters, after running ``setup`` there untimed. ``before`` is called in
+    this process before each run, and ``env`` is added to the environment of the interpreter.
+    """
+
+    statement: str
+    setup: str = "pass"
+    before: Callable[[], None] | None = None
+    env: dict[str, str] | None = None
+
+
+@dataclass
+class Benchmark:
+    name: str
+    setup: Callable[..., Callable[[], Any] | Subprocess]
+    params: dict[str, list]
+
+    def cases(self) -> Iterator[dict[str, Any]]:
+        for values in itertools.product(*self.params.values()):
+            yield dict(zip(self.params, values))
+
+
+BENCHMARKS: list[Benchmark] = []
+
+
+def benchmark(name: str, **params: list) -> Callable:
+    """Registers a setup function as the benchmark ``name``, to be run for each combination of ``params``."""
+
+    def register(setup: Callable[..., Callable[[], Any] | Subprocess]):
+        BENCHMARKS.append(Benchmark(name, setup, params))
+        return setup
+
+    return register
+
+
+def case_id(name: str, params: dict[str, Any]) -> str:
+    """
+    The identifier of a benchmark case, which is what runs are matched on when comparing them.
+
+    >>> case_id("caesar.crack", {"text_length": 100, "n_jobs": 1})
+    'caesar.crack[text_length=100,n_jobs=1]'
+    """
+    return f"{name}[{','.join(f'{k}={v}' for k, v in params.items())}]" if params else name
+
+
+def time_callable(func: Callable[[], Any], repeat: int, min_time: float) -> tuple[list[float], int]:
+    """
+    Times ``func`` ``repeat`` times, calling it as many times per repeat as takes at least ``min_time`` seconds,
+    and returns the seconds per call of each repeat and the number of calls per repeat.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        number = max(number * 2, int(number * min_time / elapsed * 1.2) if elapsed > 0 else number * 10)
+    return [t / number for t in [elapsed, *timer.repeat(repeat - 1, number)]], number
+
+
+_TIMER = """
+import time
+{setup}
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def time_subprocess(case: Subprocess, repeat: int) -> tuple[list[float], int]:
+    """Times ``case`` in ``repeat`` fresh interpreters, and returns the seconds each took and the number of calls."""
+    env = {**os.environ, **(case.env or {})}
+    code = _TIMER.format(setup=case.setup, statement=case.statement)
+    times = []
+    for _ in range(repeat):
+        if case.before is not None:
+            case.before()
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True)
+        times.append(float(result.stdout.split()[-1]))
+    return times, 1
+
+
+def run(pattern: str | None = None, repeat: int = 5, min_time: float = 0.2, quick: bool = False) -> list[dict]:
+    """
+    Runs the registered benchmarks whose case identifiers contain ``pattern``, and returns their results. In
+    ``quick`` mode, only the first value of each parameter is run.
+    """
+    results = []
+    for bench in BENCHMARKS:
+        for params in itertools.islice(bench.cases(), 1 if quick else None):
+            key = case_id(bench.name, params)
+            if pattern is not None and pattern not in key:
+                continue
+            case = bench.setup(**params)
+            if isinstance(case, Subprocess):
+                times, number = time_subprocess(case, repeat)
+            else:
+                times, number = time_callable(case, repeat, min_time)
+            result = {
+                "id": key,
+                "name": bench.name,
+                "params": params,
+                "number": number,
+                "times": times,
+                "min": min(times),
+                "median": statistics.median(times),
+            }
+            print(f"{format_time(result['min']):>10}  {key}", file=sys.stderr)
+            results.append(result)
+    return results
+
+
+def environment() -> dict[str, Any]:
+    """Describes the machine and the version of the code being benchmarked, to be saved with the results."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = bool(
+            subprocess.run(["git", "status", "--porcelain"], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        commit, dirty = None, None
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        blaise_version = version("blaise")
+    except PackageNotFoundError:
+        blaise_version = None
+    return {
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": commit,
+        "dirty": dirty,
+        "blaise": blaise_version,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save(results: list[dict], path: str) -> None:
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+
+def load(path: str) -> dict[str, Any]:
+    with open(path) as f:
+        return json.load(f)
+
+
+def compare(baseline: dict, current: dict, threshold: float = 1.1) -> tuple[list[str], list[str]]:
+    """
+    Compares the fastest times of the cases in two saved runs, which are the least affected by other load on the
+    machine, and returns the lines of a report and the identifiers of the cases that got slower by more than a
+    factor of ``threshold``.
+
+    >>> old = {"results": [{"id": "a", "min": 1.0}, {"id": "b", "min": 1.0}]}
+    >>> new = {"results": [{"id": "a", "min": 1.5}, {"id": "b", "min": 0.5}]}
+    >>> compare(old, new)[1]
+    ['a']
+    """
+    old = {r["id"]: r for r in baseline["results"]}
+    lines, regressions = [], []
+    for result in current["results"]:
+        key = result["id"]
+        if key not in old:
+            lines.append(f"{'':>10}  {format_time(result['min']):>10}  {'new':>7}  {key}")
+            continue
+        ratio = result["min"] / old[key]["min"]
+        flag = ""
+        if ratio > threshold:
+            regressions.append(key)
+            flag = "  slower"
+        elif ratio < 1 / threshold:
+            flag = "  faster"
+        lines.append(
+            f"{format_time(old[key]['min']):>10}  {format_time(result['min']):>10}  {ratio:6.2f}x  {key}{flag}"
+        )
+    return lines, regressions
+
+
+def format_time(seconds: float) -> str:
+    """
+    >>> format_time(0.0000123)
+    '12.30 us'
+    """
+    for unit, scale in [("s", 1), ("ms", 1e-3), ("us", 1e-6)]:
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.2f} ns"
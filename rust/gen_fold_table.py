@@ -0,0 +1,66 @@
+"""
+Generates ``src/fold_table.rs``, the table of the ASCII characters in the NFKD form of each non-ASCII character,
+from Python's ``unicodedata``. Run it with the newest Python available to pick up new Unicode versions:
+
+    python rust/gen_fold_table.py
+"""
+
+import sys
+import unicodedata
+from pathlib import Path
+
+LATIN_START, LATIN_END = 0x80, 0x250
+OUTPUT = Path(__file__).parent / "src" / "fold_table.rs"
+
+
+def ascii_form(cp: int) -> str:
+    return unicodedata.normalize("NFKD", chr(cp)).encode("ascii", "ignore").decode("ascii")
+
+
+def rust_str(s: str) -> str:
+    return '"' + "".join(c if c.isprintable() and c not in '"\\' else f"\\u{{{ord(c):x}}}" for c in s) + '"'
+
+
+def rust_array(items: list[str], per_line: int) -> str:
+    lines = [", ".join(items[i : i + per_line]) + "," for i in range(0, len(items), per_line)]
+    return "\n".join("    " + line for line in lines)
+
+
+def main():
+    latin = [ascii_form(cp) for cp in range(LATIN_START, LATIN_END)]
+    other = [
+        (cp, form)
+        for cp in range(LATIN_END, sys.maxunicode + 1)
+        if not 0xD800 <= cp < 0xE000 and (form := ascii_form(cp))
+    ]
+    OUTPUT.write_text(
+        f"""\
+//! Generated by `python rust/gen_fold_table.py` from Unicode {unicodedata.unidata_version}. Do not edit.
+
+/// The first character of `LATIN`.
+pub const LATIN_START: u32 = {LATIN_START:#x};
+
+/// The ASCII characters in the NFKD form of each character from `LATIN_START` to the end of Latin
+/// Extended-B, or "" if there are none.
+#[rustfmt::skip]
+pub static LATIN: [&str; {len(latin)}] = [
+{rust_array([rust_str(form) for form in latin], 12)}
+];
+
+/// Every later character with ASCII characters in its NFKD form, in order.
+#[rustfmt::skip]
+pub static OTHER_CHARS: [u32; {len(other)}] = [
+{rust_array([f"{cp:#x}" for cp, _ in other], 10)}
+];
+
+/// The ASCII characters in the NFKD form of each of `OTHER_CHARS`.
+#[rustfmt::skip]
+pub static OTHER_FORMS: [&str; {len(other)}] = [
+{rust_array([rust_str(form) for _, form in other], 12)}
+];
+"""
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,449 @@
+//! Exchanging columns with Python dataframe libraries through the Arrow C stream interface.
+//!
+//! Columns are read in place from the buffers of the arrays in a stream, and string results are
+//! built directly in Arrow's layout and handed over without copying. See
+//! <https://arrow.apache.org/docs/format/CStreamInterface.html> for the structs and their
+//! ownership rules.
+
+use std::collections::VecDeque;
+use std::ffi::{CStr, CString, c_char, c_int, c_void};
+use std::ptr;
+
+#[repr(C)]
+pub struct ArrowSchema {
+    format: *const c_char,
+    name: *const c_char,
+    metadata: *const c_char,
+    flags: i64,
+    n_children: i64,
+    children: *mut *mut ArrowSchema,
+    dictionary: *mut ArrowSchema,
+    release: Option<unsafe extern "C" fn(*mut ArrowSchema)>,
+    private_data: *mut c_void,
+}
+
+#[repr(C)]
+pub struct ArrowArray {
+    length: i64,
+    null_count: i64,
+    offset: i64,
+    n_buffers: i64,
+    n_children: i64,
+    buffers: *mut *const c_void,
+    children: *mut *mut ArrowArray,
+    dictionary: *mut ArrowArray,
+    release: Option<unsafe extern "C" fn(*mut ArrowArray)>,
+    private_data: *mut c_void,
+}
+
+#[repr(C)]
+pub struct ArrowArrayStream {
+    get_schema: Option<unsafe extern "C" fn(*mut ArrowArrayStream, *mut ArrowSchema) -> c_int>,
+    get_next: Option<unsafe extern "C" fn(*mut ArrowArrayStream, *mut ArrowArray) -> c_int>,
+    get_last_error: Option<unsafe extern "C" fn(*mut ArrowArrayStream) -> *const c_char>,
+    release: Option<unsafe extern "C" fn(*mut ArrowArrayStream)>,
+    private_data: *mut c_void,
+}
+
+impl ArrowSchema {
+    fn empty() -> ArrowSchema {
+        ArrowSchema {
+            format: ptr::null(),
+            name: ptr::null(),
+            metadata: ptr::null(),
+            flags: 0,
+            n_children: 0,
+            children: ptr::null_mut(),
+            dictionary: ptr::null_mut(),
+            release: None,
+            private_data: ptr::null_mut(),
+        }
+    }
+}
+
+impl ArrowArray {
+    fn empty() -> ArrowArray {
+        ArrowArray {
+            length: 0,
+            null_count: 0,
+            offset: 0,
+            n_buffers: 0,
+            n_children: 0,
+            buffers: ptr::null_mut(),
+            children: ptr::null_mut(),
+            dictionary: ptr::null_mut(),
+            release: None,
+            private_data: ptr::null_mut(),
+        }
+    }
+
+    /// The `i`th buffer as a slice of `len` values of `T`, or `None` if the buffer is absent.
+    unsafe fn buffer<T>(&self, i: usize, len: usize) -> Option<&[T]> {
+        let buffer = unsafe { *self.buffers.add(i) } as *const T;
+        (!buffer.is_null()).then(|| unsafe { std::slice::from_raw_parts(buffer, len) })
+    }
+
+    /// Whether each element is valid (not null), or `None` if all of them are.
+    unsafe fn validity(&self) -> Option<impl Fn(usize) -> bool + '_> {
+        if self.null_count == 0 {
+            return None;
+        }
+        let offset = self.offset as usize;
+        let bits: &[u8] = unsafe { self.buffer(0, (offset + self.length as usize).div_ceil(8))? };
+        Some(move |i: usize| bits[(offset + i) / 8] & (1 << ((offset + i) % 8)) != 0)
+    }
+}
+
+/// A column read from an Arrow stream. The arrays are released when it's dropped, so the values
+/// borrowed from it stay valid for its lifetime.
+pub struct ImportedColumn {
+    format: String,
+    arrays: Vec<ArrowArray>,
+}
+
+impl Drop for ImportedColumn {
+    fn drop(&mut self) {
+        for array in &mut self.arrays {
+            if let Some(release) = array.release {
+                unsafe { release(array) };
+            }
+        }
+    }
+}
+
+/// Reads every array from a stream, taking ownership of the stream and releasing it.
+///
+/// # Safety
+///
+/// `stream` must point to a valid Arrow C stream, which isn't used again by the caller.
+pub unsafe fn import_stream(stream: *mut ArrowArrayStream) -> Result<ImportedColumn, String> {
+    let mut owned = unsafe { ptr::read(stream) };
+    // The stream is moved here, so the original must not be released again.
+    unsafe { (*stream).release = None };
+    let result = unsafe { read_stream(&mut owned) };
+    if let Some(release) = owned.release {
+        unsafe { release(&mut owned) };
+    }
+    result
+}
+
+unsafe fn read_stream(stream: &mut ArrowArrayStream) -> Result<ImportedColumn, String> {
+    let error = |stream: &mut ArrowArrayStream, code: c_int| {
+        let message = stream
+            .get_last_error
+            .map(|get_last_error| unsafe { get_last_error(stream) })
+            .filter(|message| !message.is_null())
+            .map(|message| {
+                unsafe { CStr::from_ptr(message) }
+                    .to_string_lossy()
+                    .into_owned()
+            });
+        format!(
+            "Reading an Arrow stream failed: {}",
+            message.unwrap_or(format!("error {code}"))
+        )
+    };
+    let (get_schema, get_next) = match (stream.get_schema, stream.get_next) {
+        (Some(get_schema), Some(get_next)) => (get_schema, get_next),
+        _ => return Err("Arrow stream is released".to_string()),
+    };
+    let mut schema = ArrowSchema::empty();
+    let code = unsafe { get_schema(stream, &mut schema) };
+    if code != 0 {
+        return Err(error(stream, code));
+    }
+    let format = unsafe { CStr::from_ptr(schema.format) }
+        .to_string_lossy()
+        .into_owned();
+    if let Some(release) = schema.release {
+        unsafe { release(&mut schema) };
+    }
+    let mut column = ImportedColumn {
+        format,
+        arrays: Vec::new(),
+    };
+    loop {
+        let mut array = ArrowArray::empty();
+        let code = unsafe { get_next(stream, &mut array) };
+        if code != 0 {
+            return Err(error(stream, code));
+        }
+        if array.release.is_none() {
+            return Ok(column);
+        }
+        column.arrays.push(array);
+    }
+}
+
+impl ImportedColumn {
+    pub fn len(&self) -> usize {
+        self.arrays.iter().map(|array| array.length as usize).sum()
+    }
+
+    /// The values of a column of strings (or binary data), with `None` for nulls.
+    pub fn strings(&self) -> Result<Vec<Option<&[u8]>>, String> {
+        let mut values = Vec::with_capacity(self.len());
+        for array in &self.arrays {
+            unsafe {
+                match self.format.as_str() {
+                    "u" | "z" => read_offset_strings::<i32>(array, &mut values),
+                    "U" | "Z" => read_offset_strings::<i64>(array, &mut values),
+                    "vu" | "vz" => read_view_strings(array, &mut values),
+                    format => {
+                        return Err(format!(
+                            "Expected a column of strings, got Arrow format {format}"
+                        ));
+                    }
+                }
+            }
+        }
+        Ok(values)
+    }
+
+    /// The values of a column of integers, with `None` for nulls.
+    pub fn ints(&self) -> Result<Vec<Option<i64>>, String> {
+        let mut values = Vec::with_capacity(self.len());
+        for array in &self.arrays {
+            unsafe {
+                match self.format.as_str() {
+                    "c" => read_ints::<i8>(array, &mut values),
+                    "C" => read_ints::<u8>(array, &mut values),
+                    "s" => read_ints::<i16>(array, &mut values),
+                    "S" => read_ints::<u16>(array, &mut values),
+                    "i" => read_ints::<i32>(array, &mut values),
+                    "I" => read_ints::<u32>(array, &mut values),
+                    "l" => read_ints::<i64>(array, &mut values),
+                    format => {
+                        return Err(format!(
+                            "Expected a column of integers, got Arrow format {format}"
+                        ));
+                    }
+                }
+            }
+        }
+        Ok(values)
+    }
+}
+
+unsafe fn read_ints<T: Copy + Into<i64>>(array: &ArrowArray, values: &mut Vec<Option<i64>>) {
+    let (offset, len) = (array.offset as usize, array.length as usize);
+    let Some(ints) = (unsafe { array.buffer::<T>(1, offset + len) }) else {
+        values.extend(std::iter::repeat_n(None, len));
+        return;
+    };
+    let ints = &ints[offset..];
+    match unsafe { array.validity() } {
+        Some(valid) => values.extend((0..len).map(|i| valid(i).then(|| ints[i].into()))),
+        None => values.extend(ints.iter().map(|&x| Some(x.into()))),
+    }
+}
+
+unsafe fn read_offset_strings<'a, O: Copy + TryInto<usize>>(
+    array: &'a ArrowArray,
+    values: &mut Vec<Option<&'a [u8]>>,
+) {
+    let (offset, len) = (array.offset as usize, array.length as usize);
+    let Some(offsets) = (unsafe { array.buffer::<O>(1, offset + len + 1) }) else {
+        values.extend(std::iter::repeat_n(None, len));
+        return;
+    };
+    let offsets = &offsets[offset..];
+    let to_usize = |o: O| o.try_into().unwrap_or(0);
+    let data_len = to_usize(offsets[len]);
+    let data: &[u8] = unsafe { array.buffer(2, data_len) }.unwrap_or(&[]);
+    let value = |i: usize| &data[to_usize(offsets[i])..to_usize(offsets[i + 1])];
+    match unsafe { array.validity() } {
+        Some(valid) => values.extend((0..len).map(|i| valid(i).then(|| value(i)))),
+        None => values.extend((0..len).map(|i| Some(value(i)))),
+    }
+}
+
+/// Reads string views: 16 bytes per value, holding the length and either the whole string (up
+/// to 12 bytes) or the index of a data buffer and an offset into it.
+unsafe fn read_view_strings<'a>(array: &'a ArrowArray, values: &mut Vec<Option<&'a [u8]>>) {
+    let (offset, len) = (array.offset as usize, array.length as usize);
+    let Some(views) = (unsafe { array.buffer::<[u8; 16]>(1, offset + len) }) else {
+        values.extend(std::iter::repeat_n(None, len));
+        return;
+    };
+    let views = &views[offset..];
+    // After the validity and view buffers come the data buffers, then their lengths.
+    let n_data = (array.n_buffers as usize).saturating_sub(3);
+    let data_lens: &[i64] = unsafe { array.buffer(2 + n_data, n_data) }.unwrap_or(&[]);
+    let data: Vec<&[u8]> = (0..n_data)
+        .map(|i| unsafe { array.buffer(2 + i, data_lens[i] as usize) }.unwrap_or(&[]))
+        .collect();
+    let field = |view: &[u8; 16], i: usize| u32::from_le_bytes(view[i..i + 4].try_into().unwrap());
+    let value = |i: usize| -> &'a [u8] {
+        let view = &views[i];
+        let n = field(view, 0) as usize;
+        if n <= 12 {
+            &view[4..4 + n]
+        } else {
+            let (buffer, start) = (field(view, 8) as usize, field(view, 12) as usize);
+            &data[buffer][start..start + n]
+        }
+    };
+    match unsafe { array.validity() } {
+        Some(valid) => values.extend((0..len).map(|i| valid(i).then(|| value(i)))),
+        None => values.extend((0..len).map(|i| Some(value(i)))),
+    }
+}
+
+/// A chunk of a string column built in Arrow's large string layout.
+pub struct StringChunk {
+    offsets: Vec<i64>,
+    data: Vec<u8>,
+    validity: Vec<u8>,
+    null_count: usize,
+}
+
+impl Default for StringChunk {
+    fn default() -> StringChunk {
+        StringChunk {
+            offsets: vec![0],
+            data: Vec::new(),
+            validity: Vec::new(),
+            null_count: 0,
+        }
+    }
+}
+
+impl StringChunk {
+    pub fn len(&self) -> usize {
+        self.offsets.len() - 1
+    }
+
+    /// The data buffer, which the next value is written to the end of.
+    pub fn data(&mut self) -> &mut Vec<u8> {
+        &mut self.data
+    }
+
+    /// Ends the value written to the data buffer since the last one, or appends a null if
+    /// `valid` is false, in which case nothing should have been written. Values must be UTF-8.
+    pub fn end_value(&mut self, valid: bool) {
+        let i = self.len();
+        self.offsets.push(self.data.len() as i64);
+        if i % 8 == 0 {
+            self.validity.push(0);
+        }
+        self.validity[i / 8] |= (valid as u8) << (i % 8);
+        self.null_count += !valid as usize;
+    }
+}
+
+/// A chunk handed to a consumer, kept alive until the consumer releases its array.
+struct ExportedChunk {
+    chunk: StringChunk,
+    buffers: [*const c_void; 3],
+}
+
+unsafe extern "C" fn release_array(array: *mut ArrowArray) {
+    let array = unsafe { &mut *array };
+    drop(unsafe { Box::from_raw(array.private_data as *mut ExportedChunk) });
+    array.release = None;
+}
+
+fn export_chunk(chunk: StringChunk) -> ArrowArray {
+    let length = chunk.len() as i64;
+    let null_count = chunk.null_count as i64;
+    let mut exported = Box::new(ExportedChunk {
+        chunk,
+        buffers: [ptr::null(); 3],
+    });
+    let chunk = &exported.chunk;
+    exported.buffers = [
+        if chunk.null_count > 0 {
+            chunk.validity.as_ptr() as *const c_void
+        } else {
+            ptr::null()
+        },
+        chunk.offsets.as_ptr() as *const c_void,
+        chunk.data.as_ptr() as *const c_void,
+    ];
+    let buffers = exported.buffers.as_mut_ptr();
+    ArrowArray {
+        length,
+        null_count,
+        offset: 0,
+        n_buffers: 3,
+        n_children: 0,
+        buffers,
+        children: ptr::null_mut(),
+        dictionary: ptr::null_mut(),
+        release: Some(release_array),
+        private_data: Box::into_raw(exported) as *mut c_void,
+    }
+}
+
+struct StreamState {
+    chunks: VecDeque<StringChunk>,
+}
+
+const LARGE_STRING_FORMAT: &CStr = c"U";
+
+unsafe extern "C" fn release_schema(schema: *mut ArrowSchema) {
+    let schema = unsafe { &mut *schema };
+    drop(unsafe { CString::from_raw(schema.name as *mut c_char) });
+    schema.release = None;
+}
+
+unsafe extern "C" fn stream_get_schema(
+    _stream: *mut ArrowArrayStream,
+    out: *mut ArrowSchema,
+) -> c_int {
+    let mut schema = ArrowSchema::empty();
+    schema.format = LARGE_STRING_FORMAT.as_ptr();
+    schema.name = CString::default().into_raw();
+    // Nullable.
+    schema.flags = 2;
+    schema.release = Some(release_schema);
+    unsafe { ptr::write(out, schema) };
+    0
+}
+
+unsafe extern "C" fn stream_get_next(stream: *mut ArrowArrayStream, out: *mut ArrowArray) -> c_int {
+    let state = unsafe { &mut *((*stream).private_data as *mut StreamState) };
+    let array = match state.chunks.pop_front() {
+        Some(chunk) => export_chunk(chunk),
+        // A released array marks the end of the stream.
+        None => ArrowArray::empty(),
+    };
+    unsafe { ptr::write(out, array) };
+    0
+}
+
+unsafe extern "C" fn stream_get_last_error(_stream: *mut ArrowArrayStream) -> *const c_char {
+    ptr::null()
+}
+
+unsafe extern "C" fn release_stream(stream: *mut ArrowArrayStream) {
+    let stream = unsafe { &mut *stream };
+    drop(unsafe { Box::from_raw(stream.private_data as *mut StreamState) });
+    stream.release = None;
+}
+
+/// A stream of large strings that yields each chunk in turn.
+pub fn export_stream(chunks: Vec<StringChunk>) -> ArrowArrayStream {
+    ArrowArrayStream {
+        get_schema: Some(stream_get_schema),
+        get_next: Some(stream_get_next),
+        get_last_error: Some(stream_get_last_error),
+        release: Some(release_stream),
+        private_data: Box::into_raw(Box::new(StreamState {
+            chunks: chunks.into(),
+        })) as *mut c_void,
+    }
+}
+
+/// Releases a stream if it hasn't been moved out by a consumer, which sets its release callback
+/// to null.
+///
+/// # Safety
+///
+/// `stream` must point to a valid Arrow C stream.
+pub unsafe fn release_stream_if_owned(stream: *mut ArrowArrayStream) {
+    if let Some(release) = unsafe { (*stream).release } {
+        unsafe { release(stream) };
+    }
+}
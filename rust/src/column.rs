@@ -0,0 +1,241 @@
+//! Ciphers applied to every row of a column of text.
+//!
+//! Each row is normalized to the letters A-Z as it's read and enciphered straight into the output
+//! column, so an ASCII row costs one pass over its bytes and no allocations. Rows are split into
+//! contiguous chunks across threads, and each thread builds its own chunk of the output.
+
+use std::borrow::Cow;
+
+use crate::arrow::StringChunk;
+use crate::normalize::normalize;
+use crate::parallel;
+use crate::playfair::{Alphabet, Square};
+use crate::vigenere;
+
+/// A key as it arrives from Python, before it's parsed for a cipher.
+#[derive(Clone, Copy)]
+pub enum RawKey<'a> {
+    Str(&'a [u8]),
+    Int(i64),
+}
+
+/// The key for each row: either one key for every row, or a key per row (`None` for a null key),
+/// which is parsed when the row is enciphered.
+pub enum RowKeys<'a, K> {
+    One(K),
+    PerRow(Vec<Option<RawKey<'a>>>),
+}
+
+impl<'a, K: Clone> RowKeys<'a, K> {
+    fn get(
+        &self,
+        row: usize,
+        parse: impl Fn(RawKey<'a>) -> Result<K, String>,
+    ) -> Result<Option<Cow<'_, K>>, String> {
+        match self {
+            RowKeys::One(key) => Ok(Some(Cow::Borrowed(key))),
+            RowKeys::PerRow(keys) => keys[row].map(|key| parse(key).map(Cow::Owned)).transpose(),
+        }
+    }
+}
+
+/// Builds the output column by calling `f` for each row with the buffer to append its value to.
+/// `f` returns false, without writing anything, for a null value. Errors are prefixed with the
+/// row they came from.
+fn map_rows(
+    n_rows: usize,
+    n_threads: usize,
+    f: impl Fn(usize, &mut Vec<u8>) -> Result<bool, String> + Sync,
+) -> Result<Vec<StringChunk>, String> {
+    let rows: Vec<usize> = (0..n_rows).collect();
+    parallel::map_chunks(&rows, n_threads, |rows| {
+        let mut chunk = StringChunk::default();
+        let result = rows.iter().try_for_each(|&row| {
+            let valid = f(row, chunk.data()).map_err(|e| format!("Row {row}: {e}"))?;
+            chunk.end_value(valid);
+            Ok(())
+        });
+        vec![result.map(|_| chunk)]
+    })
+    .into_iter()
+    .collect()
+}
+
+/// Normalizes each row to the letters A-Z.
+pub fn normalize_column(
+    texts: &[Option<&[u8]>],
+    n_threads: usize,
+) -> Result<Vec<StringChunk>, String> {
+    map_rows(texts.len(), n_threads, |row, out| {
+        let Some(text) = texts[row] else {
+            return Ok(false);
+        };
+        normalize(text, out);
+        Ok(true)
+    })
+}
+
+/// The number of shifts a key is repeated to, so that rows are shifted a block at a time.
+const SHIFT_BLOCK: usize = 64;
+
+/// Parses a Vigenère key of letters A-Z, or a Caesar shift, into shifts 0-25, which are the
+/// shifts back if `decrypt`. The shifts are repeated a whole number of times to at least
+/// `SHIFT_BLOCK` of them.
+pub fn shift_key(key: RawKey<'_>, decrypt: bool) -> Result<Vec<u8>, String> {
+    let shifts = match key {
+        RawKey::Str(key) => vigenere::to_shifts(&String::from_utf8_lossy(key))?,
+        RawKey::Int(shift) => vec![shift.rem_euclid(26) as u8],
+    };
+    let n_repeats = SHIFT_BLOCK.div_ceil(shifts.len());
+    Ok(shifts
+        .iter()
+        .map(|&s| if decrypt { (26 - s) % 26 } else { s })
+        .cycle()
+        .take(shifts.len() * n_repeats)
+        .collect())
+}
+
+/// Shifts the letters of each row by a key of shifts from `shift_key`, repeated as needed (a
+/// Vigenère cipher, or a Caesar cipher for a key of one shift).
+pub fn shift_column(
+    texts: &[Option<&[u8]>],
+    keys: &RowKeys<'_, Vec<u8>>,
+    decrypt: bool,
+    n_threads: usize,
+) -> Result<Vec<StringChunk>, String> {
+    map_rows(texts.len(), n_threads, |row, out| {
+        let shifts = keys.get(row, |key| shift_key(key, decrypt))?;
+        let (Some(text), Some(shifts)) = (texts[row], shifts) else {
+            return Ok(false);
+        };
+        // First write the letter codes 0-25. ASCII rows write every byte but only keep letters,
+        // which avoids a branch per byte. Then shift whole blocks of letters, which vectorizes.
+        let start = out.len();
+        if text.is_ascii() {
+            out.reserve(text.len());
+            let spare = &mut out.spare_capacity_mut()[..text.len()];
+            let mut n = 0;
+            for &c in text {
+                let x = (c | 0x20).wrapping_sub(b'a');
+                spare[n].write(x);
+                n += (x < 26) as usize;
+            }
+            // Safety: the first n bytes of the spare capacity were written above.
+            unsafe { out.set_len(start + n) };
+        } else {
+            normalize(text, out);
+            out[start..].iter_mut().for_each(|c| *c -= b'A');
+        }
+        for block in out[start..].chunks_mut(shifts.len()) {
+            for (x, &shift) in block.iter_mut().zip(shifts.iter()) {
+                let y = *x + shift;
+                *x = b'A' + if y >= 26 { y - 26 } else { y };
+            }
+        }
+        Ok(true)
+    })
+}
+
+/// The rules of a Playfair cipher: the 25 letter alphabet, the letter replaced to fit it, and
+/// the letters used to break up repeated letters.
+pub struct Playfair {
+    pub alphabet: Alphabet,
+    pub missing: u8,
+    pub replacement: u8,
+    pub fill: u8,
+    pub alt_fill: u8,
+}
+
+impl Playfair {
+    /// Parses a key of letters A-Z into a key square.
+    pub fn key(&self, key: RawKey<'_>) -> Result<Square, String> {
+        match key {
+            RawKey::Str(key) => Square::from_key(key, &self.alphabet),
+            RawKey::Int(key) => Err(format!("Playfair keys must be strings, got {key}")),
+        }
+    }
+
+    fn index(&self, c: u8) -> Result<u8, String> {
+        self.alphabet
+            .index(c)
+            .ok_or_else(|| format!("Character {} is not in the alphabet", c as char))
+    }
+
+    /// Appends the alphabet indices of the digraphs of the normalized `letters` to `out`, adding
+    /// a fill letter after the first of a repeated pair of letters and at the end if needed.
+    fn digraphs(&self, letters: &[u8], out: &mut Vec<u8>) -> Result<(), String> {
+        let fill = |c: u8| {
+            if c != self.fill {
+                self.fill
+            } else {
+                self.alt_fill
+            }
+        };
+        let mut letters = letters
+            .iter()
+            .map(|&c| {
+                if c == self.missing {
+                    self.replacement
+                } else {
+                    c
+                }
+            })
+            .peekable();
+        while let Some(c1) = letters.next() {
+            let c2 = match letters.peek() {
+                Some(&c2) if c2 != c1 => {
+                    letters.next();
+                    c2
+                }
+                _ => fill(c1),
+            };
+            out.push(self.index(c1)?);
+            out.push(self.index(c2)?);
+        }
+        Ok(())
+    }
+
+    /// Encrypts each row with its key square, or decrypts it if `decrypt`. Decryption fails on
+    /// rows of an odd number of letters, and both fail on repeated letter digraphs.
+    pub fn apply_column(
+        &self,
+        texts: &[Option<&[u8]>],
+        keys: &RowKeys<'_, Square>,
+        decrypt: bool,
+        n_threads: usize,
+    ) -> Result<Vec<StringChunk>, String> {
+        map_rows(texts.len(), n_threads, |row, out| {
+            let (Some(text), Some(square)) = (texts[row], keys.get(row, |key| self.key(key))?)
+            else {
+                return Ok(false);
+            };
+            let mut letters = Vec::with_capacity(text.len());
+            normalize(text, &mut letters);
+            let mut digraphs = Vec::with_capacity(letters.len() + 1);
+            if decrypt {
+                for &c in &letters {
+                    digraphs.push(self.index(c)?);
+                }
+                if digraphs.len() % 2 != 0 {
+                    return Err("Requires even length ciphertext".to_string());
+                }
+            } else {
+                self.digraphs(&letters, &mut digraphs)?;
+            }
+            if let Some(pair) = digraphs.chunks_exact(2).find(|pair| pair[0] == pair[1]) {
+                let letter = self.alphabet.letter(pair[0]) as char;
+                return Err(format!(
+                    "No repeated letter bigrams allowed: {letter}{letter}"
+                ));
+            }
+            let start = out.len();
+            if decrypt {
+                out.resize(start + digraphs.len(), 0);
+                square.decrypt_into(&digraphs, &self.alphabet, &mut out[start..]);
+            } else {
+                square.encrypt_into(&digraphs, &self.alphabet, out);
+            }
+            Ok(true)
+        })
+    }
+}
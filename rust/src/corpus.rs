@@ -0,0 +1,139 @@
+//! Counting n-grams and words in a corpus that arrives in chunks.
+//!
+//! The counts for every n up to `max_n` are updated in one pass over each chunk. The state that
+//! spans chunk boundaries (the last few letters and any unfinished word) is kept between chunks,
+//! so splitting a corpus into chunks doesn't change the counts.
+
+use std::collections::HashMap;
+
+use crate::ngram::{MAX_DENSE_N, MAX_N, letter_code};
+use crate::normalize::to_ascii;
+
+enum Counts {
+    Dense(Vec<u64>),
+    Sparse(HashMap<u64, u64>),
+}
+
+pub struct CorpusCounts {
+    max_n: usize,
+    /// The counts for each n, indexed by n - 1.
+    ngrams: Vec<Counts>,
+    /// 26^n for each n from 0, indexed by n.
+    moduli: Vec<u64>,
+    /// The code of the last `max_n` letters, and how many letters have been seen.
+    recent: u64,
+    n_letters: u64,
+    /// Word counts, if words are being counted.
+    words: Option<HashMap<Vec<u8>, u64>>,
+    word: Vec<u8>,
+}
+
+impl CorpusCounts {
+    pub fn new(max_n: usize, count_words: bool) -> Result<CorpusCounts, String> {
+        if max_n == 0 || max_n > MAX_N {
+            return Err(format!("max_n must be from 1 to {MAX_N}, got {max_n}"));
+        }
+        let ngrams = (1..=max_n)
+            .map(|n| {
+                if n <= MAX_DENSE_N {
+                    Counts::Dense(vec![0; 26usize.pow(n as u32)])
+                } else {
+                    Counts::Sparse(HashMap::new())
+                }
+            })
+            .collect();
+        Ok(CorpusCounts {
+            max_n,
+            ngrams,
+            moduli: (0..=max_n).map(|n| 26u64.pow(n as u32)).collect(),
+            recent: 0,
+            n_letters: 0,
+            words: count_words.then(HashMap::new),
+            word: Vec::new(),
+        })
+    }
+
+    pub fn n_letters(&self) -> u64 {
+        self.n_letters
+    }
+
+    /// Counts a chunk of UTF-8 text, after replacing each non-ASCII character by the ASCII
+    /// characters of its NFKD form. Letters of either case are counted and everything else is
+    /// skipped, so n-grams span spaces and punctuation. Words are separated by whitespace.
+    pub fn update(&mut self, text: &[u8]) {
+        if text.is_ascii() {
+            self.update_ascii(text);
+        } else {
+            let mut ascii = Vec::with_capacity(text.len());
+            to_ascii(text, &mut ascii);
+            self.update_ascii(&ascii);
+        }
+    }
+
+    fn update_ascii(&mut self, text: &[u8]) {
+        for &c in text {
+            let c = c.to_ascii_uppercase();
+            if let Some(x) = letter_code(c) {
+                self.n_letters += 1;
+                // The oldest letter is dropped before shifting, so the code never exceeds 26^max_n
+                // and can't overflow.
+                self.recent = self.recent % self.moduli[self.max_n - 1] * 26 + x;
+                let max_n = self.max_n.min(self.n_letters as usize);
+                for (counts, modulus) in self.ngrams[..max_n].iter_mut().zip(&self.moduli[1..]) {
+                    let code = self.recent % modulus;
+                    match counts {
+                        Counts::Dense(counts) => counts[code as usize] += 1,
+                        Counts::Sparse(counts) => *counts.entry(code).or_insert(0) += 1,
+                    }
+                }
+                if self.words.is_some() {
+                    self.word.push(c);
+                }
+            } else if c.is_ascii_whitespace() {
+                self.end_word();
+            }
+        }
+    }
+
+    fn end_word(&mut self) {
+        if let Some(words) = &mut self.words
+            && !self.word.is_empty()
+        {
+            match words.get_mut(&self.word) {
+                Some(count) => *count += 1,
+                None => {
+                    words.insert(self.word.clone(), 1);
+                }
+            }
+            self.word.clear();
+        }
+    }
+
+    /// The (code, count) of every `n`-gram seen.
+    pub fn ngram_counts(&self, n: usize) -> Result<Vec<(u64, u64)>, String> {
+        if n == 0 || n > self.max_n {
+            return Err(format!("n must be from 1 to {}, got {n}", self.max_n));
+        }
+        Ok(match &self.ngrams[n - 1] {
+            Counts::Dense(counts) => counts
+                .iter()
+                .enumerate()
+                .filter(|&(_, &count)| count > 0)
+                .map(|(code, &count)| (code as u64, count))
+                .collect(),
+            Counts::Sparse(counts) => counts.iter().map(|(&code, &count)| (code, count)).collect(),
+        })
+    }
+
+    /// The count of every word seen, including a word at the end of the text so far. Returns
+    /// `None` if words aren't being counted.
+    pub fn word_counts(&self) -> Option<HashMap<&[u8], u64>> {
+        let words = self.words.as_ref()?;
+        let mut counts: HashMap<&[u8], u64> =
+            words.iter().map(|(w, &c)| (w.as_slice(), c)).collect();
+        if !self.word.is_empty() {
+            *counts.entry(self.word.as_slice()).or_insert(0) += 1;
+        }
+        Some(counts)
+    }
+}
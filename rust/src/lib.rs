@@ -1,38 +1,771 @@
-use pyo3::exceptions::PyValueError;
+use pyo3::exceptions::{PyIndexError, PyValueError};
+use pyo3::ffi;
 use pyo3::prelude::*;
 use std::collections::HashMap;
-use std::f64::INFINITY;
+use std::ffi::{CStr, c_void};
+use std::sync::Arc;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::time::{Duration, Instant};
+
+mod arrow;
+mod column;
+mod corpus;
+mod fold_table;
+mod mmap;
+mod ngram;
+mod ngram_file;
+mod normalize;
+mod parallel;
+mod playfair;
+mod segment;
+mod session;
+mod stats;
+mod topk;
+mod vigenere;
+mod word_index;
+
+use ngram::{Fitness, LogProbTable, NGramTable, ngram_string, with_scratch};
 
 #[pyfunction]
-fn bd_score(text: &str, n: usize, dist: &Dist) -> f64 {
-    if text.len() < n {
-        return INFINITY;
+fn bd_score(text: &str, n: usize, dist: &Dist) -> PyResult<f64> {
+    dist.check_n(n)?;
+    stats::record(1, text.len());
+    Ok(with_scratch(|scratch| {
+        dist.table.bd_score(text.as_bytes(), scratch)
+    }))
+}
+
+/// Scores many texts in a single call, avoiding a round trip through Python per text. The GIL is
+/// released while scoring, which is split across `n_jobs` threads (-1 for all cores).
+#[pyfunction]
+#[pyo3(signature = (texts, n, dist, n_jobs=1))]
+fn bd_score_batch(
+    py: Python<'_>,
+    texts: Vec<String>,
+    n: usize,
+    dist: &Dist,
+    n_jobs: i64,
+) -> PyResult<Vec<f64>> {
+    dist.check_n(n)?;
+    let scores = py.detach(|| {
+        parallel::map_chunks(&texts, parallel::n_threads(n_jobs), |chunk| {
+            with_scratch(|scratch| {
+                chunk
+                    .iter()
+                    .map(|text| dist.table.bd_score(text.as_bytes(), scratch))
+                    .collect()
+            })
+        })
+    });
+    record_texts(&texts);
+    Ok(scores)
+}
+
+/// Records scoring each of `texts` in the calling thread's counts.
+fn record_texts(texts: &[String]) {
+    stats::record(texts.len(), texts.iter().map(String::len).sum());
+}
+
+#[pyfunction]
+fn log_prob_score(text: &str, dist: &LogProbDist) -> f64 {
+    stats::record(1, text.len());
+    dist.table.score(text.as_bytes())
+}
+
+/// Scores many texts by n-gram log probability, split across `n_jobs` threads with the GIL
+/// released.
+#[pyfunction]
+#[pyo3(signature = (texts, dist, n_jobs=1))]
+fn log_prob_score_batch(
+    py: Python<'_>,
+    texts: Vec<String>,
+    dist: &LogProbDist,
+    n_jobs: i64,
+) -> Vec<f64> {
+    let scores = py.detach(|| {
+        parallel::map_chunks(&texts, parallel::n_threads(n_jobs), |chunk| {
+            chunk
+                .iter()
+                .map(|text| dist.table.score(text.as_bytes()))
+                .collect()
+        })
+    });
+    record_texts(&texts);
+    scores
+}
+
+/// Decrypts a Vigenère ciphertext with each key and scores the plaintexts against `dist`,
+/// without building a Python string per key. Keys are split across `n_jobs` threads.
+#[pyfunction]
+#[pyo3(signature = (ciphertext, keys, dist, n_jobs=1))]
+fn vigenere_score_keys(
+    py: Python<'_>,
+    ciphertext: &[u8],
+    keys: Vec<String>,
+    dist: AnyDist<'_>,
+    n_jobs: i64,
+) -> PyResult<Vec<f64>> {
+    let fitness = dist.fitness();
+    if !ciphertext.iter().all(|c| c.is_ascii_uppercase()) {
+        return Err(PyValueError::new_err(
+            "Ciphertext must be normalized to the letters A-Z",
+        ));
     }
+    let keys = keys
+        .iter()
+        .map(|key| vigenere::to_shifts(key))
+        .collect::<Result<Vec<_>, _>>()
+        .map_err(PyValueError::new_err)?;
+    let scores = py.detach(|| {
+        parallel::map_chunks(&keys, parallel::n_threads(n_jobs), |chunk| {
+            with_scratch(|scratch| {
+                vigenere::score_keys(ciphertext, chunk, |text| fitness.score(text, scratch))
+            })
+        })
+    });
+    stats::record(keys.len(), keys.len() * ciphertext.len());
+    Ok(scores)
+}
 
-    let mut counts: HashMap<String, usize> = HashMap::new();
-    for i in 0..=(text.len() - n) {
-        let ngram = text[i..i + n].to_string();
-        if dist.dist.contains_key(&ngram) {
-            counts.entry(ngram).and_modify(|v| *v += 1).or_insert(1);
+/// Searches for Playfair keys by simulated annealing, scoring decrypts against `dist`. Returns
+/// the best key and its score from each restart. Restarts are split across `n_jobs` threads.
+/// After `time_limit` seconds, or once `cancel` is cancelled, every restart stops with its best key
+/// so far, which may be its starting square.
+#[pyfunction]
+#[pyo3(signature = (ciphertext, alphabet, dist, n_restarts, n_iters, temperature, seed, n_jobs=1, time_limit=None, cancel=None))]
+fn playfair_anneal(
+    py: Python<'_>,
+    ciphertext: &str,
+    alphabet: &str,
+    dist: AnyDist<'_>,
+    n_restarts: usize,
+    n_iters: usize,
+    temperature: f64,
+    seed: u64,
+    n_jobs: i64,
+    time_limit: Option<f64>,
+    cancel: Option<PyRef<'_, CancelToken>>,
+) -> PyResult<Vec<(String, f64)>> {
+    let fitness = dist.fitness();
+    let alphabet = playfair::Alphabet::new(alphabet).map_err(PyValueError::new_err)?;
+    let ciphertext = alphabet
+        .encode(ciphertext.as_bytes())
+        .map_err(PyValueError::new_err)?;
+    if ciphertext.len() % 2 != 0 {
+        return Err(PyValueError::new_err("Requires even length ciphertext"));
+    }
+    let start = Instant::now();
+    let params = playfair::SearchParams {
+        n_iters,
+        temperature,
+        seed,
+        // A limit too large for a Duration is no limit.
+        deadline: time_limit
+            .and_then(|limit| start.checked_add(Duration::try_from_secs_f64(limit.max(0.0)).ok()?)),
+        cancel: cancel.map(|cancel| cancel.flag.clone()),
+    };
+    let restarts: Vec<usize> = (0..n_restarts).collect();
+    let results = py.detach(|| {
+        parallel::map_chunks(&restarts, parallel::n_threads(n_jobs), |chunk| {
+            with_scratch(|scratch| {
+                chunk
+                    .iter()
+                    .map(|&restart| {
+                        playfair::anneal(&ciphertext, &alphabet, &params, restart, |text| {
+                            fitness.score(text, scratch)
+                        })
+                    })
+                    .collect()
+            })
+        })
+    });
+    let n_candidates: usize = results.iter().map(|result| result.n_evaluated).sum();
+    stats::record(n_candidates, n_candidates * ciphertext.len());
+    Ok(results
+        .iter()
+        .map(|result| (result.square.to_key(&alphabet), result.score))
+        .collect())
+}
+
+#[pyclass(frozen)]
+struct Dist {
+    table: NGramTable,
+}
+
+impl Dist {
+    fn check_n(&self, n: usize) -> PyResult<()> {
+        if n != self.table.n {
+            return Err(PyValueError::new_err(format!(
+                "Distribution is for {}-grams, not {}-grams",
+                self.table.n, n
+            )));
         }
+        Ok(())
     }
-    let total: usize = counts.values().sum();
-    let mut result = 0.0;
-    for (k, c) in counts.iter() {
-        let term: f64 = (*c as f64) * dist.dist.get(k).unwrap();
-        result += (term / total as f64).sqrt()
+}
+
+#[pymethods]
+impl Dist {
+    #[getter]
+    fn n(&self) -> usize {
+        self.table.n
+    }
+
+    /// The distribution as a dict of n-gram probabilities, e.g. for exporting to JSON.
+    fn to_dict(&self) -> HashMap<String, f64> {
+        self.table
+            .entries()
+            .into_iter()
+            .map(|(code, p)| (ngram_string(code, self.table.n), p))
+            .collect()
+    }
+
+    /// Writes the distribution to a binary n-gram file, which `load_dist` maps. `dtype` is
+    /// "float64" or "float32", which halves the file size at the cost of precision.
+    #[pyo3(signature = (path, dtype="float64"))]
+    fn write(&self, path: &str, dtype: &str) -> PyResult<()> {
+        let dtype = ngram_file::DType::parse(dtype).map_err(PyValueError::new_err)?;
+        Ok(self.table.write(path, dtype)?)
+    }
+}
+
+/// Maps a distribution from a binary n-gram file written by `Dist.write`. Loading takes the same
+/// time however big the table is, and the pages are shared between processes.
+#[pyfunction]
+fn load_dist(path: &str) -> PyResult<Dist> {
+    Ok(Dist {
+        table: NGramTable::open(path)?,
+    })
+}
+
+/// A distribution of n-gram log probabilities.
+#[pyclass(frozen)]
+struct LogProbDist {
+    table: LogProbTable,
+    #[pyo3(get)]
+    floor: f64,
+}
+
+#[pymethods]
+impl LogProbDist {
+    #[getter]
+    fn n(&self) -> usize {
+        self.table.table.n
     }
-    return -result.ln();
 }
 
+/// N-gram probabilities, either as a dict or a native distribution.
+#[derive(FromPyObject)]
+enum Probs<'py> {
+    Dist(PyRef<'py, Dist>),
+    Map(HashMap<String, f64>),
+}
+
+/// Any native n-gram distribution, for kernels that work with either scoring method.
+#[derive(FromPyObject)]
+enum AnyDist<'py> {
+    Bhattacharyya(PyRef<'py, Dist>),
+    LogProb(PyRef<'py, LogProbDist>),
+}
+
+impl AnyDist<'_> {
+    fn fitness(&self) -> Fitness<'_> {
+        match self {
+            AnyDist::Bhattacharyya(dist) => Fitness::Bhattacharyya(&dist.table),
+            AnyDist::LogProb(dist) => Fitness::LogProb(&dist.table),
+        }
+    }
+}
+
+/// The score of a text against an n-gram distribution, kept up to date as letters in the text
+/// change. Each change only rescores the n-grams that overlap it, rather than the whole text.
 #[pyclass]
-struct Dist {
-    dist: HashMap<String, f64>,
+struct ScoreSession {
+    state: session::ScoreState,
+    dist: SessionDist,
+}
+
+enum SessionDist {
+    Bhattacharyya(Py<Dist>),
+    LogProb(Py<LogProbDist>),
+}
+
+impl SessionDist {
+    fn fitness(&self) -> Fitness<'_> {
+        match self {
+            SessionDist::Bhattacharyya(dist) => Fitness::Bhattacharyya(&dist.get().table),
+            SessionDist::LogProb(dist) => Fitness::LogProb(&dist.get().table),
+        }
+    }
+}
+
+#[pymethods]
+impl ScoreSession {
+    #[new]
+    fn new(text: &str, dist: AnyDist<'_>) -> PyResult<ScoreSession> {
+        let state = session::ScoreState::new(text.as_bytes(), dist.fitness())
+            .map_err(PyValueError::new_err)?;
+        let dist = match dist {
+            AnyDist::Bhattacharyya(dist) => SessionDist::Bhattacharyya(dist.into()),
+            AnyDist::LogProb(dist) => SessionDist::LogProb(dist.into()),
+        };
+        Ok(ScoreSession { state, dist })
+    }
+
+    #[getter]
+    fn score(&self) -> f64 {
+        self.state.score(self.dist.fitness())
+    }
+
+    #[getter]
+    fn text(&self) -> String {
+        String::from_utf8_lossy(self.state.text()).into_owned()
+    }
+
+    /// Sets the letter at each (position, letter) pair in `diff` and returns the new score.
+    fn apply(&mut self, diff: Vec<(usize, char)>) -> PyResult<f64> {
+        let diff = diff
+            .into_iter()
+            .map(|(pos, c)| {
+                if c.is_ascii() {
+                    Ok((pos, c as u8))
+                } else {
+                    Err(format!("{c} is not a letter A-Z"))
+                }
+            })
+            .collect::<Result<Vec<_>, _>>()
+            .map_err(PyValueError::new_err)?;
+        stats::record(1, diff.len());
+        self.state
+            .apply(&diff, self.dist.fitness())
+            .map_err(PyValueError::new_err)
+    }
+}
+
+/// Converts probabilities to log probabilities. N-grams rarer than `floor` are given its log
+/// probability, and `floor` defaults to a hundredth of the probability of the rarest n-gram.
+#[pyfunction]
+#[pyo3(signature = (dist, floor=None))]
+fn to_log_prob_dist(dist: Probs<'_>, floor: Option<f64>) -> PyResult<LogProbDist> {
+    let (n, entries) = match dist {
+        Probs::Dist(dist) => (dist.table.n, dist.table.entries()),
+        Probs::Map(dist) => ngram::parse_map(&dist).map_err(PyValueError::new_err)?,
+    };
+    let floor = floor.unwrap_or_else(|| {
+        entries
+            .iter()
+            .map(|&(_, p)| p)
+            .fold(f64::INFINITY, f64::min)
+            / 100.0
+    });
+    let table = LogProbTable::from_entries(n, entries, floor).map_err(PyValueError::new_err)?;
+    Ok(LogProbDist { table, floor })
 }
 
 #[pyfunction]
 fn to_dist(dist: HashMap<String, f64>) -> PyResult<Dist> {
-    Ok(Dist { dist: dist })
+    let table = NGramTable::from_map(&dist).map_err(PyValueError::new_err)?;
+    Ok(Dist { table })
+}
+
+/// Counts n-grams for every n up to `max_n`, and optionally words, in a corpus that is fed in
+/// chunks. Memory use is bounded by the number of distinct n-grams and words, not the size of the
+/// corpus.
+#[pyclass]
+struct CorpusCounter {
+    counts: corpus::CorpusCounts,
+}
+
+#[pymethods]
+impl CorpusCounter {
+    #[new]
+    #[pyo3(signature = (max_n, count_words=true))]
+    fn new(max_n: usize, count_words: bool) -> PyResult<CorpusCounter> {
+        let counts =
+            corpus::CorpusCounts::new(max_n, count_words).map_err(PyValueError::new_err)?;
+        Ok(CorpusCounter { counts })
+    }
+
+    #[getter]
+    fn n_letters(&self) -> u64 {
+        self.counts.n_letters()
+    }
+
+    /// Counts the next chunk of UTF-8 text, with the GIL released. Text is converted to ASCII as
+    /// in `normalize_string`. Letters of either case are counted, n-grams span anything else, and
+    /// words are separated by whitespace.
+    fn update(&mut self, py: Python<'_>, text: &[u8]) {
+        let counts = &mut self.counts;
+        py.detach(|| counts.update(text));
+    }
+
+    /// The distribution of the `n`-grams counted so far.
+    fn ngram_dist(&self, n: usize) -> PyResult<Dist> {
+        let counts = self.counts.ngram_counts(n).map_err(PyValueError::new_err)?;
+        let total: u64 = counts.iter().map(|&(_, count)| count).sum();
+        let probs = counts
+            .into_iter()
+            .map(|(code, count)| (code, count as f64 / total as f64));
+        Ok(Dist {
+            table: NGramTable::from_entries(n, probs, f64::NAN),
+        })
+    }
+
+    /// The count of each word seen so far.
+    fn word_counts(&self) -> PyResult<HashMap<String, u64>> {
+        let counts = self
+            .counts
+            .word_counts()
+            .ok_or_else(|| PyValueError::new_err("Words are not being counted"))?;
+        Ok(counts
+            .into_iter()
+            .map(|(word, count)| (String::from_utf8_lossy(word).into_owned(), count))
+            .collect())
+    }
+}
+
+/// A compact, immutable dictionary of words and their probabilities, for segmenting text into
+/// words. Probabilities are normalized to sum to one.
+#[pyclass(frozen)]
+struct WordIndex {
+    index: word_index::WordIndex,
+}
+
+#[pymethods]
+impl WordIndex {
+    #[new]
+    fn new(py: Python<'_>, words: HashMap<String, f64>) -> WordIndex {
+        WordIndex {
+            index: py.detach(|| word_index::WordIndex::new(words)),
+        }
+    }
+
+    fn __len__(&self) -> usize {
+        self.index.n_words()
+    }
+
+    /// Returns the end and log probability of every word that starts at character `start` of
+    /// `text`, shortest first.
+    #[pyo3(signature = (text, start=0))]
+    fn prefixes(&self, text: &str, start: usize) -> PyResult<Vec<(usize, f64)>> {
+        let byte_start = text
+            .char_indices()
+            .map(|(i, _)| i)
+            .chain([text.len()])
+            .nth(start)
+            .ok_or_else(|| PyIndexError::new_err(format!("start {start} is out of range")))?;
+        let mut matches = Vec::new();
+        let (mut pos, mut end_char) = (byte_start, start);
+        self.index
+            .for_each_match(text.as_bytes(), byte_start, |end, log_prob| {
+                end_char += text[pos..end].chars().count();
+                pos = end;
+                matches.push((end_char, log_prob));
+            });
+        Ok(matches)
+    }
+
+    /// The words and their probabilities.
+    fn to_dict(&self) -> HashMap<String, f64> {
+        self.index
+            .words()
+            .into_iter()
+            .map(|(word, log_prob)| (word, log_prob.exp()))
+            .collect()
+    }
+
+    /// Writes the index to a file, which `load_word_index` reads without rebuilding it.
+    fn write(&self, path: &str) -> PyResult<()> {
+        Ok(self.index.write(path)?)
+    }
+
+    /// Returns the `k` best segmentations of `text` into words as (text, score) pairs, best
+    /// first, or all of them if `k` is None. The number of segmentations, and so the time taken
+    /// for all of them, can grow exponentially with the length of the text. The GIL is released
+    /// while segmenting.
+    #[pyo3(signature = (text, length_power=1.0, k=None))]
+    fn segment(
+        &self,
+        py: Python<'_>,
+        text: &str,
+        length_power: f64,
+        k: Option<usize>,
+    ) -> Vec<(String, f64)> {
+        let results = py.detach(|| {
+            segment::segment(
+                &self.index,
+                text.as_bytes(),
+                length_power,
+                k.unwrap_or(usize::MAX),
+            )
+        });
+        results
+            .into_iter()
+            .map(|(score, ends)| {
+                let mut start = 0;
+                let words: Vec<&str> = ends
+                    .iter()
+                    .map(|&end| {
+                        let word = &text[start..end];
+                        start = end;
+                        word
+                    })
+                    .collect();
+                (words.join(" "), score)
+            })
+            .collect()
+    }
+}
+
+#[pyfunction]
+fn load_word_index(py: Python<'_>, path: &str) -> PyResult<WordIndex> {
+    let index = py.detach(|| word_index::WordIndex::read(path))?;
+    Ok(WordIndex { index })
+}
+
+const ARROW_STREAM_CAPSULE: &CStr = c"arrow_array_stream";
+
+/// Reads a column from any object that exports an Arrow C stream, such as a polars Series or a
+/// pyarrow array.
+fn import_column(column: &Bound<'_, PyAny>) -> PyResult<arrow::ImportedColumn> {
+    let py = column.py();
+    let capsule = column.call_method0("__arrow_c_stream__")?;
+    let stream =
+        unsafe { ffi::PyCapsule_GetPointer(capsule.as_ptr(), ARROW_STREAM_CAPSULE.as_ptr()) }
+            as *mut arrow::ArrowArrayStream;
+    if stream.is_null() {
+        return Err(PyErr::fetch(py));
+    }
+    unsafe { arrow::import_stream(stream) }.map_err(PyValueError::new_err)
+}
+
+unsafe extern "C" fn drop_stream_capsule(capsule: *mut ffi::PyObject) {
+    let stream = unsafe { ffi::PyCapsule_GetPointer(capsule, ARROW_STREAM_CAPSULE.as_ptr()) }
+        as *mut arrow::ArrowArrayStream;
+    if !stream.is_null() {
+        unsafe {
+            arrow::release_stream_if_owned(stream);
+            drop(Box::from_raw(stream));
+        }
+    }
+}
+
+/// A column of strings computed natively, which is exported once through the Arrow C stream
+/// interface, e.g. by passing it to `polars.Series`.
+#[pyclass]
+struct StringColumn {
+    chunks: Option<Vec<arrow::StringChunk>>,
+}
+
+#[pymethods]
+impl StringColumn {
+    fn __len__(&self) -> usize {
+        self.chunks
+            .as_ref()
+            .map_or(0, |chunks| chunks.iter().map(|chunk| chunk.len()).sum())
+    }
+
+    #[pyo3(signature = (requested_schema=None))]
+    fn __arrow_c_stream__(
+        &mut self,
+        py: Python<'_>,
+        requested_schema: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<Py<PyAny>> {
+        let _ = requested_schema;
+        let chunks = self
+            .chunks
+            .take()
+            .ok_or_else(|| PyValueError::new_err("The column has already been exported"))?;
+        let stream = Box::into_raw(Box::new(arrow::export_stream(chunks)));
+        unsafe {
+            let capsule = ffi::PyCapsule_New(
+                stream as *mut c_void,
+                ARROW_STREAM_CAPSULE.as_ptr(),
+                Some(drop_stream_capsule),
+            );
+            if capsule.is_null() {
+                arrow::release_stream_if_owned(stream);
+                drop(Box::from_raw(stream));
+            }
+            Py::from_owned_ptr_or_err(py, capsule)
+        }
+    }
+}
+
+/// The keys for a column: one key for every row, or a column with a key for each row.
+#[derive(FromPyObject)]
+enum ColumnKeys<'py> {
+    Key(String),
+    Shift(i64),
+    Column(Bound<'py, PyAny>),
+}
+
+/// Reads per-row keys, which are strings or integers, checking there is one for each text.
+fn import_keys(keys: &Bound<'_, PyAny>, n_texts: usize) -> PyResult<arrow::ImportedColumn> {
+    let keys = import_column(keys)?;
+    if keys.len() != n_texts {
+        return Err(PyValueError::new_err(format!(
+            "Expected {n_texts} keys, got {}",
+            keys.len()
+        )));
+    }
+    Ok(keys)
+}
+
+fn raw_keys(keys: &arrow::ImportedColumn) -> PyResult<Vec<Option<column::RawKey<'_>>>> {
+    match keys.strings() {
+        Ok(keys) => Ok(keys
+            .into_iter()
+            .map(|key| key.map(column::RawKey::Str))
+            .collect()),
+        Err(_) => Ok(keys
+            .ints()
+            .map_err(PyValueError::new_err)?
+            .into_iter()
+            .map(|key| key.map(column::RawKey::Int))
+            .collect()),
+    }
+}
+
+/// Normalizes text to the letters A-Z: each character is replaced by the ASCII characters of its
+/// NFKD form, which are upper cased, and everything but letters is dropped.
+#[pyfunction]
+fn normalize_string(text: &str) -> String {
+    let mut out = Vec::with_capacity(text.len());
+    normalize::normalize(text.as_bytes(), &mut out);
+    String::from_utf8(out).expect("normalized text is ASCII")
+}
+
+/// Normalizes many texts in a single call. The GIL is released while normalizing, which is split
+/// across `n_jobs` threads.
+#[pyfunction]
+#[pyo3(signature = (texts, n_jobs=1))]
+fn normalize_strings(py: Python<'_>, texts: Vec<String>, n_jobs: i64) -> Vec<String> {
+    py.detach(|| {
+        parallel::map_chunks(&texts, parallel::n_threads(n_jobs), |chunk| {
+            chunk
+                .iter()
+                .map(|text| {
+                    let mut out = Vec::with_capacity(text.len());
+                    normalize::normalize(text.as_bytes(), &mut out);
+                    String::from_utf8(out).expect("normalized text is ASCII")
+                })
+                .collect()
+        })
+    })
+}
+
+/// Normalizes every text in a column. Null texts stay null.
+#[pyfunction]
+#[pyo3(signature = (texts, n_jobs=1))]
+fn normalize_column(
+    py: Python<'_>,
+    texts: &Bound<'_, PyAny>,
+    n_jobs: i64,
+) -> PyResult<StringColumn> {
+    let texts = import_column(texts)?;
+    let text_values = texts.strings().map_err(PyValueError::new_err)?;
+    let chunks = py
+        .detach(|| column::normalize_column(&text_values, parallel::n_threads(n_jobs)))
+        .map_err(PyValueError::new_err)?;
+    Ok(StringColumn {
+        chunks: Some(chunks),
+    })
+}
+
+/// Shifts the letters of every text in a column by a Vigenère key or Caesar shift, or by the key
+/// for each row given as a column. Texts are normalized to A-Z as in `normalize_string`. Null
+/// texts and keys give nulls. The GIL is released while shifting, which is split across `n_jobs`
+/// threads.
+#[pyfunction]
+#[pyo3(signature = (texts, keys, decrypt, n_jobs=1))]
+fn shift_column(
+    py: Python<'_>,
+    texts: &Bound<'_, PyAny>,
+    keys: ColumnKeys<'_>,
+    decrypt: bool,
+    n_jobs: i64,
+) -> PyResult<StringColumn> {
+    let texts = import_column(texts)?;
+    let text_values = texts.strings().map_err(PyValueError::new_err)?;
+    let key_column;
+    let keys = match keys {
+        ColumnKeys::Key(key) => column::RowKeys::One(
+            column::shift_key(column::RawKey::Str(key.as_bytes()), decrypt)
+                .map_err(PyValueError::new_err)?,
+        ),
+        ColumnKeys::Shift(shift) => column::RowKeys::One(
+            column::shift_key(column::RawKey::Int(shift), decrypt)
+                .map_err(PyValueError::new_err)?,
+        ),
+        ColumnKeys::Column(keys) => {
+            key_column = import_keys(&keys, text_values.len())?;
+            column::RowKeys::PerRow(raw_keys(&key_column)?)
+        }
+    };
+    let chunks = py
+        .detach(|| column::shift_column(&text_values, &keys, decrypt, parallel::n_threads(n_jobs)))
+        .map_err(PyValueError::new_err)?;
+    Ok(StringColumn {
+        chunks: Some(chunks),
+    })
+}
+
+/// Encrypts, or decrypts, every text in a column with a Playfair key, or the key for each row
+/// given as a column. Null texts and keys give nulls. The GIL is released while enciphering,
+/// which is split across `n_jobs` threads.
+#[pyfunction]
+#[pyo3(signature = (texts, keys, alphabet, missing, replacement, fill, alt_fill, decrypt, n_jobs=1))]
+fn playfair_column(
+    py: Python<'_>,
+    texts: &Bound<'_, PyAny>,
+    keys: ColumnKeys<'_>,
+    alphabet: &str,
+    missing: char,
+    replacement: char,
+    fill: char,
+    alt_fill: char,
+    decrypt: bool,
+    n_jobs: i64,
+) -> PyResult<StringColumn> {
+    let ascii = |c: char| {
+        u8::try_from(c)
+            .ok()
+            .filter(u8::is_ascii_uppercase)
+            .ok_or_else(|| PyValueError::new_err(format!("{c} is not a letter A-Z")))
+    };
+    let playfair = column::Playfair {
+        alphabet: playfair::Alphabet::new(alphabet).map_err(PyValueError::new_err)?,
+        missing: ascii(missing)?,
+        replacement: ascii(replacement)?,
+        fill: ascii(fill)?,
+        alt_fill: ascii(alt_fill)?,
+    };
+    let texts = import_column(texts)?;
+    let text_values = texts.strings().map_err(PyValueError::new_err)?;
+    let key_column;
+    let keys = match keys {
+        ColumnKeys::Key(key) => column::RowKeys::One(
+            playfair
+                .key(column::RawKey::Str(key.as_bytes()))
+                .map_err(PyValueError::new_err)?,
+        ),
+        ColumnKeys::Shift(key) => {
+            return Err(PyValueError::new_err(format!(
+                "Playfair keys must be strings, got {key}"
+            )));
+        }
+        ColumnKeys::Column(keys) => {
+            key_column = import_keys(&keys, text_values.len())?;
+            column::RowKeys::PerRow(raw_keys(&key_column)?)
+        }
+    };
+    let chunks = py
+        .detach(|| playfair.apply_column(&text_values, &keys, decrypt, parallel::n_threads(n_jobs)))
+        .map_err(PyValueError::new_err)?;
+    Ok(StringColumn {
+        chunks: Some(chunks),
+    })
 }
 
 #[pyfunction]
@@ -57,6 +790,135 @@ fn calculate_ngrams(text: &str, n: usize) -> PyResult<HashMap<String, f64>> {
         .collect())
 }
 
+/// Asks a running search to stop. Searches given the token check it every so often, from whichever
+/// threads they run on, and stop as they would at a deadline.
+#[pyclass(frozen)]
+struct CancelToken {
+    flag: Arc<AtomicBool>,
+}
+
+#[pymethods]
+impl CancelToken {
+    #[new]
+    fn new() -> CancelToken {
+        CancelToken {
+            flag: Arc::new(AtomicBool::new(false)),
+        }
+    }
+
+    fn cancel(&self) {
+        self.flag.store(true, Ordering::Relaxed);
+    }
+
+    #[getter]
+    fn cancelled(&self) -> bool {
+        self.flag.load(Ordering::Relaxed)
+    }
+}
+
+/// The number of candidates scored by the kernels on the calling thread, and the letters scored
+/// across them, since the thread started. See `blaise.instrument`.
+#[pyfunction]
+fn work_counts() -> (u64, u64) {
+    let counts = stats::counts();
+    (counts.candidates, counts.letters)
+}
+
+/// Adds candidates scored outside the kernels, such as by Python scorers, to the calling thread's
+/// counts.
+#[pyfunction]
+fn record_work(candidates: usize, letters: usize) {
+    stats::record(candidates, letters);
+}
+
+/// A candidate kept by `TopK`. Its hash is kept with it so that duplicates can be looked for
+/// without calling back into Python for each kept candidate.
+struct Candidate {
+    hash: isize,
+    item: Py<PyAny>,
+}
+
+/// The best `k` candidates of a search by score, lowest first, or all of them if `k` is None.
+/// Candidates are pushed a batch at a time and only the best are held, however many are pushed.
+/// With `unique`, a candidate equal to one already kept is dropped.
+#[pyclass]
+struct TopK {
+    top: topk::TopK<Candidate>,
+    unique: bool,
+}
+
+#[pymethods]
+impl TopK {
+    #[new]
+    #[pyo3(signature = (k=None, unique=false))]
+    fn new(k: Option<usize>, unique: bool) -> TopK {
+        TopK {
+            top: topk::TopK::new(k),
+            unique,
+        }
+    }
+
+    /// Pushes each item with its score, and returns whether any of them were kept.
+    fn push(&mut self, items: Vec<Bound<'_, PyAny>>, scores: Vec<f64>) -> PyResult<bool> {
+        if items.len() != scores.len() {
+            return Err(PyValueError::new_err(format!(
+                "Expected a score for each of the {} items, got {}",
+                items.len(),
+                scores.len()
+            )));
+        }
+        let mut kept = false;
+        for (item, score) in items.into_iter().zip(scores) {
+            // Most candidates of a long search fall short, so they're dropped before hashing.
+            if !self.top.admits(score) {
+                continue;
+            }
+            let hash = if self.unique { item.hash()? } else { 0 };
+            if self.unique && self.contains(&item, hash)? {
+                continue;
+            }
+            kept |= self.top.push(
+                score,
+                Candidate {
+                    hash,
+                    item: item.unbind(),
+                },
+            );
+        }
+        Ok(kept)
+    }
+
+    /// The kept items and their scores, best first, with ties in the order they were pushed.
+    fn items(&self, py: Python<'_>) -> Vec<(Py<PyAny>, f64)> {
+        self.top
+            .sorted()
+            .into_iter()
+            .map(|(score, candidate)| (candidate.item.clone_ref(py), score))
+            .collect()
+    }
+
+    /// The score a candidate has to beat to be kept, once `k` are kept.
+    #[getter]
+    fn threshold(&self) -> Option<f64> {
+        self.top.threshold()
+    }
+
+    fn __len__(&self) -> usize {
+        self.top.len()
+    }
+}
+
+impl TopK {
+    fn contains(&self, item: &Bound<'_, PyAny>, hash: isize) -> PyResult<bool> {
+        for kept in self.top.items() {
+            if kept.hash == hash && kept.item.bind(item.py()).eq(item)? {
+                return Ok(true);
+            }
+        }
+        Ok(false)
+    }
+}
+
 /// A Python module implemented in Rust. The name of this function must match
 /// the `lib.name` setting in the `Cargo.toml`, else Python will not be able to
 /// import the module.
@@ -64,7 +926,30 @@ fn calculate_ngrams(text: &str, n: usize) -> PyResult<HashMap<String, f64>> {
 fn _blaise(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(calculate_ngrams, m)?)?;
     m.add_function(wrap_pyfunction!(bd_score, m)?)?;
+    m.add_function(wrap_pyfunction!(bd_score_batch, m)?)?;
     m.add_function(wrap_pyfunction!(to_dist, m)?)?;
+    m.add_function(wrap_pyfunction!(load_dist, m)?)?;
+    m.add_function(wrap_pyfunction!(load_word_index, m)?)?;
+    m.add_function(wrap_pyfunction!(log_prob_score, m)?)?;
+    m.add_function(wrap_pyfunction!(log_prob_score_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(to_log_prob_dist, m)?)?;
+    m.add_function(wrap_pyfunction!(vigenere_score_keys, m)?)?;
+    m.add_function(wrap_pyfunction!(playfair_anneal, m)?)?;
+    m.add_function(wrap_pyfunction!(normalize_string, m)?)?;
+    m.add_function(wrap_pyfunction!(normalize_strings, m)?)?;
+    m.add_function(wrap_pyfunction!(normalize_column, m)?)?;
+    m.add_function(wrap_pyfunction!(shift_column, m)?)?;
+    m.add_function(wrap_pyfunction!(playfair_column, m)?)?;
+    m.add_function(wrap_pyfunction!(work_counts, m)?)?;
+    m.add_function(wrap_pyfunction!(record_work, m)?)?;
+    m.add("MAX_TABLE_N", ngram_file::MAX_FILE_N)?;
     m.add_class::<Dist>()?;
+    m.add_class::<LogProbDist>()?;
+    m.add_class::<ScoreSession>()?;
+    m.add_class::<CorpusCounter>()?;
+    m.add_class::<WordIndex>()?;
+    m.add_class::<StringColumn>()?;
+    m.add_class::<CancelToken>()?;
+    m.add_class::<TopK>()?;
     Ok(())
 }
@@ -0,0 +1,92 @@
+//! Read-only memory-mapped files.
+
+use std::fs::File;
+use std::io;
+
+/// A file mapped read-only into memory. Pages are loaded by the OS as they are read, and are
+/// shared between every process that maps the same file.
+pub struct Mmap {
+    ptr: *const u8,
+    len: usize,
+}
+
+// The mapping is read-only, so it can be shared between threads.
+unsafe impl Send for Mmap {}
+unsafe impl Sync for Mmap {}
+
+impl Mmap {
+    #[cfg(unix)]
+    pub fn open(file: &File) -> io::Result<Mmap> {
+        use std::os::unix::io::AsRawFd;
+
+        let len = file.metadata()?.len() as usize;
+        if len == 0 {
+            return Ok(Mmap {
+                ptr: std::ptr::NonNull::dangling().as_ptr(),
+                len,
+            });
+        }
+        let ptr = unsafe {
+            libc::mmap(
+                std::ptr::null_mut(),
+                len,
+                libc::PROT_READ,
+                libc::MAP_SHARED,
+                file.as_raw_fd(),
+                0,
+            )
+        };
+        if ptr == libc::MAP_FAILED {
+            return Err(io::Error::last_os_error());
+        }
+        Ok(Mmap {
+            ptr: ptr as *const u8,
+            len,
+        })
+    }
+
+    /// Platforms without mmap read the whole file into memory instead, in a buffer of u64s so
+    /// that it is aligned like a mapping.
+    #[cfg(not(unix))]
+    pub fn open(file: &File) -> io::Result<Mmap> {
+        use std::io::Read;
+
+        let mut bytes = Vec::new();
+        (&*file).read_to_end(&mut bytes)?;
+        let len = bytes.len();
+        let mut words = vec![0u64; len.div_ceil(8)].into_boxed_slice();
+        unsafe {
+            std::ptr::copy_nonoverlapping(bytes.as_ptr(), words.as_mut_ptr() as *mut u8, len);
+        }
+        Ok(Mmap {
+            ptr: Box::into_raw(words) as *const u8,
+            len,
+        })
+    }
+
+    /// The mapped bytes. The start is at least 8-byte aligned.
+    pub fn as_bytes(&self) -> &[u8] {
+        unsafe { std::slice::from_raw_parts(self.ptr, self.len) }
+    }
+}
+
+impl Drop for Mmap {
+    #[cfg(unix)]
+    fn drop(&mut self) {
+        if self.len > 0 {
+            unsafe {
+                libc::munmap(self.ptr as *mut libc::c_void, self.len);
+            }
+        }
+    }
+
+    #[cfg(not(unix))]
+    fn drop(&mut self) {
+        unsafe {
+            drop(Box::from_raw(std::ptr::slice_from_raw_parts_mut(
+                self.ptr as *mut u64,
+                self.len.div_ceil(8),
+            )));
+        }
+    }
+}
@@ -0,0 +1,333 @@
+//! Integer-encoded n-gram tables.
+//!
+//! Normalized text only contains the letters A-Z, so every n-gram can be encoded as a base-26
+//! integer. Tables for small n are stored as dense arrays indexed by that code, and scoring walks
+//! the text with a rolling code rather than slicing out and hashing a `String` per window.
+
+use std::cell::RefCell;
+use std::collections::HashMap;
+use std::io;
+
+use crate::ngram_file::{self, DType, MappedValues, Values};
+
+/// The largest n stored as a dense array (26^4 = 456,976 entries). Longer n-grams are hashed.
+pub const MAX_DENSE_N: usize = 4;
+
+/// The largest n whose codes fit in a u64.
+pub const MAX_N: usize = 13;
+
+/// Returns the base-26 code of a letter, or `None` if it isn't in A-Z.
+#[inline]
+pub fn letter_code(c: u8) -> Option<u64> {
+    if c.is_ascii_uppercase() {
+        Some((c - b'A') as u64)
+    } else {
+        None
+    }
+}
+
+/// Returns the base-26 code of an n-gram, or `None` if it contains anything other than A-Z.
+pub fn ngram_code(ngram: &[u8]) -> Option<u64> {
+    ngram
+        .iter()
+        .try_fold(0u64, |code, &c| Some(code * 26 + letter_code(c)?))
+}
+
+/// Returns the n-gram with the given base-26 code.
+pub fn ngram_string(code: u64, n: usize) -> String {
+    let mut letters = vec![b'A'; n];
+    let mut code = code;
+    for letter in letters.iter_mut().rev() {
+        *letter += (code % 26) as u8;
+        code /= 26;
+    }
+    String::from_utf8(letters).unwrap()
+}
+
+/// Calls `f` with the code of every n-gram window in `text`, in order. Windows that contain
+/// anything other than A-Z are skipped.
+#[inline]
+pub fn for_each_code(text: &[u8], n: usize, mut f: impl FnMut(u64)) {
+    // The code drops its oldest letter before it's shifted, so it never exceeds 26^n, which fits in
+    // a u64 for every n up to MAX_N.
+    let prefix_modulus = 26u64.pow(n as u32 - 1);
+    let mut code = 0u64;
+    let mut run = 0;
+    for &c in text {
+        match letter_code(c) {
+            Some(x) => {
+                code = code % prefix_modulus * 26 + x;
+                run += 1;
+                if run >= n {
+                    f(code);
+                }
+            }
+            None => {
+                code = 0;
+                run = 0;
+            }
+        }
+    }
+}
+
+enum Table {
+    /// One entry per code, with n-grams missing from the distribution stored as `missing`.
+    Dense(Vec<f64>),
+    Sparse(HashMap<u64, f64>),
+    /// One entry per code, read from a memory-mapped n-gram file.
+    Mapped(MappedValues),
+}
+
+/// A table of values for n-grams, keyed by base-26 code.
+pub struct NGramTable {
+    pub n: usize,
+    table: Table,
+    /// The value of n-grams that aren't in the table.
+    missing: f64,
+}
+
+/// Converts a map of n-gram strings to values into n and a list of (code, value) entries.
+pub fn parse_map(dist: &HashMap<String, f64>) -> Result<(usize, Vec<(u64, f64)>), String> {
+    let n = match dist.keys().next() {
+        Some(k) => k.len(),
+        None => {
+            return Err("Cannot build an n-gram table from an empty distribution".to_string());
+        }
+    };
+    if n == 0 || n > MAX_N {
+        return Err(format!("n-grams must have length 1 to {MAX_N}, got {n}"));
+    }
+    let mut entries = Vec::with_capacity(dist.len());
+    for (k, v) in dist.iter() {
+        if k.len() != n {
+            return Err("Distribution contains n-grams of different lengths".to_string());
+        }
+        match ngram_code(k.as_bytes()) {
+            Some(code) => entries.push((code, *v)),
+            None => return Err(format!("n-gram {k} is not composed of the letters A-Z")),
+        }
+    }
+    Ok((n, entries))
+}
+
+impl NGramTable {
+    /// A table of probabilities for Bhattacharyya scoring, with missing n-grams stored as NaN.
+    pub fn from_map(dist: &HashMap<String, f64>) -> Result<NGramTable, String> {
+        let (n, entries) = parse_map(dist)?;
+        Ok(NGramTable::from_entries(n, entries, f64::NAN))
+    }
+
+    pub fn from_entries(
+        n: usize,
+        entries: impl IntoIterator<Item = (u64, f64)>,
+        missing: f64,
+    ) -> NGramTable {
+        let table = if n <= MAX_DENSE_N {
+            let mut values = vec![missing; 26usize.pow(n as u32)];
+            for (code, value) in entries {
+                values[code as usize] = value;
+            }
+            Table::Dense(values)
+        } else {
+            Table::Sparse(entries.into_iter().collect())
+        };
+        NGramTable { n, table, missing }
+    }
+
+    /// Maps a table of probabilities for Bhattacharyya scoring from an n-gram file.
+    pub fn open(path: &str) -> io::Result<NGramTable> {
+        let (n, values) = ngram_file::open(path)?;
+        Ok(NGramTable {
+            n,
+            table: Table::Mapped(values),
+            missing: f64::NAN,
+        })
+    }
+
+    /// Writes the table to an n-gram file. N-grams with the missing value are left out.
+    pub fn write(&self, path: &str, dtype: DType) -> io::Result<()> {
+        ngram_file::write(path, self.n, self.entries(), dtype)
+    }
+
+    /// The number of possible codes if counts of n-grams for this table are best kept in a dense
+    /// array, or `None` if they should be hashed.
+    pub fn n_codes(&self) -> Option<usize> {
+        match &self.table {
+            Table::Dense(values) => Some(values.len()),
+            Table::Mapped(values) if self.n <= MAX_DENSE_N => Some(values.len()),
+            _ => None,
+        }
+    }
+
+    /// Returns the value for an n-gram code.
+    #[inline]
+    pub fn get(&self, code: u64) -> f64 {
+        match &self.table {
+            Table::Dense(values) => values[code as usize],
+            Table::Sparse(values) => values.get(&code).copied().unwrap_or(self.missing),
+            Table::Mapped(values) => match values.values() {
+                Values::F32(values) => values[code as usize] as f64,
+                Values::F64(values) => values[code as usize],
+            },
+        }
+    }
+
+    /// The (code, value) entries of n-grams in the table, in no particular order.
+    pub fn entries(&self) -> Vec<(u64, f64)> {
+        let is_missing = |value: f64| {
+            if self.missing.is_nan() {
+                value.is_nan()
+            } else {
+                value == self.missing
+            }
+        };
+        match &self.table {
+            Table::Sparse(values) => values.iter().map(|(&code, &value)| (code, value)).collect(),
+            _ => (0..26u64.pow(self.n as u32))
+                .map(|code| (code, self.get(code)))
+                .filter(|&(_, value)| !is_missing(value))
+                .collect(),
+        }
+    }
+
+    /// Bhattacharyya distance between this distribution and the n-grams of `text`. N-grams that
+    /// aren't in the distribution are ignored.
+    pub fn bd_score(&self, text: &[u8], scratch: &mut Scratch) -> f64 {
+        if text.len() < self.n {
+            return f64::INFINITY;
+        }
+        match &self.table {
+            Table::Dense(probs) => dense_bd_score(self.n, probs, text, scratch),
+            Table::Mapped(values) if self.n <= MAX_DENSE_N => match values.values() {
+                Values::F32(probs) => dense_bd_score(self.n, probs, text, scratch),
+                Values::F64(probs) => dense_bd_score(self.n, probs, text, scratch),
+            },
+            _ => {
+                let mut sparse_counts: HashMap<u64, u32> = HashMap::new();
+                for_each_code(text, self.n, |code| {
+                    if !self.get(code).is_nan() {
+                        *sparse_counts.entry(code).or_insert(0) += 1;
+                    }
+                });
+                let total: u32 = sparse_counts.values().sum();
+                let mut result = 0.0;
+                for (&code, c) in sparse_counts.iter() {
+                    result += (*c as f64 * self.get(code) / total as f64).sqrt();
+                }
+                -result.ln()
+            }
+        }
+    }
+}
+
+fn dense_bd_score<T: Copy + Into<f64>>(
+    n: usize,
+    probs: &[T],
+    text: &[u8],
+    scratch: &mut Scratch,
+) -> f64 {
+    let Scratch { counts, touched } = scratch;
+    if counts.len() < probs.len() {
+        counts.resize(probs.len(), 0);
+    }
+    for_each_code(text, n, |code| {
+        let i = code as usize;
+        if !probs[i].into().is_nan() {
+            if counts[i] == 0 {
+                touched.push(code);
+            }
+            counts[i] += 1;
+        }
+    });
+    let total: u32 = touched.iter().map(|&code| counts[code as usize]).sum();
+    let mut result = 0.0;
+    for &code in touched.iter() {
+        let i = code as usize;
+        result += (counts[i] as f64 * probs[i].into() / total as f64).sqrt();
+        counts[i] = 0;
+    }
+    touched.clear();
+    -result.ln()
+}
+
+/// A table of log probabilities, scoring texts by the mean negative log probability of their
+/// n-grams. N-grams not in the distribution get the log of a floor probability.
+pub struct LogProbTable {
+    pub table: NGramTable,
+}
+
+impl LogProbTable {
+    /// Builds a table from the (code, probability) entries of `n`-grams.
+    pub fn from_entries(
+        n: usize,
+        entries: Vec<(u64, f64)>,
+        floor: f64,
+    ) -> Result<LogProbTable, String> {
+        if !(floor > 0.0 && floor.is_finite()) {
+            return Err(format!("floor must be a positive probability, got {floor}"));
+        }
+        let entries = entries
+            .into_iter()
+            .map(|(code, p)| (code, p.max(floor).ln()));
+        Ok(LogProbTable {
+            table: NGramTable::from_entries(n, entries, floor.ln()),
+        })
+    }
+
+    pub fn score(&self, text: &[u8]) -> f64 {
+        let mut total = 0.0;
+        let mut count = 0usize;
+        for_each_code(text, self.table.n, |code| {
+            total += self.table.get(code);
+            count += 1;
+        });
+        if count == 0 {
+            f64::INFINITY
+        } else {
+            -total / count as f64
+        }
+    }
+}
+
+/// A scoring method and its table, for kernels that work with any n-gram scorer.
+#[derive(Clone, Copy)]
+pub enum Fitness<'a> {
+    Bhattacharyya(&'a NGramTable),
+    LogProb(&'a LogProbTable),
+}
+
+impl Fitness<'_> {
+    pub fn n(&self) -> usize {
+        match self {
+            Fitness::Bhattacharyya(table) => table.n,
+            Fitness::LogProb(table) => table.table.n,
+        }
+    }
+
+    /// Scores `text`; lower is better.
+    #[inline]
+    pub fn score(&self, text: &[u8], scratch: &mut Scratch) -> f64 {
+        match self {
+            Fitness::Bhattacharyya(table) => table.bd_score(text, scratch),
+            Fitness::LogProb(table) => table.score(text),
+        }
+    }
+}
+
+/// Reusable working memory for scoring, so that scoring a text doesn't allocate.
+#[derive(Default)]
+pub struct Scratch {
+    /// Per-code counts. Always all zero between calls.
+    counts: Vec<u32>,
+    /// The codes with non-zero counts.
+    touched: Vec<u64>,
+}
+
+thread_local! {
+    static SCRATCH: RefCell<Scratch> = RefCell::new(Scratch::default());
+}
+
+/// Runs `f` with this thread's scratch space.
+pub fn with_scratch<R>(f: impl FnOnce(&mut Scratch) -> R) -> R {
+    SCRATCH.with(|scratch| f(&mut scratch.borrow_mut()))
+}
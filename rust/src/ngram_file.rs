@@ -0,0 +1,142 @@
+//! A binary file format for n-gram tables that can be memory mapped rather than parsed.
+//!
+//! A file is a 16 byte header followed by one little-endian float per n-gram, indexed by base-26
+//! code, with NaN for n-grams that aren't in the distribution. The header is the magic bytes
+//! `BLAISENG`, a format version byte, n, the size of each float in bytes (4 or 8), then padding.
+//! Loading a file maps it in O(1), and the OS shares its pages between processes.
+
+use std::fs::File;
+use std::io::{self, BufWriter, Write};
+
+use crate::mmap::Mmap;
+
+const MAGIC: &[u8; 8] = b"BLAISENG";
+const VERSION: u8 = 1;
+const HEADER_LEN: usize = 16;
+
+/// The largest n that can be stored, since the table is dense (26^5 floats is 95 MB as f64).
+pub const MAX_FILE_N: usize = 5;
+
+#[derive(Clone, Copy, PartialEq, Debug)]
+pub enum DType {
+    F32,
+    F64,
+}
+
+impl DType {
+    pub fn parse(name: &str) -> Result<DType, String> {
+        match name {
+            "float32" => Ok(DType::F32),
+            "float64" => Ok(DType::F64),
+            _ => Err(format!("dtype must be float32 or float64, got {name}")),
+        }
+    }
+
+    fn size(self) -> usize {
+        match self {
+            DType::F32 => 4,
+            DType::F64 => 8,
+        }
+    }
+}
+
+/// A dense array of values in a memory-mapped n-gram file.
+pub struct MappedValues {
+    map: Mmap,
+    dtype: DType,
+    len: usize,
+}
+
+/// A view of the values, borrowed from the mapping.
+pub enum Values<'a> {
+    F32(&'a [f32]),
+    F64(&'a [f64]),
+}
+
+impl MappedValues {
+    pub fn values(&self) -> Values<'_> {
+        // The mapping is 8-byte aligned and the header is 16 bytes, so the values are aligned.
+        let ptr = self.map.as_bytes()[HEADER_LEN..].as_ptr();
+        unsafe {
+            match self.dtype {
+                DType::F32 => Values::F32(std::slice::from_raw_parts(ptr as *const f32, self.len)),
+                DType::F64 => Values::F64(std::slice::from_raw_parts(ptr as *const f64, self.len)),
+            }
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.len
+    }
+}
+
+fn invalid(message: String) -> io::Error {
+    io::Error::new(io::ErrorKind::InvalidData, message)
+}
+
+/// Writes a table of `n`-gram values, given as (code, value) entries, to `path`.
+pub fn write(
+    path: &str,
+    n: usize,
+    entries: impl IntoIterator<Item = (u64, f64)>,
+    dtype: DType,
+) -> io::Result<()> {
+    if n == 0 || n > MAX_FILE_N {
+        return Err(invalid(format!(
+            "n-gram files support n from 1 to {MAX_FILE_N}, got {n}"
+        )));
+    }
+    let mut values = vec![f64::NAN; 26usize.pow(n as u32)];
+    for (code, value) in entries {
+        values[code as usize] = value;
+    }
+    let mut out = BufWriter::new(File::create(path)?);
+    let mut header = [0u8; HEADER_LEN];
+    header[..8].copy_from_slice(MAGIC);
+    header[8] = VERSION;
+    header[9] = n as u8;
+    header[10] = dtype.size() as u8;
+    out.write_all(&header)?;
+    for value in values {
+        match dtype {
+            DType::F32 => out.write_all(&(value as f32).to_le_bytes())?,
+            DType::F64 => out.write_all(&value.to_le_bytes())?,
+        }
+    }
+    out.flush()
+}
+
+/// Maps the n-gram file at `path`, returning n and its values.
+pub fn open(path: &str) -> io::Result<(usize, MappedValues)> {
+    if cfg!(target_endian = "big") {
+        return Err(io::Error::new(
+            io::ErrorKind::Unsupported,
+            "n-gram files can only be mapped on little-endian platforms",
+        ));
+    }
+    let map = Mmap::open(&File::open(path)?)?;
+    let bytes = map.as_bytes();
+    if bytes.len() < HEADER_LEN || &bytes[..8] != MAGIC {
+        return Err(invalid(format!("{path} is not an n-gram file")));
+    }
+    if bytes[8] != VERSION {
+        return Err(invalid(format!(
+            "{path} has unsupported n-gram file version {}",
+            bytes[8]
+        )));
+    }
+    let n = bytes[9] as usize;
+    let dtype = match bytes[10] {
+        4 => DType::F32,
+        8 => DType::F64,
+        size => return Err(invalid(format!("{path} has unsupported float size {size}"))),
+    };
+    if n == 0 || n > MAX_FILE_N {
+        return Err(invalid(format!("{path} has unsupported n {n}")));
+    }
+    let len = 26usize.pow(n as u32);
+    if bytes.len() != HEADER_LEN + len * dtype.size() {
+        return Err(invalid(format!("{path} is truncated or has trailing data")));
+    }
+    Ok((n, MappedValues { map, dtype, len }))
+}
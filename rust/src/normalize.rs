@@ -0,0 +1,53 @@
+//! Normalizing text to the letters A-Z, as `blaise.strings.normalize_string` does.
+//!
+//! Each character is replaced by the ASCII characters of its NFKD form, so accented letters keep
+//! their base letter and compatibility characters such as ligatures are spelled out. ASCII is
+//! copied a run at a time, and other characters are looked up in a table generated from the
+//! Unicode data, so no decomposition happens at run time.
+
+use crate::fold_table::{LATIN, LATIN_START, OTHER_CHARS, OTHER_FORMS};
+
+/// The ASCII characters in the NFKD form of a non-ASCII character, which may be none.
+#[inline]
+fn ascii_form(c: char) -> &'static str {
+    let c = c as u32;
+    match LATIN.get(c.wrapping_sub(LATIN_START) as usize) {
+        Some(form) => form,
+        None => OTHER_CHARS.binary_search(&c).map_or("", |i| OTHER_FORMS[i]),
+    }
+}
+
+/// Appends the ASCII form of UTF-8 `text` to `out`. ASCII is copied unchanged, other characters
+/// are replaced by the ASCII characters of their NFKD form, and invalid bytes are dropped.
+pub fn to_ascii(text: &[u8], out: &mut Vec<u8>) {
+    for chunk in text.utf8_chunks() {
+        let mut rest = chunk.valid();
+        while !rest.is_empty() {
+            let n_ascii = rest
+                .bytes()
+                .position(|c| !c.is_ascii())
+                .unwrap_or(rest.len());
+            out.extend_from_slice(&rest.as_bytes()[..n_ascii]);
+            let mut chars = rest[n_ascii..].chars();
+            if let Some(c) = chars.next() {
+                out.extend_from_slice(ascii_form(c).as_bytes());
+            }
+            rest = chars.as_str();
+        }
+    }
+}
+
+/// Appends the letters of UTF-8 `text` to `out`, normalized to A-Z.
+pub fn normalize(text: &[u8], out: &mut Vec<u8>) {
+    let start = out.len();
+    to_ascii(text, out);
+    // Keep only the letters, in place. Every byte is written, but only letters are kept, which
+    // avoids a branch per byte.
+    let mut n = start;
+    for i in start..out.len() {
+        let c = out[i];
+        out[n] = c & !0x20;
+        n += c.is_ascii_alphabetic() as usize;
+    }
+    out.truncate(n);
+}
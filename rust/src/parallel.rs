@@ -0,0 +1,37 @@
+//! Splitting work across threads.
+
+use std::thread;
+
+/// Resolves an `n_jobs` argument to a thread count. Positive values are used as given, and
+/// anything else (conventionally -1) means one thread per available core.
+pub fn n_threads(n_jobs: i64) -> usize {
+    if n_jobs > 0 {
+        n_jobs as usize
+    } else {
+        thread::available_parallelism().map_or(1, |n| n.get())
+    }
+}
+
+/// Applies `f` to contiguous chunks of `items` on up to `n_threads` threads and concatenates the
+/// results in order. With one thread (or one item) this runs on the calling thread.
+pub fn map_chunks<T: Sync, R: Send>(
+    items: &[T],
+    n_threads: usize,
+    f: impl Fn(&[T]) -> Vec<R> + Sync,
+) -> Vec<R> {
+    let n_threads = n_threads.min(items.len());
+    if n_threads <= 1 {
+        return f(items);
+    }
+    let chunk_size = items.len().div_ceil(n_threads);
+    thread::scope(|scope| {
+        let handles: Vec<_> = items
+            .chunks(chunk_size)
+            .map(|chunk| scope.spawn(|| f(chunk)))
+            .collect();
+        handles
+            .into_iter()
+            .flat_map(|handle| handle.join().unwrap())
+            .collect()
+    })
+}
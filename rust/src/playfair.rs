@@ -0,0 +1,282 @@
+//! Stochastic key search for the Playfair cipher.
+//!
+//! The search mutates a 5x5 key square and keeps a table of where each letter sits, so decrypting
+//! a digraph is a couple of array lookups. Each restart runs simulated annealing from a random
+//! square; with a temperature of zero this is plain hill climbing.
+
+use rand::rngs::SmallRng;
+use rand::seq::SliceRandom;
+use rand::{Rng, SeedableRng};
+use std::sync::Arc;
+use std::sync::atomic::{AtomicBool, Ordering};
+use std::time::Instant;
+
+const SIZE: usize = 5;
+const CELLS: usize = SIZE * SIZE;
+/// Iterations between checks of whether to stop, so reading the clock costs nothing noticeable.
+const STOP_INTERVAL: usize = 1024;
+
+/// Maps the 25 letters of a Playfair alphabet to indices 0-24 and back.
+pub struct Alphabet {
+    letters: [u8; CELLS],
+    index: [u8; 256],
+}
+
+impl Alphabet {
+    pub fn new(letters: &str) -> Result<Alphabet, String> {
+        let bytes = letters.as_bytes();
+        if bytes.len() != CELLS {
+            return Err(format!(
+                "Playfair alphabet must have 25 letters, got {letters}"
+            ));
+        }
+        let mut alphabet = Alphabet {
+            letters: [0; CELLS],
+            index: [u8::MAX; 256],
+        };
+        for (i, &c) in bytes.iter().enumerate() {
+            if !c.is_ascii_uppercase() || alphabet.index[c as usize] != u8::MAX {
+                return Err(format!(
+                    "Playfair alphabet must be 25 distinct letters A-Z, got {letters}"
+                ));
+            }
+            alphabet.letters[i] = c;
+            alphabet.index[c as usize] = i as u8;
+        }
+        Ok(alphabet)
+    }
+
+    /// The index of a letter, or `None` if it isn't in the alphabet.
+    #[inline]
+    pub fn index(&self, c: u8) -> Option<u8> {
+        match self.index[c as usize] {
+            u8::MAX => None,
+            i => Some(i),
+        }
+    }
+
+    /// The letter at an index.
+    #[inline]
+    pub fn letter(&self, i: u8) -> u8 {
+        self.letters[i as usize]
+    }
+
+    /// Converts text to alphabet indices, failing on letters outside the alphabet.
+    pub fn encode(&self, text: &[u8]) -> Result<Vec<u8>, String> {
+        text.iter()
+            .map(|&c| match self.index[c as usize] {
+                u8::MAX => Err(format!("Character {} is not in the alphabet", c as char)),
+                i => Ok(i),
+            })
+            .collect()
+    }
+}
+
+/// A key square, stored both as the letter in each cell and the cell of each letter.
+#[derive(Clone)]
+pub struct Square {
+    cells: [u8; CELLS],
+    positions: [u8; CELLS],
+}
+
+impl Square {
+    pub fn from_cells(cells: [u8; CELLS]) -> Square {
+        let mut positions = [0; CELLS];
+        for (cell, &letter) in cells.iter().enumerate() {
+            positions[letter as usize] = cell as u8;
+        }
+        Square { cells, positions }
+    }
+
+    pub fn random(rng: &mut impl Rng) -> Square {
+        let mut cells: [u8; CELLS] = std::array::from_fn(|i| i as u8);
+        cells.shuffle(rng);
+        Square::from_cells(cells)
+    }
+
+    /// The key as a string of 25 letters, read row by row.
+    pub fn to_key(&self, alphabet: &Alphabet) -> String {
+        self.cells
+            .iter()
+            .map(|&i| alphabet.letters[i as usize] as char)
+            .collect()
+    }
+
+    fn swap_cells(&mut self, a: usize, b: usize) {
+        self.cells.swap(a, b);
+        self.positions[self.cells[a] as usize] = a as u8;
+        self.positions[self.cells[b] as usize] = b as u8;
+    }
+
+    fn swap_rows(&mut self, a: usize, b: usize) {
+        for col in 0..SIZE {
+            self.swap_cells(a * SIZE + col, b * SIZE + col);
+        }
+    }
+
+    fn swap_cols(&mut self, a: usize, b: usize) {
+        for row in 0..SIZE {
+            self.swap_cells(row * SIZE + a, row * SIZE + b);
+        }
+    }
+
+    /// Applies a random small change: usually swapping two letters, sometimes two rows or columns.
+    fn mutate(&mut self, rng: &mut impl Rng) {
+        let roll = rng.random_range(0..20);
+        if roll < 18 {
+            let a = rng.random_range(0..CELLS);
+            let b = (a + rng.random_range(1..CELLS)) % CELLS;
+            self.swap_cells(a, b);
+        } else {
+            let a = rng.random_range(0..SIZE);
+            let b = (a + rng.random_range(1..SIZE)) % SIZE;
+            if roll == 18 {
+                self.swap_rows(a, b);
+            } else {
+                self.swap_cols(a, b);
+            }
+        }
+    }
+
+    /// Builds the square for a key of letters A-Z: the distinct letters of the key that are in
+    /// the alphabet, followed by the rest of the alphabet in order.
+    pub fn from_key(key: &[u8], alphabet: &Alphabet) -> Result<Square, String> {
+        if !key.iter().all(|c| c.is_ascii_uppercase()) {
+            return Err(format!(
+                "Key {} is not composed of the letters A-Z",
+                String::from_utf8_lossy(key)
+            ));
+        }
+        let mut seen = [false; CELLS];
+        let mut cells = [0; CELLS];
+        let mut n = 0;
+        let letters = key.iter().map(|&c| alphabet.index[c as usize]);
+        for i in letters.chain(0..CELLS as u8) {
+            if i != u8::MAX && !seen[i as usize] {
+                seen[i as usize] = true;
+                cells[n] = i;
+                n += 1;
+            }
+        }
+        Ok(Square::from_cells(cells))
+    }
+
+    /// Moves each letter of a digraph by `step` cells along its row or column if the letters
+    /// share one, or swaps their columns otherwise. Returns the cells of the new letters.
+    #[inline]
+    fn digraph(&self, a: u8, b: u8, step: usize) -> (usize, usize) {
+        let p1 = self.positions[a as usize] as usize;
+        let p2 = self.positions[b as usize] as usize;
+        let (r1, c1, r2, c2) = (p1 / SIZE, p1 % SIZE, p2 / SIZE, p2 % SIZE);
+        if r1 == r2 {
+            (
+                r1 * SIZE + (c1 + step) % SIZE,
+                r2 * SIZE + (c2 + step) % SIZE,
+            )
+        } else if c1 == c2 {
+            (
+                ((r1 + step) % SIZE) * SIZE + c1,
+                ((r2 + step) % SIZE) * SIZE + c2,
+            )
+        } else {
+            (r1 * SIZE + c2, r2 * SIZE + c1)
+        }
+    }
+
+    /// Encrypts digraphs of alphabet indices, appending the ciphertext letters to `out`.
+    #[inline]
+    pub fn encrypt_into(&self, plaintext: &[u8], alphabet: &Alphabet, out: &mut Vec<u8>) {
+        for pair in plaintext.chunks_exact(2) {
+            let (q1, q2) = self.digraph(pair[0], pair[1], 1);
+            out.push(alphabet.letters[self.cells[q1] as usize]);
+            out.push(alphabet.letters[self.cells[q2] as usize]);
+        }
+    }
+
+    /// Decrypts digraphs of alphabet indices, writing the plaintext letters into `out`.
+    #[inline]
+    pub fn decrypt_into(&self, ciphertext: &[u8], alphabet: &Alphabet, out: &mut [u8]) {
+        for (pair, plain) in ciphertext.chunks_exact(2).zip(out.chunks_exact_mut(2)) {
+            let (q1, q2) = self.digraph(pair[0], pair[1], SIZE - 1);
+            plain[0] = alphabet.letters[self.cells[q1] as usize];
+            plain[1] = alphabet.letters[self.cells[q2] as usize];
+        }
+    }
+}
+
+pub struct SearchParams {
+    pub n_iters: usize,
+    /// Starting temperature, which falls linearly to zero over each restart.
+    pub temperature: f64,
+    pub seed: u64,
+    /// When to stop searching and return the best key so far, if at all.
+    pub deadline: Option<Instant>,
+    /// Set by another thread to stop searching, as at the deadline.
+    pub cancel: Option<Arc<AtomicBool>>,
+}
+
+impl SearchParams {
+    pub fn should_stop(&self) -> bool {
+        self.deadline
+            .is_some_and(|deadline| Instant::now() >= deadline)
+            || self
+                .cancel
+                .as_ref()
+                .is_some_and(|cancel| cancel.load(Ordering::Relaxed))
+    }
+}
+
+/// The best key found by one restart.
+pub struct SearchResult {
+    pub square: Square,
+    pub score: f64,
+    /// The number of keys scored, including the starting square.
+    pub n_evaluated: usize,
+}
+
+/// Searches for the key that minimises `score` of the decrypt, starting from a random square.
+/// `ciphertext` is alphabet indices and must have even length. Each restart seeds its own random
+/// number generator, so results don't depend on how restarts are split across threads. The search
+/// stops early at the deadline or when cancelled, with the best key so far.
+pub fn anneal(
+    ciphertext: &[u8],
+    alphabet: &Alphabet,
+    params: &SearchParams,
+    restart: usize,
+    mut score: impl FnMut(&[u8]) -> f64,
+) -> SearchResult {
+    let mut plaintext = vec![0u8; ciphertext.len()];
+    let mut evaluate = |square: &Square| {
+        square.decrypt_into(ciphertext, alphabet, &mut plaintext);
+        score(&plaintext)
+    };
+    let mut rng = SmallRng::seed_from_u64(params.seed.wrapping_add(restart as u64));
+    let mut current = Square::random(&mut rng);
+    let mut current_score = evaluate(&current);
+    let mut best = SearchResult {
+        square: current.clone(),
+        score: current_score,
+        n_evaluated: 1,
+    };
+    for i in 0..params.n_iters {
+        if i % STOP_INTERVAL == 0 && params.should_stop() {
+            break;
+        }
+        best.n_evaluated += 1;
+        let temperature = params.temperature * (1.0 - i as f64 / params.n_iters as f64);
+        let mut candidate = current.clone();
+        candidate.mutate(&mut rng);
+        let candidate_score = evaluate(&candidate);
+        let delta = candidate_score - current_score;
+        if delta <= 0.0 || (temperature > 0.0 && rng.random::<f64>() < (-delta / temperature).exp())
+        {
+            current = candidate;
+            current_score = candidate_score;
+            if current_score < best.score {
+                best.square = current.clone();
+                best.score = current_score;
+            }
+        }
+    }
+    best
+}
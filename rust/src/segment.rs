@@ -0,0 +1,75 @@
+//! Word segmentation by dynamic programming.
+//!
+//! The best segmentations of each suffix of the text are built from the best segmentations of the
+//! shorter suffixes, working back from the end of the text. Keeping the `k` best at each position
+//! gives the exact `k` best segmentations of the whole text, in time linear in its length for a
+//! given `k`. Without a limit, every segmentation of every suffix is kept, and ambiguous text can
+//! have exponentially many of them.
+
+use crate::word_index::WordIndex;
+
+/// One segmentation of a suffix: its score, the end of its first word, and which of the
+/// segmentations of the rest of the suffix follows.
+#[derive(Clone, Copy)]
+struct Entry {
+    score: f64,
+    end: usize,
+    rank: usize,
+}
+
+/// Returns the `k` best segmentations of `text`, best first, each as its score and the positions
+/// that words end at. A word scores -n^(1/length_power) log p for a word of n characters with
+/// probability p, and lower scores are better. Segmentations with equal scores are ordered by the
+/// lengths of their words, shortest first.
+pub fn segment(
+    index: &WordIndex,
+    text: &[u8],
+    length_power: f64,
+    k: usize,
+) -> Vec<(f64, Vec<usize>)> {
+    let n = text.len();
+    // The number of characters before each byte, for the lengths of words in characters.
+    let mut n_chars = Vec::with_capacity(n + 1);
+    n_chars.push(0);
+    for &byte in text {
+        let is_char_start = byte & 0xC0 != 0x80;
+        n_chars.push(n_chars.last().unwrap() + is_char_start as usize);
+    }
+    // best[i] holds the best segmentations of text[i..], best first.
+    let mut best: Vec<Vec<Entry>> = vec![Vec::new(); n + 1];
+    best[n].push(Entry {
+        score: 0.0,
+        end: n,
+        rank: 0,
+    });
+    let mut candidates = Vec::new();
+    for start in (0..n).rev() {
+        index.for_each_match(text, start, |end, log_prob| {
+            let length = (n_chars[end] - n_chars[start]) as f64;
+            let cost = -length.powf(1.0 / length_power) * log_prob;
+            candidates.extend(best[end].iter().enumerate().map(|(rank, rest)| Entry {
+                score: cost + rest.score,
+                end,
+                rank,
+            }));
+        });
+        // A stable sort keeps shorter first words first among equal scores.
+        candidates.sort_by(|a, b| a.score.total_cmp(&b.score));
+        candidates.truncate(k);
+        best[start] = std::mem::take(&mut candidates);
+    }
+
+    best[0]
+        .iter()
+        .map(|first| {
+            let mut ends = Vec::new();
+            let (mut pos, mut entry) = (0, *first);
+            while pos < n {
+                pos = entry.end;
+                ends.push(pos);
+                entry = best[pos][entry.rank];
+            }
+            (first.score, ends)
+        })
+        .collect()
+}
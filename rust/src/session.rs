@@ -0,0 +1,154 @@
+//! Incremental scoring of a text whose letters change a few at a time.
+//!
+//! Changing a letter only changes the n-gram windows that overlap it, so a session keeps the
+//! running totals behind the score and updates them for just those windows.
+
+use std::collections::HashMap;
+
+use crate::ngram::{Fitness, NGramTable, ngram_code};
+
+enum Counts {
+    Dense(Vec<u32>),
+    Sparse(HashMap<u64, u32>),
+}
+
+impl Counts {
+    fn for_table(table: &NGramTable) -> Counts {
+        match table.n_codes() {
+            Some(n_codes) => Counts::Dense(vec![0; n_codes]),
+            None => Counts::Sparse(HashMap::new()),
+        }
+    }
+
+    /// Adds `delta` to the count of `code`, returning the old and new counts.
+    #[inline]
+    fn add(&mut self, code: u64, delta: i32) -> (u32, u32) {
+        let count = match self {
+            Counts::Dense(counts) => &mut counts[code as usize],
+            Counts::Sparse(counts) => counts.entry(code).or_insert(0),
+        };
+        let old = *count;
+        *count = old
+            .checked_add_signed(delta)
+            .expect("n-gram count went negative");
+        (old, *count)
+    }
+}
+
+enum Totals {
+    /// For the Bhattacharyya distance: the count of n-grams in the distribution, and the sum over
+    /// them of sqrt(count * probability).
+    Bhattacharyya {
+        counts: Counts,
+        total: u64,
+        sum: f64,
+    },
+    /// For log probabilities: the sum of the log probabilities of all windows.
+    LogProb { sum: f64 },
+}
+
+pub struct ScoreState {
+    text: Vec<u8>,
+    totals: Totals,
+}
+
+impl ScoreState {
+    pub fn new(text: &[u8], fitness: Fitness) -> Result<ScoreState, String> {
+        if !text.iter().all(|c| c.is_ascii_uppercase()) {
+            return Err("Text must be normalized to the letters A-Z".to_string());
+        }
+        let totals = match fitness {
+            Fitness::Bhattacharyya(table) => Totals::Bhattacharyya {
+                counts: Counts::for_table(table),
+                total: 0,
+                sum: 0.0,
+            },
+            Fitness::LogProb(_) => Totals::LogProb { sum: 0.0 },
+        };
+        let mut state = ScoreState {
+            text: text.to_vec(),
+            totals,
+        };
+        let n = fitness.n();
+        for start in 0..(text.len() + 1).saturating_sub(n) {
+            state.update_window(start, 1, fitness);
+        }
+        Ok(state)
+    }
+
+    pub fn text(&self) -> &[u8] {
+        &self.text
+    }
+
+    pub fn score(&self, fitness: Fitness) -> f64 {
+        let n_windows = (self.text.len() + 1).saturating_sub(fitness.n());
+        match &self.totals {
+            Totals::Bhattacharyya { total, sum, .. } => {
+                if *total == 0 {
+                    f64::INFINITY
+                } else {
+                    -(sum / (*total as f64).sqrt()).ln()
+                }
+            }
+            Totals::LogProb { sum } => {
+                if n_windows == 0 {
+                    f64::INFINITY
+                } else {
+                    -sum / n_windows as f64
+                }
+            }
+        }
+    }
+
+    /// Sets the letters at the given positions and returns the new score. Only the windows that
+    /// overlap a changed position are rescored.
+    pub fn apply(&mut self, diff: &[(usize, u8)], fitness: Fitness) -> Result<f64, String> {
+        for &(pos, c) in diff {
+            if pos >= self.text.len() {
+                return Err(format!("Position {pos} is out of range"));
+            }
+            if !c.is_ascii_uppercase() {
+                return Err(format!("{} is not a letter A-Z", c as char));
+            }
+        }
+        let n = fitness.n();
+        let n_windows = (self.text.len() + 1).saturating_sub(n);
+        let mut starts: Vec<usize> = diff
+            .iter()
+            .flat_map(|&(pos, _)| (pos + 1).saturating_sub(n)..(pos + 1).min(n_windows))
+            .collect();
+        starts.sort_unstable();
+        starts.dedup();
+
+        for &start in &starts {
+            self.update_window(start, -1, fitness);
+        }
+        for &(pos, c) in diff {
+            self.text[pos] = c;
+        }
+        for &start in &starts {
+            self.update_window(start, 1, fitness);
+        }
+        Ok(self.score(fitness))
+    }
+
+    /// Adds (`sign` = 1) or removes (`sign` = -1) the window starting at `start` from the totals.
+    #[inline]
+    fn update_window(&mut self, start: usize, sign: i32, fitness: Fitness) {
+        let code = ngram_code(&self.text[start..start + fitness.n()]).unwrap();
+        match (&mut self.totals, fitness) {
+            (Totals::Bhattacharyya { counts, total, sum }, Fitness::Bhattacharyya(table)) => {
+                let p = table.get(code);
+                if !p.is_nan() {
+                    let (old, new) = counts.add(code, sign);
+                    *total = total.checked_add_signed(sign as i64).unwrap();
+                    *sum += (new as f64 * p).sqrt() - (old as f64 * p).sqrt();
+                }
+            }
+            (Totals::LogProb { sum }, Fitness::LogProb(table)) => {
+                *sum += sign as f64 * table.table.get(code);
+            }
+            _ => panic!("Score state used with a different scoring method"),
+        }
+    }
+}
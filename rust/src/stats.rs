@@ -0,0 +1,39 @@
+//! Counts of the candidates scored by the kernels, read by `blaise.instrument`.
+//!
+//! A kernel adds up its work as it goes and records the totals once per call, on the thread that
+//! called it. Counting costs nothing per candidate, and counts from calls on other Python threads
+//! don't mix with the caller's.
+
+use std::cell::Cell;
+
+#[derive(Clone, Copy, Default)]
+pub struct Counts {
+    /// Candidate texts or keys scored.
+    pub candidates: u64,
+    /// Letters scored across those candidates.
+    pub letters: u64,
+}
+
+thread_local! {
+    static COUNTS: Cell<Counts> = Cell::new(Counts::default());
+}
+
+/// Adds `candidates` scored with `letters` letters in total to the calling thread's counts.
+pub fn record(candidates: usize, letters: usize) {
+    COUNTS.with(|counts| {
+        let Counts {
+            candidates: c,
+            letters: l,
+        } = counts.get();
+        counts.set(Counts {
+            candidates: c.wrapping_add(candidates as u64),
+            letters: l.wrapping_add(letters as u64),
+        });
+    });
+}
+
+/// The calling thread's counts since it started. They only ever increase, so the work done by a
+/// call is the difference between the counts before and after it.
+pub fn counts() -> Counts {
+    COUNTS.with(Cell::get)
+}
@@ -0,0 +1,128 @@
+//! The best-scoring candidates of a search, kept as they stream in.
+//!
+//! Candidates are held in a max-heap of at most `k` entries, with the worst kept candidate on
+//! top, so memory is bounded by `k` rather than by the number of candidates seen, and a candidate
+//! that doesn't make the cut costs one comparison. Lower scores are better, as for the scorers.
+
+use std::cmp::Ordering;
+use std::collections::BinaryHeap;
+
+struct Entry<T> {
+    score: f64,
+    /// The order the candidate was kept in, which breaks ties in favour of earlier candidates.
+    seq: u64,
+    item: T,
+}
+
+impl<T> Entry<T> {
+    fn rank(&self, other: &Self) -> Ordering {
+        self.score
+            .total_cmp(&other.score)
+            .then(self.seq.cmp(&other.seq))
+    }
+}
+
+impl<T> PartialEq for Entry<T> {
+    fn eq(&self, other: &Self) -> bool {
+        self.rank(other) == Ordering::Equal
+    }
+}
+
+impl<T> Eq for Entry<T> {}
+
+impl<T> PartialOrd for Entry<T> {
+    fn partial_cmp(&self, other: &Self) -> Option<Ordering> {
+        Some(self.cmp(other))
+    }
+}
+
+impl<T> Ord for Entry<T> {
+    fn cmp(&self, other: &Self) -> Ordering {
+        self.rank(other)
+    }
+}
+
+/// Makes every NaN positive. `total_cmp` orders a negative NaN below every number, and a positive
+/// one above, so this ranks all of them worse than any real score.
+fn canonical(score: f64) -> f64 {
+    if score.is_nan() { f64::NAN } else { score }
+}
+
+/// The `k` lowest-scoring items pushed so far, or every item if `k` is `None`.
+pub struct TopK<T> {
+    k: Option<usize>,
+    heap: BinaryHeap<Entry<T>>,
+    seq: u64,
+}
+
+impl<T> TopK<T> {
+    pub fn new(k: Option<usize>) -> TopK<T> {
+        let capacity = k.unwrap_or(0).min(1 << 16);
+        TopK {
+            k,
+            heap: BinaryHeap::with_capacity(capacity),
+            seq: 0,
+        }
+    }
+
+    pub fn len(&self) -> usize {
+        self.heap.len()
+    }
+
+    /// The score a candidate has to beat to be kept, once there are `k` of them.
+    pub fn threshold(&self) -> Option<f64> {
+        match self.k {
+            Some(k) if self.heap.len() >= k => self.heap.peek().map(|worst| worst.score),
+            _ => None,
+        }
+    }
+
+    /// Whether an item with `score` would be kept if it were pushed now. NaN scores are worse than
+    /// any other, and an item that ties with the worst kept one loses to it.
+    pub fn admits(&self, score: f64) -> bool {
+        let score = canonical(score);
+        match self.k {
+            None => true,
+            Some(0) => false,
+            Some(k) if self.heap.len() < k => true,
+            Some(_) => self
+                .heap
+                .peek()
+                .is_some_and(|worst| score.total_cmp(&worst.score) == Ordering::Less),
+        }
+    }
+
+    /// Keeps `item` if it's among the best `k` so far, dropping the worst kept item to make room,
+    /// and returns whether it was kept.
+    pub fn push(&mut self, score: f64, item: T) -> bool {
+        let score = canonical(score);
+        if !self.admits(score) {
+            return false;
+        }
+        if self.k.is_some_and(|k| self.heap.len() >= k) {
+            self.heap.pop();
+        }
+        self.heap.push(Entry {
+            score,
+            seq: self.seq,
+            item,
+        });
+        self.seq += 1;
+        true
+    }
+
+    /// The kept items, in no particular order.
+    pub fn items(&self) -> impl Iterator<Item = &T> {
+        self.heap.iter().map(|entry| &entry.item)
+    }
+
+    /// The kept items with their scores, best first.
+    pub fn sorted(&self) -> Vec<(f64, &T)> {
+        let mut entries: Vec<&Entry<T>> = self.heap.iter().collect();
+        entries.sort_unstable_by(|a, b| a.rank(b));
+        entries
+            .into_iter()
+            .map(|entry| (entry.score, &entry.item))
+            .collect()
+    }
+}
@@ -0,0 +1,39 @@
+//! Decrypt-and-score kernels for the Vigenère cipher.
+
+/// Converts a key of letters A-Z into shifts 0-25.
+pub fn to_shifts(key: &str) -> Result<Vec<u8>, String> {
+    if key.is_empty() || !key.bytes().all(|c| c.is_ascii_uppercase()) {
+        return Err(format!(
+            "Key {key} is not a non-empty string of the letters A-Z"
+        ));
+    }
+    Ok(key.bytes().map(|c| c - b'A').collect())
+}
+
+/// Decrypts `ciphertext` (letters A-Z) with a key of shifts, writing the plaintext into `out`.
+#[inline]
+pub fn decrypt_into(ciphertext: &[u8], shifts: &[u8], out: &mut [u8]) {
+    for ((&c, &s), o) in ciphertext
+        .iter()
+        .zip(shifts.iter().cycle())
+        .zip(out.iter_mut())
+    {
+        *o = b'A' + (c - b'A' + 26 - s) % 26;
+    }
+}
+
+/// Decrypts `ciphertext` with each key and returns the score of each plaintext. Every plaintext
+/// is written into the same buffer, so no strings are built along the way.
+pub fn score_keys(
+    ciphertext: &[u8],
+    keys: &[Vec<u8>],
+    mut score: impl FnMut(&[u8]) -> f64,
+) -> Vec<f64> {
+    let mut buffer = vec![0u8; ciphertext.len()];
+    keys.iter()
+        .map(|shifts| {
+            decrypt_into(ciphertext, shifts, &mut buffer);
+            score(&buffer)
+        })
+        .collect()
+}
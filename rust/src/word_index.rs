@@ -0,0 +1,273 @@
+//! An immutable dictionary of words stored as a double-array trie.
+//!
+//! Each state of the trie is an index into two arrays. The child of state `s` for byte `c` is
+//! `t = base[s] + c + 1`, which exists only if `check[t] == s`, so following a byte is a couple of
+//! array reads. Words are stored as UTF-8 bytes, and each state that ends a word holds the word's
+//! log probability.
+
+use std::collections::{HashMap, VecDeque};
+use std::io::{self, BufWriter, Write};
+
+const MAGIC: &[u8; 8] = b"BLAISEWI";
+const VERSION: u8 = 1;
+const HEADER_LEN: usize = 16;
+
+/// `check` value of unused states.
+const EMPTY: u32 = u32::MAX;
+const ROOT: u32 = 0;
+/// The end of the free list.
+const NIL: u32 = u32::MAX;
+/// How many times a free state is tried as the place for a node's first child before the search
+/// stops trying it. This keeps the search from repeatedly scanning holes that are hard to fill.
+const MAX_TRIES: u8 = 16;
+
+pub struct WordIndex {
+    base: Vec<u32>,
+    check: Vec<u32>,
+    /// The log probability of the word ending at each state, or NaN.
+    log_probs: Vec<f64>,
+    n_words: usize,
+}
+
+impl WordIndex {
+    /// Builds an index of words and their probabilities, normalized to sum to one. Empty words
+    /// are ignored.
+    pub fn new(words: HashMap<String, f64>) -> WordIndex {
+        let total: f64 = words.values().sum();
+        let mut words: Vec<(Vec<u8>, f64)> = words
+            .into_iter()
+            .filter(|(word, _)| !word.is_empty())
+            .map(|(word, p)| (word.into_bytes(), (p / total).ln()))
+            .collect();
+        words.sort_unstable_by(|a, b| a.0.cmp(&b.0));
+
+        let mut builder = Builder {
+            index: WordIndex {
+                base: vec![0],
+                check: vec![ROOT],
+                log_probs: vec![f64::NAN],
+                n_words: words.len(),
+            },
+            free_next: vec![NIL],
+            free_tries: vec![0],
+            free_head: NIL,
+            free_tail: NIL,
+        };
+        // Each node is its state and the range of words it is a prefix of, at a depth.
+        let mut queue = VecDeque::from([(ROOT, 0, words.len(), 0)]);
+        let mut labels = Vec::new();
+        while let Some((state, lo, hi, depth)) = queue.pop_front() {
+            // Sorting puts the word that ends at this node first.
+            let mut lo = lo;
+            if lo < hi && words[lo].0.len() == depth {
+                builder.index.log_probs[state as usize] = words[lo].1;
+                lo += 1;
+            }
+            if lo == hi {
+                continue;
+            }
+            labels.clear();
+            let mut start = lo;
+            for i in lo + 1..=hi {
+                if i == hi || words[i].0[depth] != words[start].0[depth] {
+                    labels.push((words[start].0[depth], start, i));
+                    start = i;
+                }
+            }
+            let base = builder.find_base(&labels);
+            builder.index.base[state as usize] = base as u32;
+            for &(label, lo, hi) in &labels {
+                let child = base + label as usize + 1;
+                builder.index.check[child] = state;
+                queue.push_back((child as u32, lo, hi, depth + 1));
+            }
+        }
+        builder.index
+    }
+
+    pub fn n_words(&self) -> usize {
+        self.n_words
+    }
+
+    #[inline]
+    fn step(&self, state: u32, byte: u8) -> Option<u32> {
+        let child = self.base[state as usize] as usize + byte as usize + 1;
+        (self.check.get(child) == Some(&state)).then_some(child as u32)
+    }
+
+    /// Calls `f` with the end and log probability of every word that starts at `start` in `text`,
+    /// shortest first. The walk stops as soon as no word has the text so far as a prefix.
+    #[inline]
+    pub fn for_each_match(&self, text: &[u8], start: usize, mut f: impl FnMut(usize, f64)) {
+        let mut state = ROOT;
+        for (end, &byte) in text.iter().enumerate().skip(start) {
+            match self.step(state, byte) {
+                Some(child) => state = child,
+                None => return,
+            }
+            let log_prob = self.log_probs[state as usize];
+            if !log_prob.is_nan() {
+                f(end + 1, log_prob);
+            }
+        }
+    }
+
+    /// Every word in the index and its log probability.
+    pub fn words(&self) -> Vec<(String, f64)> {
+        let mut words = Vec::with_capacity(self.n_words);
+        let mut stack = vec![(ROOT, Vec::new())];
+        while let Some((state, word)) = stack.pop() {
+            let log_prob = self.log_probs[state as usize];
+            if !log_prob.is_nan() {
+                words.push((String::from_utf8_lossy(&word).into_owned(), log_prob));
+            }
+            for byte in 0..=u8::MAX {
+                if let Some(child) = self.step(state, byte) {
+                    let mut child_word = word.clone();
+                    child_word.push(byte);
+                    stack.push((child, child_word));
+                }
+            }
+        }
+        words
+    }
+
+    /// Writes the index to a file, which `read` loads without rebuilding the trie.
+    pub fn write(&self, path: &str) -> io::Result<()> {
+        let mut out = BufWriter::new(std::fs::File::create(path)?);
+        let mut header = [0u8; HEADER_LEN];
+        header[..8].copy_from_slice(MAGIC);
+        header[8] = VERSION;
+        out.write_all(&header)?;
+        out.write_all(&(self.base.len() as u64).to_le_bytes())?;
+        out.write_all(&(self.n_words as u64).to_le_bytes())?;
+        for &base in &self.base {
+            out.write_all(&base.to_le_bytes())?;
+        }
+        for &check in &self.check {
+            out.write_all(&check.to_le_bytes())?;
+        }
+        for &log_prob in &self.log_probs {
+            out.write_all(&log_prob.to_le_bytes())?;
+        }
+        out.flush()
+    }
+
+    pub fn read(path: &str) -> io::Result<WordIndex> {
+        let invalid =
+            |message: &str| io::Error::new(io::ErrorKind::InvalidData, format!("{path} {message}"));
+        let bytes = std::fs::read(path)?;
+        if bytes.len() < HEADER_LEN + 16 || &bytes[..8] != MAGIC {
+            return Err(invalid("is not a word index file"));
+        }
+        if bytes[8] != VERSION {
+            return Err(invalid("has an unsupported word index version"));
+        }
+        let read_u64 =
+            |offset: usize| u64::from_le_bytes(bytes[offset..offset + 8].try_into().unwrap());
+        let n_states = read_u64(HEADER_LEN) as usize;
+        let n_words = read_u64(HEADER_LEN + 8) as usize;
+        let data = &bytes[HEADER_LEN + 16..];
+        if data.len() != n_states * 16 {
+            return Err(invalid("is truncated or has trailing data"));
+        }
+        let (base, rest) = data.split_at(n_states * 4);
+        let (check, log_probs) = rest.split_at(n_states * 4);
+        let u32s = |bytes: &[u8]| -> Vec<u32> {
+            bytes
+                .chunks_exact(4)
+                .map(|b| u32::from_le_bytes(b.try_into().unwrap()))
+                .collect()
+        };
+        let index = WordIndex {
+            base: u32s(base),
+            check: u32s(check),
+            log_probs: log_probs
+                .chunks_exact(8)
+                .map(|b| f64::from_le_bytes(b.try_into().unwrap()))
+                .collect(),
+            n_words,
+        };
+        // Walks assume every child of a state is inside the arrays or fails the check.
+        if index.base.is_empty()
+            || index
+                .check
+                .iter()
+                .any(|&c| c != EMPTY && c as usize >= n_states)
+        {
+            return Err(invalid("is corrupt"));
+        }
+        Ok(index)
+    }
+}
+
+/// Lays out the trie, keeping a list of free states in increasing order to search for space for
+/// each node's children.
+struct Builder {
+    index: WordIndex,
+    free_next: Vec<u32>,
+    free_tries: Vec<u8>,
+    free_head: u32,
+    free_tail: u32,
+}
+
+impl Builder {
+    /// Finds a base at which every child label lands on a free state, growing the arrays to fit.
+    fn find_base(&mut self, labels: &[(u8, usize, usize)]) -> usize {
+        let first_label = labels[0].0 as usize + 1;
+        let (mut prev, mut pos) = (NIL, self.free_head);
+        while pos != NIL {
+            let state = pos as usize;
+            let next = self.free_next[state];
+            if self.index.check[state] != EMPTY || self.free_tries[state] >= MAX_TRIES {
+                // Drop states that have been used or tried too often.
+                match prev {
+                    NIL => self.free_head = next,
+                    prev => self.free_next[prev as usize] = next,
+                }
+                if pos == self.free_tail {
+                    self.free_tail = prev;
+                }
+                pos = next;
+                continue;
+            }
+            if state >= first_label {
+                let base = state - first_label;
+                let fits = labels.iter().all(|&(label, _, _)| {
+                    let child = base + label as usize + 1;
+                    child >= self.index.check.len() || self.index.check[child] == EMPTY
+                });
+                if fits {
+                    self.grow(base + labels.last().unwrap().0 as usize + 2);
+                    return base;
+                }
+            }
+            self.free_tries[state] += 1;
+            prev = pos;
+            pos = next;
+        }
+        let base = self.index.check.len().saturating_sub(first_label);
+        self.grow(base + labels.last().unwrap().0 as usize + 2);
+        base
+    }
+
+    /// Grows the arrays to `len` states, adding the new states to the free list.
+    fn grow(&mut self, len: usize) {
+        let old_len = self.index.check.len();
+        if len <= old_len {
+            return;
+        }
+        self.index.base.resize(len, 0);
+        self.index.check.resize(len, EMPTY);
+        self.index.log_probs.resize(len, f64::NAN);
+        self.free_next.resize(len, NIL);
+        self.free_tries.resize(len, 0);
+        for state in old_len as u32..len as u32 {
+            match self.free_tail {
+                NIL => self.free_head = state,
+                tail => self.free_next[tail as usize] = state,
+            }
+            self.free_tail = state;
+        }
+    }
+}
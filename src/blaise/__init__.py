@@ -1,3 +1,13 @@
 import importlib.metadata
+from typing import TYPE_CHECKING
+
+from blaise._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .instrumentation import Stats, instrument
 
 __version__ = importlib.metadata.version(__name__)
+
+__getattr__, __dir__ = lazy_attributes(__name__, {"instrument": ".instrumentation", "Stats": ".instrumentation"})
+
+__all__ = ["instrument", "Stats"]
@@ -0,0 +1,28 @@
+"""Lazy loading of package attributes from their submodules"""
+
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_attributes(package: str, attributes: dict[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Returns ``__getattr__`` and ``__dir__`` functions for a package, which import each of ``attributes`` from
+    its submodule the first time it's used rather than when the package is imported. ``attributes`` maps
+    attribute names to submodule names relative to the package.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            submodule = attributes[name]
+        except KeyError:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(submodule, package), name)
+        # Later lookups find the attribute without calling __getattr__.
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(attributes))
+
+    return __getattr__, __dir__
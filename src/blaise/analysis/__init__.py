@@ -0,0 +1,3 @@
+from .keylength import index_of_coincidence, rank_key_lengths
+
+__all__ = ["index_of_coincidence", "rank_key_lengths"]
@@ -0,0 +1,114 @@
+"""Estimates the period of polyalphabetic ciphers such as Vigenère."""
+
+from collections import Counter
+from typing import TYPE_CHECKING, Iterable
+
+from blaise.data.ngram import load_ngram_dist
+from blaise.strings import normalize_string
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def index_of_coincidence(text: str) -> float:
+    """
+    The probability that two letters drawn at random from ``text`` are the same.
+    English text is around 0.066, uniformly random letters around 1/26 = 0.038.
+
+    >>> round(index_of_coincidence("HELLOWORLD"), 4)
+    0.0889
+    """
+    text = normalize_string(text)
+    n = len(text)
+    if n < 2:
+        raise ValueError("Need at least two letters to calculate the index of coincidence")
+    return sum(c * (c - 1) for c in Counter(text).values()) / (n * (n - 1))
+
+
+def rank_key_lengths(
+    ciphertext: str,
+    key_lengths: Iterable[int] = range(1, 31),
+    dist: str = "en_wiki",
+) -> "pl.DataFrame":
+    """
+    Ranks candidate key lengths (periods) of a polyalphabetic cipher, most likely first.
+
+    Two statistics are combined:
+
+    * ``ioc``: the index of coincidence of the columns the ciphertext splits into for that
+      period. At the true period (or a multiple of it) each column is a Caesar shift of the
+      plaintext, so this is close to that of the language.
+    * ``kasiski``: the fraction of distances between repeated trigrams that the period
+      divides. Repeats mostly come from the same plaintext being encrypted at the same key
+      position, so this favours the true period (or its divisors).
+
+    ``score`` is the shortfall of ``ioc`` from the expected value for ``dist`` (scaled so
+    random text is 1) plus ``1 - kasiski``. Lower is better, as with scorers. A divisor of the
+    period can tie with it when its columns already reach the expected ``ioc``, so ties go to
+    the higher ``ioc``, which the true period has as its columns aren't mixed.
+
+    Parameters
+    ----------
+    ciphertext : str
+        The ciphertext. Non-alphabetic characters are ignored.
+    key_lengths : Iterable[int], optional
+        The periods to rank. Defaults to 1 through 30.
+    dist : str, optional
+        The letter distribution giving the expected index of coincidence.
+
+    Returns
+    -------
+    polars.DataFrame
+        Columns ``key_length``, ``ioc``, ``kasiski`` and ``score``, ordered by score.
+    """
+    import polars as pl
+
+    ciphertext = normalize_string(ciphertext)
+    expected_ioc = sum(p**2 for p in load_ngram_dist(dist, 1).values())
+    random_ioc = 1 / 26
+
+    periods = pl.DataFrame({"key_length": list(key_lengths)}, schema={"key_length": pl.Int64})
+    if (periods["key_length"] < 1).any():
+        raise ValueError("Key lengths must be positive")
+    letters = pl.DataFrame({"letter": list(ciphertext)}, schema={"letter": pl.String}).with_row_index("pos")
+
+    # Pooled index of coincidence over the columns for each period.
+    ioc = (
+        letters.join(periods, how="cross")
+        .group_by("key_length", pl.col("pos") % pl.col("key_length"), "letter")
+        .len()
+        .group_by("key_length", "pos")
+        .agg(pairs=(pl.col("len") * (pl.col("len") - 1)).sum(), n=pl.col("len").sum())
+        .group_by("key_length")
+        .agg(ioc=pl.col("pairs").sum() / (pl.col("n") * (pl.col("n") - 1)).sum())
+        .with_columns(ioc=pl.col("ioc").fill_nan(None))
+    )
+
+    # Distances between successive occurrences of each repeated trigram.
+    distances = (
+        letters.with_columns(
+            trigram=pl.concat_str(pl.col("letter"), pl.col("letter").shift(-1), pl.col("letter").shift(-2))
+        )
+        .drop_nulls("trigram")
+        .group_by("trigram")
+        .agg(distance=pl.col("pos").sort().diff().drop_nulls())
+        .explode("distance")
+        .drop_nulls("distance")
+        .select("distance")
+    )
+    kasiski = (
+        periods.join(distances, how="cross")
+        .group_by("key_length")
+        .agg(kasiski=(pl.col("distance") % pl.col("key_length") == 0).mean())
+    )
+
+    return (
+        periods.join(ioc, on="key_length", how="left")
+        .join(kasiski, on="key_length", how="left")
+        .with_columns(pl.col("kasiski").fill_null(0.0))
+        .with_columns(
+            score=(expected_ioc - pl.col("ioc")).clip(lower_bound=0) / (expected_ioc - random_ioc)
+            + (1 - pl.col("kasiski"))
+        )
+        .sort("score", "ioc", "key_length", descending=[False, True, False], nulls_last=True)
+    )
@@ -1,5 +1,23 @@
-from .caesar import Caesar
-from .playfair import Playfair
-from .vigenere import Vigenere
+from typing import TYPE_CHECKING
 
-__all__ = ["Caesar", "Vigenere", "Playfair"]
+from blaise._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .caesar import Caesar
+    from .common import set_max_concurrent_cracks
+    from .playfair import Playfair, PlayfairKey
+    from .vigenere import Vigenere
+
+# Each cipher is imported when it's first used, so using one doesn't import the dependencies of the others.
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "Caesar": ".caesar",
+        "Vigenere": ".vigenere",
+        "Playfair": ".playfair",
+        "PlayfairKey": ".playfair",
+        "set_max_concurrent_cracks": ".common",
+    },
+)
+
+__all__ = ["Caesar", "Vigenere", "Playfair", "PlayfairKey", "set_max_concurrent_cracks"]
@@ -1,8 +1,16 @@
-import polars as pl
+from typing import TYPE_CHECKING, Iterator, Sequence
 
-from blaise.ciphers.common import Cipher
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.ciphers.common import Cipher, _Budget, _key_series, _text_series
 from blaise.scores.base import Scorer
-from blaise.strings import normalize_string
+from blaise.strings import Text, normalize_string
+
+if TYPE_CHECKING:
+    import polars as pl
+
+_ALPHABET = b"ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+# The bytes.translate table of each shift, built once rather than on every call.
+_SHIFT_TABLES = [bytes.maketrans(_ALPHABET, _ALPHABET[k:] + _ALPHABET[:k]) for k in range(26)]
 
 
 class Caesar(Cipher):
@@ -12,22 +20,49 @@ class Caesar(Cipher):
     Wikipedia page: https://en.wikipedia.org/wiki/Caesar_cipher
     """
 
-    def encrypt(self, plaintext: str, key: int) -> str:
+    def encrypt(self, plaintext: str, key: int) -> Text:
         """
         Applies a Caesar shift to plaintext. Positive key value is a right shift, negative is a left shift.
         """
-        plaintext = normalize_string(plaintext)
-        return "".join(chr(ord("A") + (ord(c) - ord("A") + key) % 26) for c in plaintext)
+        return _shift(normalize_string(plaintext), [key])
 
-    def decrypt(self, ciphertext: str, key: int) -> str:
+    def decrypt(self, ciphertext: str, key: int) -> Text:
         """
         Decrypts a Caesar shift that has been applied. Positive key value indicates that it was
         encrypted with a right shift, and negative with a left shift.
         """
-        ciphertext = normalize_string(ciphertext)
-        return self.encrypt(ciphertext, key=-key)
+        return _shift(normalize_string(ciphertext), [-key])
+
+    def encrypt_series(self, texts: "pl.Series | list[str]", keys: "int | pl.Series | list[int]", n_jobs: int = 1):
+        """
+        Applies a Caesar shift to every text in a column, natively and in a single pass over the text. ``keys``
+        is one shift for every text, or a column of a shift per text. Null texts or keys give nulls.
+
+        >>> import polars as pl
+        >>> Caesar().encrypt_series(pl.Series("message", ["Hello, world", None]), 3).to_list()
+        ['KHOORZRUOG', None]
+        """
+        return _shift_series(texts, keys, decrypt=False, n_jobs=n_jobs)
+
+    def decrypt_series(self, texts: "pl.Series | list[str]", keys: "int | pl.Series | list[int]", n_jobs: int = 1):
+        """
+        Decrypts a Caesar shift applied to every text in a column, with one shift for every text or a column of
+        a shift per text.
+
+        >>> Caesar().decrypt_series(["KHOORZRUOG", "LIPPS"], [3, 4]).to_list()
+        ['HELLOWORLD', 'HELLO']
+        """
+        return _shift_series(texts, keys, decrypt=True, n_jobs=n_jobs)
 
-    def crack(self, ciphertext, scorer: Scorer | None = None, top_n: int | None = None) -> pl.DataFrame:
+    def crack(
+        self,
+        ciphertext,
+        scorer: Scorer | None = None,
+        top_n: int | None = None,
+        n_jobs: int = 1,
+        time_budget: float | None = None,
+        max_evaluations: int | None = None,
+    ) -> "pl.DataFrame":
         """
         Cracks a Caesar shift cipher. It will try all shifts and score them with an ngram scorer.
 
@@ -39,6 +74,12 @@ class Caesar(Cipher):
             Scorer function to evaluate plaintext candidates.
         top_n : optional
             Number of top results to return.
+        n_jobs : optional
+            Number of threads to score candidates on (-1 for all cores).
+        time_budget : optional
+            Seconds to search for, after which the best results so far are returned.
+        max_evaluations : optional
+            Number of shifts to try, in order from zero.
 
         Example
         -------
@@ -56,9 +97,42 @@ class Caesar(Cipher):
         └─────┴────────────┴──────────┘
 
         """
-        return self.bruteforce_crack(
-            ciphertext=ciphertext,
-            keys=list(range(26)),
-            scorer=scorer,
-            top_n=top_n,
-        )
+        return next(self._crack(ciphertext, False, scorer, top_n, n_jobs, time_budget, max_evaluations))
+
+    def _crack(
+        self,
+        ciphertext: str,
+        stream: bool,
+        scorer: Scorer | None = None,
+        top_n: int | None = None,
+        n_jobs: int = 1,
+        time_budget: float | None = None,
+        max_evaluations: int | None = None,
+    ) -> Iterator["pl.DataFrame"]:
+        budget = _Budget(time_budget, max_evaluations)
+        return self._bruteforce(ciphertext, range(26), scorer, top_n, n_jobs, budget, stream)
+
+
+def _shift(text: Text, shifts: Sequence[int]) -> Text:
+    """
+    Shifts normalized text by a key of shifts, repeated as needed. The letters that share a shift, every
+    ``len(shifts)``-th letter, are translated together with one table lookup each.
+    """
+    data = text.encode("ascii")
+    if len(shifts) == 1:
+        return Text._trusted(data.translate(_SHIFT_TABLES[shifts[0] % 26]).decode("ascii"))
+    result = bytearray(len(data))
+    for i, shift in enumerate(shifts):
+        result[i :: len(shifts)] = data[i :: len(shifts)].translate(_SHIFT_TABLES[shift % 26])
+    return Text._trusted(result.decode("ascii"))
+
+
+def _shift_series(texts, keys, decrypt: bool, n_jobs: int) -> "pl.Series":
+    import polars as pl
+
+    texts = _text_series(texts)
+    if isinstance(keys, (pl.Series, list)):
+        keys = _key_series(keys, len(texts)).cast(pl.Int64)
+    elif not isinstance(keys, int):
+        raise TypeError(f"Caesar keys must be integers, got {type(keys)}")
+    return pl.Series(_blaise.shift_column(texts, keys, decrypt, n_jobs=n_jobs)).alias(texts.name)
@@ -1,9 +1,35 @@
+import contextvars
+import functools
+import os
+import threading
+import time
 from abc import ABC, abstractmethod
-from typing import Any
-
-import polars as pl
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, TypeVar
 
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.instrumentation import _record_candidates, _separately, _stage
 from blaise.scores.base import Scorer, as_scorer
+from blaise.strings import normalize_string
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future, ThreadPoolExecutor
+
+    # polars is slow to import, so it's imported in the functions that use it rather than here.
+    import polars as pl
+
+T = TypeVar("T")
+
+# The most candidates scored between checks of a search's budget.
+_BATCH_SIZE = 1024
+
+# The token that cancels the searches of the running acrack, if any.
+_cancel_token: contextvars.ContextVar[Any] = contextvars.ContextVar("blaise_cancel_token", default=None)
+
+# The threads that acrack runs cracks on, shared by every event loop in the process.
+_executor: "ThreadPoolExecutor | None" = None
+_max_concurrent_cracks: int | None = None
+_executor_lock = threading.Lock()
 
 
 class Cipher(ABC):
@@ -15,30 +41,314 @@ class Cipher(ABC):
     def decrypt(self, ciphertext: str, key: Any) -> str:
         """Decrypts a string using the cipher."""
 
+    def crack_iter(self, ciphertext: str, **kwargs) -> Iterator["pl.DataFrame"]:
+        """
+        Cracks ``ciphertext`` as :meth:`crack` does, taking the same arguments, but yields the top results each
+        time they change as the search goes on. The last results yielded are the ones :meth:`crack` returns.
+        Breaking out of the loop stops the search, leaving the best results found so far.
+
+        >>> from blaise.ciphers import Vigenere
+        >>> for results in Vigenere().crack_iter("DLCFMEORCBIASTFOV", key_length=3, top_n=1):
+        ...     pass
+        >>> results["key"].to_list()
+        ['OAY']
+        """
+        return self._crack(ciphertext, stream=True, **kwargs)
+
+    async def acrack(self, ciphertext: str, **kwargs) -> "pl.DataFrame":
+        """
+        Cracks ``ciphertext`` as :meth:`crack` does, taking the same arguments, without blocking the event loop.
+        The crack runs on a pool of threads shared by every ``acrack`` in the process, and the native searches
+        release the GIL, so other tasks carry on meanwhile. By default one crack per core runs at once, and the
+        rest wait their turn, see :func:`set_max_concurrent_cracks`.
+
+        Cancelling the task stops the search at its next check, which comes between batches of candidates and
+        every thousand or so iterations of a native search, and frees its thread for the next crack.
+
+        >>> import asyncio
+        >>> from blaise.ciphers import Caesar
+        >>> asyncio.run(Caesar().acrack("EBIILTLOIA", top_n=1))["plaintext"].to_list()
+        ['HELLOWORLD']
+        """
+        return await _run_crack(functools.partial(self.crack, ciphertext, **kwargs))
+
+    def _crack(self, ciphertext: str, stream: bool, **kwargs) -> Iterator["pl.DataFrame"]:
+        """
+        Searches for the key of ``ciphertext``, yielding the top results each time they change if ``stream``, or
+        only the final results otherwise. Ciphers that can be cracked implement this, and :meth:`crack` with it.
+        """
+        raise NotImplementedError(f"{type(self).__name__} can't be cracked")
+
     def bruteforce_crack(
         self,
         ciphertext: str,
         keys: list,
         scorer: Scorer | None = None,
         top_n: int | None = None,
-    ) -> pl.DataFrame:
+        n_jobs: int = 1,
+        time_budget: float | None = None,
+        max_evaluations: int | None = None,
+    ) -> "pl.DataFrame":
         """
         A bruteforce attempt to crack a cipher by trying all keys in a list. Returns a dataframe of the
-        top n results (or all of the results if not specified), ordered by score (best first).
+        top n results (or all of the results if not specified), ordered by score (best first). Scoring
+        is spread across ``n_jobs`` threads (-1 for all cores) if the scorer supports it.
+
+        Keys are tried in order, in batches, until they run out or the budget of ``time_budget`` seconds or
+        ``max_evaluations`` keys is spent, and then the best results so far are returned.
+        """
+        budget = _Budget(time_budget, max_evaluations)
+        return next(self._bruteforce(ciphertext, keys, scorer, top_n, n_jobs, budget, stream=False))
+
+    def _bruteforce(
+        self,
+        ciphertext: str,
+        keys: Iterable,
+        scorer: Scorer | None,
+        top_n: int | None,
+        n_jobs: int,
+        budget: "_Budget",
+        stream: bool,
+    ) -> Iterator["pl.DataFrame"]:
+        import polars as pl
+
+        with _stage("normalize"):
+            ciphertext = normalize_string(ciphertext)
+        scorer = as_scorer(scorer)
+
+        def batches() -> Iterator[tuple[list, list[float]]]:
+            for batch in budget.batches(keys, _BATCH_SIZE):
+                with _stage("generate"):
+                    plaintexts = [self.decrypt(ciphertext=ciphertext, key=key) for key in batch]
+                with _stage("score"):
+                    scores = scorer.score_many(plaintexts, n_jobs=n_jobs)
+                _record_candidates(batch, plaintexts, scores)
+                yield list(zip(batch, plaintexts)), scores
+
+        def to_frame(top: list[tuple[tuple[Any, str], float]]) -> pl.DataFrame:
+            return pl.DataFrame(
+                {
+                    "key": [key for (key, _), _ in top],
+                    "plaintext": [plaintext for (_, plaintext), _ in top],
+                    "score": [score for _, score in top],
+                },
+                schema_overrides={"plaintext": pl.String, "score": pl.Float64},
+            )
+
+        yield from _collect(batches(), top_n, stream, to_frame)
+
+    def encrypt_series(self, texts: "pl.Series | list[str]", keys: Any, n_jobs: int = 1) -> "pl.Series":
+        """
+        Encrypts every text in a column. ``keys`` is either one key for every text, or a column (or list) with a
+        key for each text. Null texts or keys give null results. Ciphers with native column kernels spread the
+        work across ``n_jobs`` threads (-1 for all cores); others encrypt one text at a time.
+        """
+        return _map_texts(self.encrypt, texts, keys)
+
+    def decrypt_series(self, texts: "pl.Series | list[str]", keys: Any, n_jobs: int = 1) -> "pl.Series":
+        """
+        Decrypts every text in a column, with one key for every text or a column (or list) of a key per text.
+        See :meth:`encrypt_series`.
         """
-        df = pl.from_dict({"key": keys})
-        df = df.with_columns(
-            plaintext=pl.col("key").map_elements(
-                lambda key: self.decrypt(ciphertext=ciphertext, key=key),
-                return_dtype=pl.String,
+        return _map_texts(self.decrypt, texts, keys)
+
+
+class _Budget:
+    """
+    The limits of a search: ``time_budget`` seconds of wall time from now, and ``max_evaluations`` candidates
+    scored. Either may be ``None`` for no limit. Searches check the budget between batches of candidates, and
+    the first batch always runs, so a search always has an answer. A search run by :meth:`Cipher.acrack` also
+    stops once its task is cancelled, whose token is ``cancel``.
+    """
+
+    def __init__(self, time_budget: float | None = None, max_evaluations: int | None = None) -> None:
+        if time_budget is not None and not time_budget >= 0:
+            raise ValueError(f"time_budget must be a number of seconds, got {time_budget}")
+        if max_evaluations is not None and max_evaluations < 1:
+            raise ValueError(f"max_evaluations must be at least 1, got {max_evaluations}")
+        self.deadline = None if time_budget is None else time.monotonic() + time_budget
+        self.remaining = max_evaluations
+        self.started = False
+        self.cancel = _cancel_token.get()
+
+    def time_left(self) -> float | None:
+        """Seconds until the deadline, or ``None`` if there isn't one."""
+        return None if self.deadline is None else max(self.deadline - time.monotonic(), 0.0)
+
+    def exhausted(self) -> bool:
+        if self.cancel is not None and self.cancel.cancelled:
+            return True
+        if not self.started:
+            return False
+        return self.remaining == 0 or (self.deadline is not None and time.monotonic() >= self.deadline)
+
+    def take(self, n: int) -> int:
+        """Takes up to ``n`` evaluations from the budget, and returns how many were taken."""
+        if self.exhausted():
+            return 0
+        self.started = True
+        if self.remaining is not None:
+            n = min(n, self.remaining)
+            self.remaining -= n
+        return n
+
+    def give_back(self, n: int) -> None:
+        """Returns ``n`` evaluations that were taken but not used."""
+        if self.remaining is not None:
+            self.remaining += n
+
+    def batches(self, items: Iterable[T], size: int) -> Iterator[list[T]]:
+        """Splits ``items`` into batches of up to ``size``, until they run out or the budget is spent."""
+        items = iter(items)
+        while n := self.take(size):
+            batch = list(islice(items, n))
+            self.give_back(n - len(batch))
+            if not batch:
+                return
+            yield batch
+
+
+def set_max_concurrent_cracks(n: int | None) -> None:
+    """
+    Sets how many cracks started with :meth:`Cipher.acrack` run at once across the process, with the rest
+    waiting their turn. ``None`` restores the default of one per core. Cracks that are already running finish
+    as they were, and cracks that are waiting then start under the new limit.
+    """
+    global _executor, _max_concurrent_cracks
+
+    if n is not None and n < 1:
+        raise ValueError(f"Must allow at least one crack at once, got {n}")
+    with _executor_lock:
+        executor, _executor = _executor, None
+        _max_concurrent_cracks = n
+    if executor is not None:
+        # Waiting cracks are cancelled here, and their tasks submit them again to the new executor.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit_crack(crack: Callable[[], T]) -> "Future[T]":
+    global _executor
+
+    # Submitting holds the lock, so a crack is never submitted to an executor that's been shut down.
+    with _executor_lock:
+        if _executor is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            _executor = ThreadPoolExecutor(
+                max_workers=_max_concurrent_cracks or os.cpu_count() or 1, thread_name_prefix="blaise-crack"
             )
-        )
-        return _rank_results(df, scorer=scorer, top_n=top_n)
+        return _executor.submit(crack)
+
+
+async def _run_crack(crack: Callable[[], T]) -> T:
+    """Runs ``crack`` on the shared crack threads, and cancels its searches if the awaiting task is cancelled."""
+    import asyncio
+
+    token = _blaise.CancelToken()
+    # The crack runs in a copy of the task's context, and its stats are added to the task's once it's done.
+    context = contextvars.copy_context()
+    context.run(_cancel_token.set, token)
+    crack = functools.partial(context.run, _separately(crack))
+    task = asyncio.current_task()
+    while True:
+        future = _submit_crack(crack)
+        try:
+            return await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if future.cancelled() and task is not None and not task.cancelling():
+                # The crack was waiting its turn when the limit changed, so it waits again on the new executor.
+                continue
+            token.cancel()
+            raise
+
+
+class _TopK:
+    """
+    The ``n`` best candidates of a search, or all of them if ``n`` is ``None``, with the lowest scores first.
+    Batches of candidates are pushed into a native bounded heap, which holds only the best of them, so a search
+    keeps O(n) candidates in memory however many it scores. With ``unique``, a candidate equal to one already
+    kept is dropped.
+
+    >>> top = _TopK(2)
+    >>> top.push(["A", "B", "C"], [3.0, 1.0, 2.0])
+    True
+    >>> top.push(["D"], [5.0])
+    False
+    >>> top.items()
+    [('B', 1.0), ('C', 2.0)]
+    """
+
+    def __init__(self, n: int | None, unique: bool = False) -> None:
+        self._top = _blaise.TopK(n, unique)
+
+    def push(self, candidates: list, scores: list[float]) -> bool:
+        """Pushes candidates with their scores, and returns whether any of them are among the best so far."""
+        with _stage("rank"):
+            return self._top.push(candidates, scores)
+
+    def items(self) -> list[tuple[Any, float]]:
+        """The best candidates so far with their scores, best first, with ties in the order they were pushed."""
+        return self._top.items()
+
+    def __len__(self) -> int:
+        return len(self._top)
+
+
+def _collect(
+    batches: Iterable[tuple[list, list[float]]],
+    top_n: int | None,
+    stream: bool,
+    to_frame: Callable[[list[tuple[Any, float]]], "pl.DataFrame"],
+    unique: bool = False,
+) -> Iterator["pl.DataFrame"]:
+    """
+    Pushes batches of candidates and their scores into the ``top_n`` best so far, and yields the frame that
+    ``to_frame`` makes of them each time they change if ``stream``, or once at the end otherwise. Only the best
+    candidates are kept between batches, and only they are made into a frame.
+    """
+    top = _TopK(top_n, unique)
+    changed = False
+    for candidates, scores in batches:
+        if top.push(candidates, scores) and stream:
+            changed = True
+            with _stage("rank"):
+                frame = to_frame(top.items())
+            yield frame
+    # A stream yields at least once, even if nothing made the cut.
+    if not changed:
+        with _stage("rank"):
+            frame = to_frame(top.items())
+        yield frame
+
+
+def _map_texts(f: Callable[[str, Any], str], texts: "pl.Series | list[str]", keys: Any) -> "pl.Series":
+    import polars as pl
+
+    texts = _text_series(texts)
+    if isinstance(keys, (pl.Series, list)):
+        keys = _key_series(keys, len(texts)).to_list()
+    else:
+        keys = [keys] * len(texts)
+    results = [None if text is None or key is None else f(text, key) for text, key in zip(texts, keys)]
+    return pl.Series(texts.name, results, dtype=pl.String)
+
+
+def _text_series(texts: "pl.Series | list[str]") -> "pl.Series":
+    """Converts texts to a string column for the native column kernels, which normalize each text as they go."""
+    import polars as pl
+
+    if not isinstance(texts, pl.Series):
+        texts = pl.Series(texts, dtype=pl.String)
+    if texts.dtype != pl.String:
+        raise TypeError(f"Expected a column of strings, got {texts.dtype}")
+    return texts
+
 
+def _key_series(keys: "pl.Series | list", n_texts: int) -> "pl.Series":
+    import polars as pl
 
-def _rank_results(df: pl.DataFrame, scorer: Scorer | None = None, top_n: int | None = None):
-    scorer = as_scorer(scorer)
-    df = df.with_columns(
-        score=pl.col("plaintext").map_elements(lambda plaintext: scorer.score(plaintext), return_dtype=pl.Float64)
-    )
-    return df.bottom_k(top_n if top_n is not None else len(df), by="score")
+    if not isinstance(keys, pl.Series):
+        keys = pl.Series(keys)
+    if len(keys) != n_texts:
+        raise ValueError(f"Expected {n_texts} keys, got {len(keys)}")
+    return keys
@@ -1,5 +1,17 @@
-from blaise.ciphers.common import Cipher
-from blaise.strings import check_is_alpha, normalize_string
+import operator
+import os
+import random
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator
+
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.ciphers.common import Cipher, _Budget, _collect, _key_series, _text_series
+from blaise.instrumentation import _record_candidates, _stage
+from blaise.scores import LogProbNGramScorer, NGramScorer
+from blaise.strings import Text, check_is_alpha, normalize_string
+
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class Playfair(Cipher):
@@ -13,21 +25,31 @@ class Playfair(Cipher):
         self._fill_char = fill_char
         self._alt_fill_char = alt_fill_char
 
-    def encrypt(self, plaintext: str, key: str) -> str:
+    def key(self, key: "str | PlayfairKey") -> "PlayfairKey":
+        """
+        The key square for a keyword, which is its distinct letters in the alphabet followed by the rest of the
+        alphabet. Squares are cached, so a keyword that's used again doesn't rebuild its tables.
+
+        >>> Playfair().key("playfairexample")
+        PlayfairKey('PLAYFIREXMBCDGHKNOQSTUVWZ')
+        """
+        if isinstance(key, PlayfairKey):
+            return key
+        return _square_key(_to_key(key, self._alphabet))
+
+    def encrypt(self, plaintext: str, key: "str | PlayfairKey") -> Text:
         """
         Encrypts using the Playfair cipher.
 
         >>> Playfair().encrypt("hide the gold in the tree stump", "playfairexample")
         'BMODZBXDNABEKUDMUIXMMOUVIF'
         """
-        key = _to_key(key, self._alphabet)
+        key = self.key(key)
         plaintext = normalize_string(plaintext).replace(self._missing_letter, self._missing_letter_replacement)
-        return _playfair_encrypt(
-            _to_bigrams(plaintext, fill_char=self._fill_char, alt_fill_char=self._alt_fill_char),
-            key,
-        )
+        bigrams = _to_bigrams(plaintext, fill_char=self._fill_char, alt_fill_char=self._alt_fill_char)
+        return Text._trusted(key.encrypt("".join(map("".join, bigrams))))
 
-    def decrypt(self, ciphertext: str, key: str, remove_fill=False) -> str:
+    def decrypt(self, ciphertext: str, key: "str | PlayfairKey", remove_fill=False) -> Text:
         """
         Decrypts using the Playfair cipher. Will fail if:
         - Any bigram is a repeat
@@ -44,35 +66,275 @@ class Playfair(Cipher):
         'HIDETHEGOLDINTHETREESTUMP'
 
         """
-        key = _to_key(key, self._alphabet)
+        key = self.key(key)
         ciphertext = normalize_string(ciphertext)
         if len(ciphertext) % 2 != 0:
             raise ValueError(f"Requires even length ciphertext: {ciphertext}")
 
-        # Reverse the key - it's equivalent to decrypting
-        plaintext = _playfair_encrypt(zip(ciphertext[::2], ciphertext[1::2]), key[::-1])
+        plaintext = key.decrypt(ciphertext)
         if remove_fill:
             plaintext = _remove_fill(plaintext, fill_char=self._fill_char, alt_fill_char=self._alt_fill_char)
 
-        return plaintext
+        return Text._trusted(plaintext)
 
+    def encrypt_series(self, texts: "pl.Series | list[str]", keys: "str | pl.Series | list[str]", n_jobs: int = 1):
+        """
+        Encrypts every text in a column natively. ``keys`` is one key for every text, or a column (or list) of
+        a key per text. Null texts or keys give nulls.
 
-def _playfair_encrypt(bigrams, key) -> str:
-    result = []
-    for c1, c2 in bigrams:
-        if c1 == c2:
-            raise ValueError(f"No repeated letter bigrams allowed: {c1, c2}")
-        i1 = key.find(c1)
-        i2 = key.find(c2)
-        if i1 < 0 or i2 < 0:
-            raise ValueError(f"Character not in key: {c1, c2} not in {key}")
-        x1, y1 = _index_to_xy(i1)
-        x2, y2 = _index_to_xy(i2)
-        x1, y1, x2, y2 = _exchange_xy(x1, y1, x2, y2)
-        result.append(key[x1 + 5 * y1])
-        result.append(key[x2 + 5 * y2])
+        >>> Playfair().encrypt_series(["hide the gold in the tree stump"], "playfairexample").to_list()
+        ['BMODZBXDNABEKUDMUIXMMOUVIF']
+        """
+        return self._apply_series(texts, keys, decrypt=False, n_jobs=n_jobs)
 
-    return "".join(result)
+    def decrypt_series(self, texts: "pl.Series | list[str]", keys: "str | pl.Series | list[str]", n_jobs: int = 1):
+        """
+        Decrypts every text in a column natively, failing on the same texts as :meth:`decrypt`. Fill characters
+        are left in place.
+
+        >>> Playfair().decrypt_series(["BMODZBXDNABEKUDMUIXMMOUVIF"], "playfairexample").to_list()
+        ['HIDETHEGOLDINTHETREXESTUMP']
+        """
+        return self._apply_series(texts, keys, decrypt=True, n_jobs=n_jobs)
+
+    def _apply_series(self, texts, keys, decrypt: bool, n_jobs: int) -> "pl.Series":
+        import polars as pl
+
+        texts = _text_series(texts)
+        if isinstance(keys, (pl.Series, list)):
+            keys = _key_series(keys, len(texts)).cast(pl.String).str.to_uppercase()
+        else:
+            check_is_alpha(keys)
+            keys = keys.upper()
+        column = _blaise.playfair_column(
+            texts,
+            keys,
+            "".join(self._alphabet),
+            self._missing_letter,
+            self._missing_letter_replacement,
+            self._fill_char,
+            self._alt_fill_char,
+            decrypt,
+            n_jobs=n_jobs,
+        )
+        return pl.Series(column).alias(texts.name)
+
+    def crack(
+        self,
+        ciphertext: str,
+        n_restarts: int = 10,
+        n_iters: int = 50_000,
+        seed: int | None = None,
+        temperature: float = 0.03,
+        scorer: NGramScorer | LogProbNGramScorer | None = None,
+        top_n: int | None = None,
+        n_jobs: int = 1,
+        time_budget: float | None = None,
+        max_evaluations: int | None = None,
+    ) -> "pl.DataFrame":
+        """
+        Cracks a Playfair cipher with a native simulated annealing search over key squares.
+
+        Parameters
+        ----------
+        ciphertext : str
+            The ciphertext to crack. Needs to be a few hundred letters long for reliable results.
+        n_restarts : int, optional
+            Number of independent searches, each starting from a random key square.
+        n_iters : int, optional
+            Number of key mutations tried in each search.
+        seed : int, optional
+            Seed for the random number generator, for reproducible searches.
+        temperature : float, optional
+            Starting temperature of the annealing schedule, which falls linearly to zero.
+            Worse keys are accepted with probability ``exp(-score_increase / temperature)``,
+            so zero gives plain hill climbing.
+        scorer : NGramScorer | LogProbNGramScorer, optional
+            Scorer used to evaluate decrypts. Must be an n-gram scorer, as the search runs natively.
+            Defaults to trigram Bhattacharyya distance against ``en_wiki``. The temperature needs
+            to suit the scale of the scorer's scores.
+        top_n : int, optional
+            Number of top results to return. Each restart contributes its best key.
+        n_jobs : int, optional
+            Number of threads to run restarts on (-1 for all cores). Results don't depend on this.
+        time_budget : float, optional
+            Seconds to search for. Once the time is up, running restarts stop with their best key so far and
+            the rest are skipped.
+        max_evaluations : int, optional
+            The maximum number of keys to score, counting ``n_iters + 1`` for each full restart. The last
+            restart is cut short to fit.
+
+        Returns
+        -------
+        polars.DataFrame
+            Columns ``key`` (the 25 letter key square), ``plaintext`` and ``score``, best first.
+        """
+        return next(
+            self._crack(
+                ciphertext,
+                False,
+                n_restarts,
+                n_iters,
+                seed,
+                temperature,
+                scorer,
+                top_n,
+                n_jobs,
+                time_budget,
+                max_evaluations,
+            )
+        )
+
+    def _crack(
+        self,
+        ciphertext: str,
+        stream: bool,
+        n_restarts: int = 10,
+        n_iters: int = 50_000,
+        seed: int | None = None,
+        temperature: float = 0.03,
+        scorer: NGramScorer | LogProbNGramScorer | None = None,
+        top_n: int | None = None,
+        n_jobs: int = 1,
+        time_budget: float | None = None,
+        max_evaluations: int | None = None,
+    ) -> Iterator["pl.DataFrame"]:
+        import polars as pl
+
+        budget = _Budget(time_budget, max_evaluations)
+        with _stage("normalize"):
+            ciphertext = normalize_string(ciphertext).replace(self._missing_letter, self._missing_letter_replacement)
+        if len(ciphertext) % 2 != 0:
+            raise ValueError(f"Requires even length ciphertext: {ciphertext}")
+        if any(c1 == c2 for c1, c2 in zip(ciphertext[::2], ciphertext[1::2])):
+            raise ValueError(f"Playfair ciphertext cannot contain repeated letter bigrams: {ciphertext}")
+        if scorer is None:
+            scorer = NGramScorer(3, "en_wiki")
+        elif not isinstance(scorer, (NGramScorer, LogProbNGramScorer)):
+            raise TypeError(f"Playfair cracking requires an n-gram scorer, got {type(scorer)}")
+        if seed is None:
+            seed = random.getrandbits(64)
+        # Restarts run a batch at a time, one per thread, and the budget is checked between batches.
+        batch_size = n_jobs if n_jobs > 0 else os.cpu_count() or 1
+
+        def anneal(first_restart: int, n_restarts: int, n_iters: int) -> tuple[list[str], list[float]]:
+            with _stage("search"):
+                results = _blaise.playfair_anneal(
+                    ciphertext,
+                    "".join(self._alphabet),
+                    scorer._rs_dist,
+                    n_restarts,
+                    n_iters,
+                    temperature,
+                    # Restart i of a search is seeded with seed + i, so batches continue the same search.
+                    (seed + first_restart) % 2**64,
+                    n_jobs=n_jobs,
+                    time_limit=budget.time_left(),
+                    cancel=budget.cancel,
+                )
+                keys = [key for key, _ in results]
+                scores = [score for _, score in results]
+                _record_candidates(keys, scores)
+                return keys, scores
+
+        def batches() -> Iterator[tuple[list[str], list[float]]]:
+            restart = 0
+            while restart < n_restarts:
+                n_evaluations = budget.take(min(batch_size, n_restarts - restart) * (n_iters + 1))
+                if not n_evaluations:
+                    return
+                n_full, rest = divmod(n_evaluations, n_iters + 1)
+                if n_full:
+                    yield anneal(restart, n_full, n_iters)
+                    restart += n_full
+                if rest:
+                    yield anneal(restart, 1, rest - 1)
+                    restart += 1
+
+        def to_frame(top: list[tuple[str, float]]) -> pl.DataFrame:
+            return pl.DataFrame(
+                {
+                    "key": [key for key, _ in top],
+                    "plaintext": [self.decrypt(ciphertext, key) for key, _ in top],
+                    "score": [score for _, score in top],
+                },
+                schema={"key": pl.String, "plaintext": pl.String, "score": pl.Float64},
+            )
+
+        # Restarts that end on the same key are only kept once.
+        return _collect(batches(), top_n, stream, to_frame, unique=True)
+
+
+class PlayfairKey:
+    """
+    A Playfair key square of 25 letters, read row by row, with the substitution of every digraph worked out
+    once. Encrypting or decrypting is then one lookup per digraph, so a key that's used many times only pays
+    for building its tables once. Texts must already be split into digraphs of distinct letters, as
+    :meth:`Playfair.encrypt` does.
+
+    >>> key = PlayfairKey("PLAYFIREXMBCDGHKNOQSTUVWZ")
+    >>> key.encrypt("HIDETHEGOLDINTHETREXESTUMP")
+    'BMODZBXDNABEKUDMUIXMMOUVIF'
+    >>> key.decrypt("BMODZBXDNABEKUDMUIXMMOUVIF")
+    'HIDETHEGOLDINTHETREXESTUMP'
+    """
+
+    __slots__ = ("square", "_encrypt_table", "_decrypt_table")
+
+    def __init__(self, square: str):
+        if len(square) != 25 or len(set(square)) != 25:
+            raise ValueError(f"A key square must have 25 distinct letters: {square}")
+        self.square = square
+        positions = [divmod(i, 5) for i in range(25)]
+        self._encrypt_table: dict[str, str] = {}
+        for a, (row1, col1) in zip(square, positions):
+            for b, (row2, col2) in zip(square, positions):
+                if a == b:
+                    continue
+                if row1 == row2:
+                    # Same row: each letter moves one to the right.
+                    cell1, cell2 = 5 * row1 + (col1 + 1) % 5, 5 * row2 + (col2 + 1) % 5
+                elif col1 == col2:
+                    # Same column: each letter moves one down.
+                    cell1, cell2 = 5 * ((row1 + 1) % 5) + col1, 5 * ((row2 + 1) % 5) + col2
+                else:
+                    # Rectangle: each letter takes the other's column.
+                    cell1, cell2 = 5 * row1 + col2, 5 * row2 + col1
+                self._encrypt_table[a + b] = square[cell1] + square[cell2]
+        self._decrypt_table = {v: k for k, v in self._encrypt_table.items()}
+
+    def __repr__(self) -> str:
+        return f"PlayfairKey({self.square!r})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, PlayfairKey) and self.square == other.square
+
+    def __hash__(self) -> int:
+        return hash(self.square)
+
+    def encrypt(self, text: str) -> str:
+        """Encrypts text of an even number of letters, none of its digraphs a repeated letter."""
+        return self._substitute(text, self._encrypt_table)
+
+    def decrypt(self, text: str) -> str:
+        """Decrypts text of an even number of letters, none of its digraphs a repeated letter."""
+        return self._substitute(text, self._decrypt_table)
+
+    def _substitute(self, text: str, table: dict[str, str]) -> str:
+        if len(text) % 2 != 0:
+            raise ValueError(f"Requires even length text: {text}")
+        try:
+            return "".join(map(table.__getitem__, map(operator.add, text[::2], text[1::2])))
+        except KeyError as e:
+            c1, c2 = e.args[0]
+            if c1 == c2:
+                raise ValueError(f"No repeated letter bigrams allowed: {c1, c2}") from None
+            raise ValueError(f"Character not in key: {c1, c2} not in {self.square}") from None
+
+
+@lru_cache(1024)
+def _square_key(square: str) -> PlayfairKey:
+    return PlayfairKey(square)
 
 
 def _to_key(key: str, alphabet) -> str:
@@ -89,19 +351,6 @@ def _to_key(key: str, alphabet) -> str:
     return "".join(result + sorted(unseen))
 
 
-def _index_to_xy(i):
-    return i % 5, i // 5
-
-
-def _exchange_xy(x1, y1, x2, y2):
-    if x1 == x2:
-        return x1, (y1 + 1) % 5, x2, (y2 + 1) % 5
-    elif y1 == y2:
-        return (x1 + 1) % 5, y1, (x2 + 1) % 5, y2
-    else:
-        return x2, y1, x1, y2
-
-
 def _to_bigrams(string: str, fill_char: str = "X", alt_fill_char: str = "Q") -> list[tuple[str, str]]:
     """
     Converts string into bigrams. The bigrams cannot be repeated letters. If they are
@@ -1,14 +1,19 @@
-from itertools import zip_longest
-from typing import Iterable
+from itertools import islice
+from typing import TYPE_CHECKING, Iterable, Iterator
 
-import polars as pl
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.analysis import rank_key_lengths
+from blaise.instrumentation import _record_candidates, _stage
+from blaise.iterators import product_score_ordered
+from blaise.scores import LogProbNGramScorer, NGramScorer, as_scorer
+from blaise.scores.base import Scorer
+from blaise.strings import Text, check_is_alpha, normalize_string
 
-from blaise.iterators import product_index_ordered
-from blaise.scores import NGramScorer
-from blaise.strings import check_is_alpha, normalize_string
+from .caesar import Caesar, _shift
+from .common import _BATCH_SIZE, Cipher, _Budget, _collect, _key_series, _text_series
 
-from . import Caesar
-from .common import Cipher, _rank_results
+if TYPE_CHECKING:
+    import polars as pl
 
 
 class Vigenere(Cipher):
@@ -17,7 +22,7 @@ class Vigenere(Cipher):
     Wikipedia page: https://en.wikipedia.org/wiki/Vigen%C3%A8re_cipher.
     """
 
-    def encrypt(self, plaintext: str, key: str) -> str:
+    def encrypt(self, plaintext: str, key: str) -> Text:
         """Encrypt ``plaintext`` using the Vigenère cipher.
 
         Parameters
@@ -31,7 +36,7 @@ class Vigenere(Cipher):
 
         Returns
         -------
-        str
+        Text
             The ciphertext produced by applying the Vigenère shift to each
             alphabetic character of ``plaintext``.
 
@@ -41,21 +46,9 @@ class Vigenere(Cipher):
         >>> Vigenere().encrypt("HELLO", "FOO")
         'MSZQC'
         """
-        key = _to_key(key)
-        plaintext = normalize_string(plaintext)
+        return _shift(normalize_string(plaintext), [ord(c) - ord("A") for c in _to_key(key)])
 
-        result = []
-        key_len = len(key)
-        key_index = 0
-
-        for ch in plaintext:
-            shift = ord(key[key_index % key_len]) - ord("A")
-            result.append(chr(ord("A") + (ord(ch) - ord("A") + shift) % 26))
-            key_index += 1
-
-        return "".join(result)
-
-    def decrypt(self, ciphertext: str, key: str) -> str:
+    def decrypt(self, ciphertext: str, key: str) -> Text:
         """Decrypt ``ciphertext`` that was encrypted with the Vigenère cipher.
 
         Parameters
@@ -69,7 +62,7 @@ class Vigenere(Cipher):
 
         Returns
         -------
-        str
+        Text
             The original plaintext recovered from ``ciphertext``.
 
         Examples
@@ -78,19 +71,45 @@ class Vigenere(Cipher):
         >>> Vigenere().decrypt("MSZQC", "FOO")
         'HELLO'
         """
-        key = _to_key(key)
-        ciphertext = normalize_string(ciphertext)
+        return _shift(normalize_string(ciphertext), [ord("A") - ord(c) for c in _to_key(key)])
+
+    def encrypt_series(self, texts: "pl.Series | list[str]", keys: "str | pl.Series | list[str]", n_jobs: int = 1):
+        """
+        Encrypts every text in a column natively, normalizing and shifting each text in a single pass.
+
+        Parameters
+        ----------
+        texts:
+            The texts to encrypt, as a polars string Series or a list.
+        keys:
+            One key for every text, or a column (or list) with a key for each text. Keys must consist only of
+            alphabetic characters.
+        n_jobs:
+            Number of threads to encrypt on (-1 for all cores).
 
-        result = []
-        key_len = len(key)
-        key_index = 0
+        Returns
+        -------
+        polars.Series
+            The ciphertexts, with the name of ``texts``. Null texts or keys give nulls.
+
+        Examples
+        --------
 
-        for ch in ciphertext:
-            shift = ord(key[key_index % key_len]) - ord("A")
-            result.append(chr(ord("A") + (ord(ch) - ord("A") - shift) % 26))
-            key_index += 1
+        >>> Vigenere().encrypt_series(["HELLO", "hello world"], "FOO").to_list()
+        ['MSZQC', 'MSZQCKTFZI']
+        """
+        return _shift_series(texts, keys, decrypt=False, n_jobs=n_jobs)
 
-        return "".join(result)
+    def decrypt_series(self, texts: "pl.Series | list[str]", keys: "str | pl.Series | list[str]", n_jobs: int = 1):
+        """Decrypt every text in a column. See :meth:`encrypt_series`.
+
+        Examples
+        --------
+
+        >>> Vigenere().decrypt_series(["MSZQC", "MSZQC"], ["FOO", "ABC"]).to_list()
+        ['HELLO', 'MRXQB']
+        """
+        return _shift_series(texts, keys, decrypt=True, n_jobs=n_jobs)
 
     def crack(
         self,
@@ -100,7 +119,11 @@ class Vigenere(Cipher):
         n_trials: int = 1000,
         scorer=None,
         dist="en_wiki",
-    ) -> pl.DataFrame:
+        n_key_lengths: int | None = None,
+        n_jobs: int = 1,
+        time_budget: float | None = None,
+        max_evaluations: int | None = None,
+    ) -> "pl.DataFrame":
         """
         Cracks a Vigenère cipher.
 
@@ -125,6 +148,20 @@ class Vigenere(Cipher):
             The scorer to use for assessing the quality of the output
             plaintext.
         dist: The frequency distribution to use for scoring the Caesar step.
+        n_key_lengths : int, optional
+            If given, the key lengths are first ranked with
+            :func:`blaise.analysis.rank_key_lengths` and only the best
+            ``n_key_lengths`` of them are searched. This makes it cheap to
+            consider a wide range of key lengths.
+        n_jobs : int, optional
+            Number of threads to decrypt and score candidate keys on (-1 for
+            all cores).
+        time_budget : float, optional
+            Seconds to search for. Keys are scored in batches, and once the
+            time is up the best results so far are returned.
+        max_evaluations : int, optional
+            The maximum number of candidate keys to score across all key
+            lengths, on top of the ``n_trials`` limit for each.
 
         Returns
         -------
@@ -140,9 +177,10 @@ class Vigenere(Cipher):
         interleaved subsequences and cracking each subsequence with a
         Caesar-cipher cracker.  The resulting candidate keys are then
         combined using a Cartesian product to form full Vigenère keys
-        in order of likelihood based on frequency analysis of each
-        interleaved Caesar shift. The search is truncated after
-        ``n_trials`` combinations to keep runtime reasonable for long keys.
+        in increasing order of the summed letter frequency scores of
+        their interleaved Caesar shifts, so the most likely keys are
+        tried first. The search is truncated after ``n_trials``
+        combinations to keep runtime reasonable for long keys.
 
         Examples
         --------
@@ -163,38 +201,104 @@ class Vigenere(Cipher):
         │ OEY ┆ PHERIGANENECEPHAR ┆ 1.158325 │
         └─────┴───────────────────┴──────────┘
         """
-        vigenere_results = []
-        if not isinstance(key_length, int):
-            for key_len in key_length:
-                vigenere_results += self.crack(
-                    ciphertext,
-                    key_len,
-                    top_n=top_n,
-                    scorer=scorer,
-                    n_trials=n_trials,
-                    dist=dist,
-                ).to_dicts()
-        else:
-            caesar_results = []
-            for i in range(key_length):
-                subsec = ciphertext[i::key_length]
-                # Note ngram here is 1 because the sections are not contiguous - only letter freqs are usable.
-                caesar_results.append(Caesar().crack(subsec, scorer=NGramScorer(n=1, expected=dist)).to_dicts())
-
-            for combo in product_index_ordered(*caesar_results):
-                plaintext = "".join(
-                    sum(
-                        zip_longest(*[res["plaintext"] for res in combo], fillvalue=""),
-                        (),
-                    )
-                )
-                key = "".join(chr(ord("A") + res["key"]) for res in combo)
-                vigenere_results.append({"key": key, "plaintext": plaintext})
-                if len(vigenere_results) > n_trials:
-                    break
-
-        df = pl.from_dicts(vigenere_results)
-        return _rank_results(df, scorer=scorer, top_n=top_n)
+        return next(
+            self._crack(
+                ciphertext,
+                False,
+                key_length,
+                top_n,
+                n_trials,
+                scorer,
+                dist,
+                n_key_lengths,
+                n_jobs,
+                time_budget,
+                max_evaluations,
+            )
+        )
+
+    def _crack(
+        self,
+        ciphertext: str,
+        stream: bool,
+        key_length: int | Iterable[int] = range(3, 8),
+        top_n=10,
+        n_trials: int = 1000,
+        scorer=None,
+        dist="en_wiki",
+        n_key_lengths: int | None = None,
+        n_jobs: int = 1,
+        time_budget: float | None = None,
+        max_evaluations: int | None = None,
+    ) -> Iterator["pl.DataFrame"]:
+        import polars as pl
+
+        budget = _Budget(time_budget, max_evaluations)
+        with _stage("normalize"):
+            ciphertext = normalize_string(ciphertext)
+        scorer = as_scorer(scorer)
+        key_lengths = [key_length] if isinstance(key_length, int) else list(key_length)
+        if n_key_lengths is not None:
+            with _stage("key_lengths"):
+                ranked = rank_key_lengths(ciphertext, key_lengths, dist=dist)
+                key_lengths = ranked.head(n_key_lengths)["key_length"].to_list()
+        # Note ngram here is 1 because the sections are not contiguous - only letter freqs are usable.
+        caesar_scorer = NGramScorer(n=1, expected=dist)
+
+        def batches() -> Iterator[tuple[list[str], list[float]]]:
+            for key_len in key_lengths:
+                if budget.exhausted():
+                    return
+                with _stage("generate"):
+                    caesar_keys = [
+                        Caesar().crack(ciphertext[i::key_len], scorer=caesar_scorer).select("key", "score").rows()
+                        for i in range(key_len)
+                    ]
+                combos = islice(product_score_ordered(*caesar_keys), n_trials)
+                keys = budget.batches(("".join(chr(ord("A") + k) for k in combo) for combo, _ in combos), _BATCH_SIZE)
+                while True:
+                    with _stage("generate"):
+                        batch = next(keys, None)
+                    if batch is None:
+                        break
+                    with _stage("score"):
+                        scores = _score_keys(ciphertext, batch, scorer, n_jobs=n_jobs)
+                    _record_candidates(batch, scores)
+                    yield batch, scores
+
+        def to_frame(top: list[tuple[str, float]]) -> pl.DataFrame:
+            # Plaintexts are only built for the keys that make the cut.
+            return pl.DataFrame(
+                {
+                    "key": [key for key, _ in top],
+                    "plaintext": [self.decrypt(ciphertext, key) for key, _ in top],
+                    "score": [score for _, score in top],
+                },
+                schema={"key": pl.String, "plaintext": pl.String, "score": pl.Float64},
+            )
+
+        yield from _collect(batches(), top_n, stream, to_frame)
+
+
+def _score_keys(ciphertext: str, keys: list[str], scorer: Scorer, n_jobs: int = 1) -> list[float]:
+    """
+    Scores the decrypts of a normalized ciphertext under each key. N-gram scorers decrypt and score natively
+    in one pass, without building the plaintexts.
+    """
+    if isinstance(scorer, (NGramScorer, LogProbNGramScorer)):
+        return _blaise.vigenere_score_keys(ciphertext.encode("ascii"), keys, scorer._rs_dist, n_jobs=n_jobs)
+    return scorer.score_many((Vigenere().decrypt(ciphertext, key) for key in keys), n_jobs=n_jobs)
+
+
+def _shift_series(texts, keys, decrypt: bool, n_jobs: int) -> "pl.Series":
+    import polars as pl
+
+    texts = _text_series(texts)
+    if isinstance(keys, (pl.Series, list)):
+        keys = _key_series(keys, len(texts)).cast(pl.String).str.to_uppercase()
+    else:
+        keys = _to_key(keys)
+    return pl.Series(_blaise.shift_column(texts, keys, decrypt, n_jobs=n_jobs)).alias(texts.name)
 
 
 def _to_key(k: str) -> str:
@@ -1,27 +1,48 @@
 import glob
+import hashlib
 import json
 import os
+import shutil
 from functools import lru_cache
-from typing import Any
+from typing import Any, Callable
 
 BUILT_IN_DATA_PATH = os.path.abspath(os.path.dirname(__file__))
 USER_DATA_PATH = os.environ.get("BLAISE_DATA_PATH", os.path.join(os.path.expanduser("~"), ".blaise", "data"))
 
+# Native state derived from data items is cached under this folder of USER_DATA_PATH. Bump the version when a
+# cached file format changes.
+_CACHE_DIR = "cache"
+_CACHE_VERSION = 1
+
+# The hash of each data file this process has read, by its path, size and modification time.
+_digests: dict[tuple[str, int, int], str] = {}
+
+
+def find_data_path(data_type: str, data_name: str, extension: str = "json") -> str:
+    """
+    Searches the built in and user defined paths for a data file and returns its path. The built in path takes
+    precedence.
+    """
+    for path in [
+        os.path.join(BUILT_IN_DATA_PATH, data_type, f"{data_name}.{extension}"),
+        user_data_path(data_type, data_name, extension),
+    ]:
+        if os.path.exists(path):
+            return path
+    raise FileNotFoundError(f"No data file found for {data_type}/{data_name}")
+
+
+def user_data_path(data_type: str, data_name: str, extension: str = "json") -> str:
+    return os.path.join(USER_DATA_PATH, data_type, f"{data_name}.{extension}")
+
 
 @lru_cache(10000)
 def load_data(data_type: str, data_name: str) -> Any:
     """
     Searches the built in and user defined paths for a data item and returns it. The built in path takes precedence.
     """
-    built_in_path = os.path.join(BUILT_IN_DATA_PATH, data_type, f"{data_name}.json")
-    user_path = os.path.join(USER_DATA_PATH, data_type, f"{data_name}.json")
-    if os.path.exists(built_in_path):
-        with open(built_in_path, "r") as f:
-            return json.load(f)
-    elif os.path.exists(user_path):
-        with open(user_path, "r") as f:
-            return json.load(f)
-    raise FileNotFoundError(f"No data file found for {data_type}/{data_name}")
+    with open(find_data_path(data_type, data_name), "r") as f:
+        return json.load(f)
 
 
 def save_data(data: Any, data_type: str, data_name: str, save_to_built_in=False):
@@ -34,7 +55,7 @@ def save_data(data: Any, data_type: str, data_name: str, save_to_built_in=False)
     elif os.path.exists(built_in_path):
         raise ValueError(f"Cannot overwrite a built in data item {data_type}/{data_name}")
     else:
-        path = os.path.join(USER_DATA_PATH, data_type, f"{data_name}.json")
+        path = user_data_path(data_type, data_name)
 
     os.makedirs(os.path.dirname(path), exist_ok=True)
     with open(path, "w") as f:
@@ -42,6 +63,106 @@ def save_data(data: Any, data_type: str, data_name: str, save_to_built_in=False)
     load_data.cache_clear()
 
 
+def cache_path(data_type: str, data_name: str, extension: str, **params: Any) -> str:
+    """
+    Returns the path in the cache for native state derived from a JSON data item and ``params``. The path
+    contains a hash of the data item's contents and the parameters, so a cached file is only found while the
+    data it was built from is unchanged, whichever process built it. Raises ``FileNotFoundError`` if the data
+    item doesn't exist.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    h.update(_digest(data_type, data_name).encode())
+    h.update(json.dumps([_CACHE_VERSION, extension, params], sort_keys=True).encode())
+    return os.path.join(USER_DATA_PATH, _CACHE_DIR, data_type, f"{data_name}.{h.hexdigest()}.{extension}")
+
+
+def _digest(data_type: str, data_name: str) -> str:
+    """
+    The hash of a data item's contents. Hashing reads the whole file, so the hash is saved to the cache with
+    the file's size and modification time, and the file is only read again once either of them changes.
+    """
+    path = find_data_path(data_type, data_name)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+    if key in _digests:
+        return _digests[key]
+    saved_path = os.path.join(USER_DATA_PATH, _CACHE_DIR, data_type, f"{data_name}.digest")
+    try:
+        with open(saved_path) as f:
+            saved = json.load(f)
+        digest = saved["digest"] if [saved["path"], saved["size"], saved["mtime_ns"]] == list(key) else None
+    except (OSError, ValueError, KeyError, TypeError):
+        digest = None
+    if digest is None:
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+        try:
+            os.makedirs(os.path.dirname(saved_path), exist_ok=True)
+            tmp_path = f"{saved_path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "digest": digest}, f)
+            os.replace(tmp_path, saved_path)
+        except OSError:
+            # Like the rest of the cache, the saved hash is only an optimization.
+            pass
+    _digests[key] = digest
+    return digest
+
+
+def load_cached(
+    data_type: str, data_name: str, extension: str, build: Callable[[], Any], load: Callable[[str], Any], **params: Any
+) -> Any:
+    """
+    Loads native state derived from a JSON data item from the cache with ``load(path)``. If it isn't cached,
+    ``build()`` makes it (creating the data item if needed) and it is saved with :func:`save_cached` first.
+    The cache is only an optimization, so if it can't be written, such as when the user data folder is read
+    only, the state that was built is returned as it is.
+    """
+    try:
+        path = cache_path(data_type, data_name, extension, **params)
+    except FileNotFoundError:
+        path = None
+    if path is not None and os.path.exists(path):
+        try:
+            return load(path)
+        except OSError:
+            # A corrupt cache file is rebuilt.
+            pass
+    data = build()
+    try:
+        path = save_cached(data, data_type, data_name, extension, **params)
+    except OSError:
+        return data
+    return load(path)
+
+
+def save_cached(data: Any, data_type: str, data_name: str, extension: str, **params: Any) -> str:
+    """
+    Saves a native object with a ``write(path)`` method, such as an n-gram table, to the cache for the data
+    item it was derived from, and returns its path. It's written to a temporary file and moved into place, so
+    other processes never read a partial file.
+    """
+    path = cache_path(data_type, data_name, extension, **params)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        data.write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def clear_cache() -> None:
+    """
+    Deletes everything in the cache of derived native state. Cached files are never removed otherwise, so
+    files built from old versions of a data item stay until the cache is cleared.
+    """
+    shutil.rmtree(os.path.join(USER_DATA_PATH, _CACHE_DIR), ignore_errors=True)
+
+
 def list_data(data_type: str, data_name: str = "*") -> list[str]:
     """
     List available data items in a given data type. `data_name` is a glob search string (excl extension)
@@ -3,8 +3,6 @@
 import tarfile
 from io import BytesIO
 
-import requests
-
 from blaise.data.core import load_data, save_data
 
 _DATA_TYPE = "corpus"
@@ -38,6 +36,8 @@ def save_corpus(data: str, name: str):
 
 
 def download_en_wiki() -> str:
+    import requests
+
     print("Downloading en_wiki")
     req = requests.get("https://github.com/LGDoor/Dump-of-Simple-English-Wiki/raw/refs/heads/master/corpus.tgz")
     req.raise_for_status()
@@ -0,0 +1,68 @@
+"""Builds n-gram and word distributions from corpora too large to load into memory"""
+
+import codecs
+import tarfile
+from typing import IO, Iterable, Iterator
+
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.data.ngram import save_ngram_dist, save_ngram_table
+from blaise.data.worddist import save_word_dist
+
+_CHUNK_SIZE = 1 << 20
+
+
+def iter_text_chunks(path: str, chunk_size: int = _CHUNK_SIZE) -> Iterator[str]:
+    """
+    Reads a UTF-8 text file, or every file in a tar archive (optionally compressed), in chunks decoded from up
+    to ``chunk_size`` bytes. Archives are read as a stream, so neither the archive nor any file in it is
+    loaded into memory at once.
+    """
+    if tarfile.is_tarfile(path):
+        with tarfile.open(path, "r|*") as archive:
+            for member in archive:
+                f = archive.extractfile(member) if member.isfile() else None
+                if f is not None:
+                    yield from _read_chunks(f, chunk_size)
+    else:
+        with open(path, "rb") as f:
+            yield from _read_chunks(f, chunk_size)
+
+
+def _read_chunks(f: IO[bytes], chunk_size: int) -> Iterator[str]:
+    # The decoder holds on to characters split across chunks.
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    while data := f.read(chunk_size):
+        yield decoder.decode(data)
+    # Separate files so that the last word of one isn't joined to the first word of the next.
+    yield decoder.decode(b"", final=True) + "\n"
+
+
+def count_corpus(sources: str | Iterable[str], max_n: int = 3, count_words: bool = True, chunk_size: int = _CHUNK_SIZE):
+    """
+    Counts the n-grams for n from 1 to ``max_n``, and the words, of the text files and tar archives in
+    ``sources`` in a single streaming pass. Text is normalized chunk by chunk as in
+    :func:`blaise.strings.normalize_string`, and counted natively. Returns the native counter, whose
+    ``ngram_dist(n)`` and ``word_counts()`` give the results.
+    """
+    counter = _blaise.CorpusCounter(max_n, count_words=count_words)
+    for source in [sources] if isinstance(sources, str) else sources:
+        for chunk in iter_text_chunks(source, chunk_size):
+            counter.update(chunk.encode())
+    return counter
+
+
+def ingest_corpus(sources: str | Iterable[str], name: str, max_n: int = 3, chunk_size: int = _CHUNK_SIZE) -> None:
+    """
+    Builds the n-gram distributions for n from 1 to ``max_n`` and the word distribution of a corpus with
+    :func:`count_corpus`, and saves them under ``name``. Memory use depends on the number of distinct n-grams
+    and words, not on the size of the corpus.
+    """
+    counter = count_corpus(sources, max_n, chunk_size=chunk_size)
+    for n in range(1, max_n + 1):
+        table = counter.ngram_dist(n)
+        save_ngram_dist(table.to_dict(), name, n)
+        if n <= _blaise.MAX_TABLE_N:
+            save_ngram_table(table, name, n)
+    word_counts = counter.word_counts()
+    total = sum(word_counts.values())
+    save_word_dist({word: count / total for word, count in word_counts.items()}, name)
@@ -1,12 +1,16 @@
-from blaise.data.core import load_data, save_data
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.data.core import load_cached, load_data, save_cached, save_data
 from blaise.data.corpus import load_corpus
 from blaise.strings import normalize_string
 from blaise.strings.ngram import calculate_ngrams
 
+_DATA_TYPE = "ngram_dist"
+_TABLE_EXTENSION = "bin"
+
 
 def load_ngram_dist(name: str, n: int) -> dict[str, float]:
     try:
-        return load_data("ngram_dist", f"{name}_{n}")
+        return load_data(_DATA_TYPE, f"{name}_{n}")
     except FileNotFoundError:
         # Attempt to calculate from corpus.
         corpus = normalize_string(load_corpus(name))
@@ -18,4 +22,38 @@ def load_ngram_dist(name: str, n: int) -> dict[str, float]:
 
 
 def save_ngram_dist(dist, name: str, n: int, **kwargs):
-    save_data(dist, "ngram_dist", f"{name}_{n}", **kwargs)
+    save_data(dist, _DATA_TYPE, f"{name}_{n}", **kwargs)
+
+
+def load_ngram_table(name: str, n: int):
+    """
+    Loads an n-gram distribution as a native table for the n-gram scorers, without building a python dict.
+
+    The table is memory mapped from a binary file of one float per possible n-gram, so loading takes the same
+    time however big the table is, and the OS shares its pages between processes. The file is built from the
+    JSON distribution the first time it's loaded, and cached in the user data folder under a hash of the JSON,
+    so later processes skip parsing it. JSON remains the format for exchanging distributions:
+    ``load_ngram_table(name, n).to_dict()`` exports a table as a dict.
+
+    Binary files only hold n-grams of up to ``_blaise.MAX_TABLE_N`` letters, as a file of every possible longer
+    n-gram would be too big. Longer n-grams are built from the JSON each time instead, and aren't cached.
+    """
+    if n > _blaise.MAX_TABLE_N:
+        return _blaise.to_dist(load_ngram_dist(name, n))
+    return load_cached(
+        _DATA_TYPE,
+        f"{name}_{n}",
+        _TABLE_EXTENSION,
+        build=lambda: _blaise.to_dist(load_ngram_dist(name, n)),
+        load=_blaise.load_dist,
+    )
+
+
+def save_ngram_table(table, name: str, n: int) -> str:
+    """
+    Saves a native n-gram table built from the saved distribution ``name`` to the cache read by
+    :func:`load_ngram_table`, and returns its path. Tables are limited to n of at most ``_blaise.MAX_TABLE_N``.
+    """
+    if n > _blaise.MAX_TABLE_N:
+        raise ValueError(f"Only n-gram tables of n up to {_blaise.MAX_TABLE_N} can be saved, got {n}")
+    return save_cached(table, _DATA_TYPE, f"{name}_{n}", _TABLE_EXTENSION)
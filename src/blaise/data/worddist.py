@@ -1,8 +1,12 @@
 from collections import Counter
 
-from blaise.data.core import load_data, save_data
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.data.core import load_cached, load_data, save_cached, save_data
 from blaise.data.corpus import load_corpus
-from blaise.strings import normalize_string
+from blaise.strings import normalize_strings
+
+_DATA_TYPE = "word_dist"
+_INDEX_EXTENSION = "idx"
 
 
 def load_word_dist(name: str, overwrite=False) -> dict[str, float]:
@@ -12,7 +16,7 @@ def load_word_dist(name: str, overwrite=False) -> dict[str, float]:
     result = None
     try:
         if not overwrite:
-            result = load_data("word_dist", f"{name}")
+            result = load_data(_DATA_TYPE, f"{name}")
     except FileNotFoundError:
         result = None
     if result is None:
@@ -28,7 +32,7 @@ def _generate_from_corpus(name, overwrite=False):
     except FileNotFoundError:
         print("No corp")
     print(f"Calculating word distribution from corpus {name}")
-    dist = dict(Counter(normalize_string(word) for word in corpus.split()))
+    dist = dict(Counter(normalize_strings(corpus.split())))
     # Some substrings are entirely non-alpha characters so remove these.
     if "" in dist:
         dist.pop("")
@@ -41,4 +45,27 @@ def _generate_from_corpus(name, overwrite=False):
 
 
 def save_word_dist(dist, name: str, **kwargs):
-    save_data(dist, "word_dist", f"{name}", **kwargs)
+    save_data(dist, _DATA_TYPE, f"{name}", **kwargs)
+
+
+def load_word_index(name: str):
+    """
+    Loads a word distribution as a native word index for segmentation. The index is built the first time it's
+    loaded, and cached in the user data folder under a hash of the JSON distribution, so later processes read
+    it from a file without parsing the JSON or rebuilding it.
+    """
+    return load_cached(
+        _DATA_TYPE,
+        name,
+        _INDEX_EXTENSION,
+        build=lambda: _blaise.WordIndex(load_word_dist(name)),
+        load=_blaise.load_word_index,
+    )
+
+
+def save_word_index(index, name: str) -> str:
+    """
+    Saves a native word index built from the saved word distribution ``name`` to the cache read by
+    :func:`load_word_index`, and returns its path.
+    """
+    return save_cached(index, _DATA_TYPE, name, _INDEX_EXTENSION)
@@ -0,0 +1,205 @@
+"""
+Opt-in measurement of where the time in a crack goes.
+
+Inside a :func:`instrument` block, the crackers record the wall time of each stage of their work, the number
+of candidates they score and the peak memory of the candidates they hold at once. The native kernels keep
+their own counts of candidates scored, so the searches that run entirely natively are counted too. Outside a
+block, each stage costs one context variable lookup.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, TypeVar
+
+from blaise import _blaise  # ty: ignore[unresolved-import]
+
+T = TypeVar("T")
+
+_active: ContextVar["Stats | None"] = ContextVar("blaise_stats", default=None)
+
+
+@dataclass
+class StageStats:
+    """The totals for one stage, across every time it ran."""
+
+    seconds: float = 0.0
+    calls: int = 0
+    candidates: int = 0
+    letters: int = 0
+
+
+class Stats:
+    """
+    What was measured in an :func:`instrument` block.
+
+    Attributes
+    ----------
+    stages : dict[str, StageStats]
+        Wall time, number of calls, candidates scored and letters scored for each stage, in the order they
+        first ran. The stages of the crackers are ``normalize``, ``key_lengths`` (Vigenère), ``generate`` for
+        building candidate keys or plaintexts, ``search`` (Playfair's native annealing, which generates and
+        scores candidates together), ``score`` and ``rank``. A cracker that runs another one, as Vigenère
+        runs Caesar on each column, counts the inner work in its own current stage.
+    candidates : int
+        Candidates scored in every stage, natively or in Python.
+    letters : int
+        Letters scored across those candidates.
+    peak_candidate_bytes : int
+        The largest estimated size of the candidates held in memory at once.
+    """
+
+    def __init__(self) -> None:
+        self.stages: dict[str, StageStats] = {}
+        self.candidates = 0
+        self.letters = 0
+        self.peak_candidate_bytes = 0
+        # The number of stages open on each thread. Stages never stay open across a yield or an await, so
+        # they nest properly on each thread, and threads that share the stats, by running in a copy of the
+        # context, each record their own outermost stages.
+        self._open = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def seconds(self) -> float:
+        """Total wall time across the stages."""
+        return sum(stage.seconds for stage in self.stages.values())
+
+    @property
+    def candidates_per_second(self) -> float:
+        """Candidates scored per second of wall time across the stages."""
+        seconds = self.seconds
+        return self.candidates / seconds if seconds > 0 else 0.0
+
+    def _add(self, name: str, totals: StageStats) -> None:
+        """Adds ``totals`` to the stage ``name``. The caller holds the lock."""
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = StageStats()
+        stage.seconds += totals.seconds
+        stage.calls += totals.calls
+        stage.candidates += totals.candidates
+        stage.letters += totals.letters
+        self.candidates += totals.candidates
+        self.letters += totals.letters
+
+    def _merge(self, other: "Stats") -> None:
+        """Adds everything recorded in ``other`` to these stats."""
+        with self._lock:
+            for name, stage in other.stages.items():
+                self._add(name, stage)
+            self.peak_candidate_bytes = max(self.peak_candidate_bytes, other.peak_candidate_bytes)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": self.seconds,
+            "candidates": self.candidates,
+            "letters": self.letters,
+            "candidates_per_second": self.candidates_per_second,
+            "peak_candidate_bytes": self.peak_candidate_bytes,
+            "stages": {name: vars(stage).copy() for name, stage in self.stages.items()},
+        }
+
+    def __repr__(self) -> str:
+        stages = ", ".join(f"{name}={stage.seconds * 1000:.3g}ms" for name, stage in self.stages.items())
+        return (
+            f"Stats({stages}, candidates={self.candidates}, "
+            f"candidates_per_second={self.candidates_per_second:.4g}, "
+            f"peak_candidate_bytes={self.peak_candidate_bytes})"
+        )
+
+
+@contextmanager
+def instrument() -> Iterator[Stats]:
+    """
+    Records what the crackers do inside the block in the :class:`Stats` it yields. Each block, and each thread
+    or task running one, collects its own stats, and a nested block collects separately from the one around it.
+    Work on other threads that run in a copy of the block's context is added to its stats too.
+
+    >>> from blaise.ciphers import Caesar
+    >>> with instrument() as stats:
+    ...     results = Caesar().crack("EBIILTLOIA")
+    >>> list(stats.stages)
+    ['normalize', 'generate', 'score', 'rank']
+    >>> stats.candidates
+    26
+    """
+    stats = Stats()
+    token = _active.set(stats)
+    try:
+        yield stats
+    finally:
+        _active.reset(token)
+
+
+def _separately(func: Callable[[], T]) -> Callable[[], T]:
+    """
+    Wraps ``func``, which is handed to another thread, to record into stats of its own that are added to the
+    active stats once it finishes, so that it's measured as a whole alongside other work running at once.
+    """
+    stats = _active.get()
+    if stats is None:
+        return func
+
+    def run() -> T:
+        with instrument() as own:
+            try:
+                return func()
+            finally:
+                stats._merge(own)
+
+    return run
+
+
+class _stage:
+    """
+    Times the block as the stage ``name`` of the active :class:`Stats`, and counts the candidates the kernels
+    score in it. A stage inside another stage counts towards the outer one.
+    """
+
+    __slots__ = ("name", "stats", "start", "counts")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.start = None
+
+    def __enter__(self) -> None:
+        stats = self.stats = _active.get()
+        if stats is not None:
+            depth = getattr(stats._open, "depth", 0)
+            stats._open.depth = depth + 1
+            if depth == 0:
+                self.counts = _blaise.work_counts()
+                self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        stats = self.stats
+        if stats is None:
+            return
+        stats._open.depth -= 1
+        if self.start is None:
+            return
+        seconds = time.perf_counter() - self.start
+        candidates, letters = _blaise.work_counts()
+        with stats._lock:
+            stats._add(self.name, StageStats(seconds, 1, candidates - self.counts[0], letters - self.counts[1]))
+
+
+def _record_scored(texts: list[str]) -> None:
+    """Counts texts scored in Python, such as by a pure Python scorer, with the candidates scored natively."""
+    if _active.get() is not None:
+        _blaise.record_work(len(texts), sum(map(len, texts)))
+
+
+def _record_candidates(*columns: list) -> None:
+    """
+    Records that a batch of candidates, given as columns such as their keys, plaintexts and scores, is held in
+    memory at once. Strings are counted by their length and anything else as 8 bytes, as polars estimates them.
+    """
+    stats = _active.get()
+    if stats is not None:
+        size = sum(len(value) if isinstance(value, str) else 8 for column in columns for value in column)
+        with stats._lock:
+            stats.peak_candidate_bytes = max(stats.peak_candidate_bytes, size)
@@ -1,25 +1,44 @@
-def product_index_ordered(*iterators):
+import heapq
+from typing import Iterable, Iterator, TypeVar
+
+T = TypeVar("T")
+
+
+def product_index_ordered(*iterators: Iterable[T]) -> Iterator[tuple[T, ...]]:
     """
     An iterator over multiple iterators giving a cartesian product, but ordered
-    in sum(index). So indices in this order for the case of two iterators:
-    [0, 0], [1, 0], [0, 1], [2, 0], [1, 1], [0, 2], [2, 1], [1, 2], ... etc.
+    in sum(index), with ties in order of the indices. So indices in this order
+    for the case of two iterators:
+    [0, 0], [0, 1], [1, 0], [0, 2], [1, 1], [2, 0], ... etc.
     """
-    lists = [list(i) for i in iterators]
-    if any(len(x) == 0 for x in lists):
-        return
-    max_index_sum = sum(len(x) - 1 for x in lists)
-    for index_sum in range(max_index_sum + 1):
-        yield from _product_index_ordered(max_index_sum, index_sum, lists)
+    ranked = [[(item, index) for index, item in enumerate(iterator)] for iterator in iterators]
+    for combo, _ in product_score_ordered(*ranked):
+        yield combo
 
 
-def _product_index_ordered(index_sum: int, target_index_sum: int, lists: list[list]):
-    if target_index_sum > index_sum:
+def product_score_ordered(*scored: Iterable[tuple[T, float]]) -> Iterator[tuple[tuple[T, ...], float]]:
+    """
+    An iterator over the cartesian product of iterables of ``(item, score)`` pairs, giving each combination
+    of items with its summed score, in increasing order of score. For scores where lower is better, the best
+    combinations come first.
+
+    Combinations are generated lazily from a heap of candidates, so taking the first k of them costs
+    O(k log k) time after sorting each input, however large the product.
+
+    >>> list(product_score_ordered([("A", 0.0), ("B", 2.0)], [("x", 0.5), ("y", 1.0)]))
+    [(('A', 'x'), 0.5), (('A', 'y'), 1.0), (('B', 'x'), 2.5), (('B', 'y'), 3.0)]
+    """
+    lists = [sorted(items, key=lambda item: item[1]) for items in scored]
+    if any(len(items) == 0 for items in lists):
         return
-    elif len(lists) == 1:
-        yield (lists[0][target_index_sum],)
-    else:
-        next_index_sum = index_sum - (len(lists[0]) - 1)
-        min_index = max(target_index_sum - next_index_sum, 0)
-        for i, val in enumerate(lists[0][min_index : target_index_sum + 1]):
-            for sol in _product_index_ordered(next_index_sum, target_index_sum - i, lists[1:]):
-                yield (val,) + sol
+    # Each combination is pushed by the one with the last of its non-zero indices one lower, so it's only
+    # pushed once. The last item of a heap entry is the first index that its successors may increase.
+    heap = [(sum(items[0][1] for items in lists), (0,) * len(lists), 0)]
+    while heap:
+        score, indices, first = heapq.heappop(heap)
+        yield tuple(items[i][0] for items, i in zip(lists, indices)), score
+        for j in range(first, len(lists)):
+            i = indices[j] + 1
+            if i < len(lists[j]):
+                successor = indices[:j] + (i,) + indices[j + 1 :]
+                heapq.heappush(heap, (score - lists[j][i - 1][1] + lists[j][i][1], successor, j))
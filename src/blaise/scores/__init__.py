@@ -1,4 +1,4 @@
 from .base import as_scorer
-from .ngram import NGramScorer
+from .ngram import LogProbNGramScorer, NGramScorer
 
-__all__ = ["as_scorer", "NGramScorer"]
+__all__ = ["as_scorer", "NGramScorer", "LogProbNGramScorer"]
@@ -1,4 +1,7 @@
 from abc import ABC, abstractmethod
+from typing import Iterable
+
+from blaise.instrumentation import _record_scored
 
 
 class Scorer(ABC):
@@ -6,6 +9,49 @@ class Scorer(ABC):
     def score(self, text: str) -> float:
         pass
 
+    def score_many(self, texts: Iterable[str], n_jobs: int = 1) -> list[float]:
+        """
+        Scores many texts at once. Scorers with a native implementation should override this to
+        score the whole batch in a single call, spread across ``n_jobs`` threads (-1 for all cores).
+        Pure python scorers run on one thread.
+        """
+        texts = texts if isinstance(texts, list) else list(texts)
+        _record_scored(texts)
+        return [self.score(text) for text in texts]
+
+    def session(self, text: str) -> "ScoreSession":
+        """
+        Starts scoring ``text`` for a search that changes a few letters at a time. See
+        :class:`ScoreSession`.
+        """
+        return ScoreSession(self, text)
+
+
+class ScoreSession:
+    """
+    The score of a text, kept up to date as letters in the text change. ``apply`` takes a list of
+    ``(position, letter)`` changes and returns the new score.
+
+    This implementation rescores the whole text on each change. Sessions from n-gram scorers only
+    rescore the n-grams that overlap the changed letters, so a change costs the same however long the
+    text is.
+    """
+
+    def __init__(self, scorer: Scorer, text: str) -> None:
+        self._scorer = scorer
+        self._letters = list(text)
+        self.score = scorer.score(text)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._letters)
+
+    def apply(self, diff: Iterable[tuple[int, str]]) -> float:
+        for pos, letter in diff:
+            self._letters[pos] = letter
+        self.score = self._scorer.score(self.text)
+        return self.score
+
 
 _default_scorer = None
 
@@ -1,8 +1,9 @@
 import math
+from typing import Iterable
 
 from blaise import _blaise  # ty: ignore[unresolved-import]
-from blaise.data.ngram import load_ngram_dist
-from blaise.scores.base import Scorer
+from blaise.data.ngram import load_ngram_dist, load_ngram_table
+from blaise.scores.base import Scorer, ScoreSession
 from blaise.strings.ngram import calculate_ngrams
 
 
@@ -38,16 +39,80 @@ class _PyNGramScorer(Scorer):
 
 class NGramScorer(Scorer):
     """
-    Scores N-Grams using the Bhattacharyya distance
+    Scores N-Grams using the Bhattacharyya distance. Named distributions are memory mapped rather than parsed,
+    see :func:`blaise.data.ngram.load_ngram_table`.
     """
 
     def __init__(self, n: int, expected: dict[str, float] | str) -> None:
         super().__init__()
         if isinstance(expected, str):
-            expected = load_ngram_dist(expected, n)
-        self.expected_dist = expected
-        self._rs_dist = _blaise.to_dist(self.expected_dist)
+            self._expected_dist = None
+            self._rs_dist = load_ngram_table(expected, n)
+        else:
+            self._expected_dist = expected
+            self._rs_dist = _blaise.to_dist(expected)
         self.n = n
 
+    @property
+    def expected_dist(self) -> dict[str, float]:
+        if self._expected_dist is None:
+            self._expected_dist = self._rs_dist.to_dict()
+        return self._expected_dist
+
     def score(self, text: str) -> float:
         return _blaise.bd_score(text, self.n, self._rs_dist)
+
+    def score_many(self, texts: Iterable[str], n_jobs: int = 1) -> list[float]:
+        return _blaise.bd_score_batch(
+            texts if isinstance(texts, list) else list(texts), self.n, self._rs_dist, n_jobs=n_jobs
+        )
+
+    def session(self, text: str) -> ScoreSession:
+        """
+        Starts scoring ``text``, which must be normalized, for a search that changes a few letters at a
+        time. Each change only rescores the n-grams that overlap it.
+
+        >>> scorer = NGramScorer(2, "en_wiki")
+        >>> session = scorer.session("HELLOWORLD")
+        >>> abs(session.apply([(0, "J"), (5, "V")]) - scorer.score("JELLOVORLD")) < 1e-12
+        True
+        >>> session.text
+        'JELLOVORLD'
+        """
+        return _blaise.ScoreSession(text, self._rs_dist)
+
+
+class LogProbNGramScorer(Scorer):
+    """
+    Scores text by the mean negative log probability of its n-grams, which costs one table lookup per n-gram.
+    This is the usual fitness function for stochastic key searches, and discriminates better than the
+    Bhattacharyya distance on long texts. Lower scores are better.
+
+    N-grams missing from the expected distribution are given the probability ``floor``, which defaults to a
+    hundredth of the probability of the rarest n-gram. Any n is supported, e.g. ``n=4`` for quadgrams.
+
+    >>> scorer = LogProbNGramScorer(3, "en_wiki")
+    >>> scorer.score("THEQUICKBROWNFOX") < scorer.score("QXZJVKWQXZJVKWQX")
+    True
+    """
+
+    def __init__(self, n: int, expected: dict[str, float] | str, floor: float | None = None) -> None:
+        super().__init__()
+        if isinstance(expected, str):
+            expected = load_ngram_table(expected, n)
+        self._rs_dist = _blaise.to_log_prob_dist(expected, floor)
+        if self._rs_dist.n != n:
+            raise ValueError(f"Expected a distribution of {n}-grams")
+        self.n = n
+        self.floor = self._rs_dist.floor
+
+    def score(self, text: str) -> float:
+        return _blaise.log_prob_score(text, self._rs_dist)
+
+    def score_many(self, texts: Iterable[str], n_jobs: int = 1) -> list[float]:
+        return _blaise.log_prob_score_batch(
+            texts if isinstance(texts, list) else list(texts), self._rs_dist, n_jobs=n_jobs
+        )
+
+    def session(self, text: str) -> ScoreSession:
+        return _blaise.ScoreSession(text, self._rs_dist)
@@ -1,9 +1,21 @@
-from .utils import check_is_alpha, is_alpha, normalize_string, restore_string  # isort:skip
+from typing import TYPE_CHECKING
+
+from blaise._lazy import lazy_attributes
+
+from .utils import check_is_alpha, is_alpha, normalize_string, normalize_strings, restore_string  # isort:skip
 from .ngram import calculate_ngrams
-from .segmentation import Segmenter
+from .text import Text
+
+if TYPE_CHECKING:
+    from .segmentation import Segmenter
+
+# Segmenter needs polars, so it's only imported when it's used.
+__getattr__, __dir__ = lazy_attributes(__name__, {"Segmenter": ".segmentation"})
 
 __all__ = [
     "normalize_string",
+    "normalize_strings",
+    "Text",
     "is_alpha",
     "check_is_alpha",
     "restore_string",
@@ -1,29 +1,34 @@
-import math
-
 import polars as pl
-from pygtrie import CharTrie
 
-from blaise.data.worddist import load_word_dist
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.data.worddist import load_word_index
 
 
 class Segmenter:
     """
     A string segmenter that identifies word boundaries in a string of letters.
 
+    Segmentation is a native dynamic program over positions in the text, which keeps the best
+    ``n_branch_limit`` segmentations of each suffix, so its cost grows linearly with the length of the text.
+
     Parameters
     ----------
     word_dist : str | list[str] | dict[str, float]
         The source of word probabilities used for segmentation.
-        * If a string, it is interpreted as a word dist name and loaded via
-            :func:`load_word_dist`.
+        * If a string, it is interpreted as a word dist name and its native
+            index is loaded via :func:`load_word_index`, which caches the
+            index on disk.
         * If a list of strings, each word is assigned an equal probability
             (i.e., a uniform distribution).
         * If a dictionary mapping words to probabilities, the values are
             normalised so that the total probability sums to 1.
     n_branch_limit : int | None, optional
-        When set, limits the number of candidate segmentations kept at
-        each recursion step to the top ``n_branch_limit`` by score.
-        If ``None`` (the default), all candidates are considered.
+        Limits the number of candidate segmentations kept at each
+        position to the top ``n_branch_limit`` by score, 10 by default.
+        If ``None``, all candidates are kept, which is exact but only
+        practical for short texts: the number of segmentations can grow
+        exponentially with the length of the text, for example when the
+        word distribution has single letters as words.
     length_power: float
         This controls how much we favour long words over short words.
         A value of 1 means we are agnostic to length. A value of greater than
@@ -76,60 +81,39 @@ class Segmenter:
     def __init__(
         self,
         word_dist: str | list[str] | dict[str, float] = "en_wiki",
-        n_branch_limit: int | None = None,
+        n_branch_limit: int | None = 10,
         length_power: float = 1,
     ):
         if isinstance(word_dist, str):
-            word_dist = load_word_dist(word_dist)
-
-        if isinstance(word_dist, list):
-            word_dist = {w: 1 / len(word_dist) for w in word_dist}
-        elif isinstance(word_dist, dict):
-            total = sum(word_dist.values())
-            word_dist = {w: p / total for w, p in word_dist.items()}
+            self._index = load_word_index(word_dist)
+            self._word_dist = None
         else:
-            raise TypeError(f"Unsupported type for word_dist: {type(word_dist)}")
+            if isinstance(word_dist, list):
+                word_dist = {w: 1 / len(word_dist) for w in word_dist}
+            elif isinstance(word_dist, dict):
+                total = sum(word_dist.values())
+                word_dist = {w: p / total for w, p in word_dist.items()}
+            else:
+                raise TypeError(f"Unsupported type for word_dist: {type(word_dist)}")
+            self._index = _blaise.WordIndex(word_dist)
+            self._word_dist = word_dist
 
-        self.word_dist = word_dist
         self.n_branch_limit = n_branch_limit
         self.length_power = length_power
-        self._trie = CharTrie(self.word_dist)
-
-    def segment(self, text: str) -> pl.DataFrame:
-        """Segments text into words."""
-        return self._segment_impl(text, {}).sort(by="score")
-
-    def _segment_impl(self, text: str, cache) -> pl.DataFrame:
-        if len(text) in cache:
-            return cache[len(text)]
-
-        if len(text) == 0:
-            result = pl.DataFrame(
-                [{"text": "", "score": 0}],
-                schema={"text": pl.String, "score": pl.Float64},
-            )
-        else:
-            results = []
-            for i in range(1, len(text) + 1):
-                word = text[:i]
-                if not self._trie.has_node(word):
-                    break
-                if self._trie.has_key(word):
-                    p = self._trie[word]
-                    sub_result = self._segment_impl(text[i:], cache)
-                    sub_result = sub_result.with_columns(
-                        text=pl.concat_str([pl.lit(word), pl.col("text")], separator=" "),
-                        score=pl.col("score") - len(word) ** (1 / self.length_power) * math.log(p),
-                    )
-                    results.append(sub_result)
-
-            if len(results) == 0:
-                result = pl.DataFrame(schema={"text": pl.String, "score": pl.Float64})
-            else:
-                result = pl.concat(results)
-
-        if self.n_branch_limit is not None and self.n_branch_limit < len(result):
-            result = result.bottom_k(self.n_branch_limit, by="score")
 
-        cache[len(text)] = result
-        return result.with_columns(text=pl.col("text").str.strip_chars())
+    @property
+    def word_dist(self) -> dict[str, float]:
+        """The normalized word probabilities. For a named distribution, they are read back from the index."""
+        if self._word_dist is None:
+            self._word_dist = self._index.to_dict()
+        return self._word_dist
+
+    def segment(self, text: str, n_best: int | None = None) -> pl.DataFrame:
+        """
+        Segments text into words, returning the ``n_best`` segmentations with the lowest scores, best first.
+        Asking for fewer segmentations makes segmenting faster. If ``None``, it returns the top
+        ``n_branch_limit``, or all of them if that is ``None`` too.
+        """
+        limits = [k for k in (n_best, self.n_branch_limit) if k is not None]
+        results = self._index.segment(text, self.length_power, min(limits) if limits else None)
+        return pl.DataFrame(results, schema={"text": pl.String, "score": pl.Float64}, orient="row")
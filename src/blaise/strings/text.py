@@ -0,0 +1,33 @@
+from blaise import _blaise  # ty: ignore[unresolved-import]
+
+
+class Text(str):
+    """
+    A string of the letters A-Z, as returned by :func:`blaise.strings.normalize_string` and the ciphers.
+
+    A ``Text`` is a ``str``, so it can be displayed, compared and passed to anything that takes a string without
+    conversion. CPython stores ASCII strings with one byte per letter, and the native scorers and ciphers read
+    those bytes in place. What it adds is the guarantee that it's already normalized, so
+    :func:`blaise.strings.normalize_string` returns it unchanged and a chain such as decrypt, score and restore
+    only normalizes the text once. Operations on it, such as slicing, return plain strings.
+
+    >>> text = Text("Hello, world!")
+    >>> text
+    'HELLOWORLD'
+    >>> Text(text) is text
+    True
+    """
+
+    __slots__ = ()
+
+    def __new__(cls, text: str = "") -> "Text":
+        if isinstance(text, Text):
+            return text
+        if text.isascii() and text.isalpha():
+            return str.__new__(cls, text.upper())
+        return str.__new__(cls, _blaise.normalize_string(text))
+
+    @classmethod
+    def _trusted(cls, letters: str) -> "Text":
+        """Wraps a string that is known to be only the letters A-Z, without checking it."""
+        return str.__new__(cls, letters)
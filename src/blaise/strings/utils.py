@@ -1,17 +1,22 @@
 import re
 import unicodedata
+from typing import TYPE_CHECKING, Any
 
+from blaise import _blaise  # ty: ignore[unresolved-import]
 
-def normalize_string(s: str) -> str:
+from .text import Text
+
+if TYPE_CHECKING:
+    import polars as pl
+
+
+def normalize_string(s: str) -> Text:
     """
     Normalize a Unicode string to uppercase ASCII letters A-Z.
 
-    The function performs the following steps:
-    1. Normalizes the string to NFKD form, decomposing characters.
-    2. Encodes to ASCII, ignoring characters that cannot be represented.
-    3. Decodes back to a string.
-    4. Converts the result to uppercase.
-    5. Removes any characters that are not A-Z.
+    Each character is replaced by the ASCII characters of its NFKD form, so accented letters keep their base
+    letter and ligatures are spelled out. The result is converted to uppercase, and any characters that are
+    not A-Z are removed. This runs natively, with a table of the NFKD forms of non-ASCII characters.
 
     Parameters
     ----------
@@ -20,18 +25,42 @@ def normalize_string(s: str) -> str:
 
     Returns
     -------
-    str
-            The normalized string containing only uppercase ASCII letters.
+    Text
+            The normalized string containing only uppercase ASCII letters. A :class:`Text` is returned
+            unchanged, as it's already normalized.
+
+    Examples
+    --------
+
+    >>> normalize_string("Crème brûlée, ﬁnally!")
+    'CREMEBRULEEFINALLY'
     """
-    # If already normalized, we are done.
-    if is_alpha(s):
-        return s.upper()
+    return Text(s)
+
+
+def normalize_strings(texts: "list[str] | pl.Series | Any", n_jobs: int = 1) -> "list[str] | pl.Series":
+    """
+    Normalizes many strings at once, as in :func:`normalize_string`, spread across ``n_jobs`` threads (-1 for all
+    cores). A list gives a list. A polars Series, or any other column that supports the Arrow C stream interface,
+    gives a polars Series, with nulls left as nulls.
+
+    >>> normalize_strings(["Hello, world", "naïve"])
+    ['HELLOWORLD', 'NAIVE']
+    """
+    if not hasattr(texts, "__arrow_c_stream__"):
+        return _blaise.normalize_strings(list(texts), n_jobs=n_jobs)
+    import polars as pl
+
+    return pl.Series(_blaise.normalize_column(texts, n_jobs=n_jobs)).alias(getattr(texts, "name", ""))
+
+
+def _py_normalize_string(s: str) -> str:
+    """The Python implementation of :func:`normalize_string`, which the native one is tested against."""
     # Decompose Unicode characters
     decomposed = unicodedata.normalize("NFKD", s)
     # Encode to ASCII, ignoring non-ASCII characters
     ascii_bytes = decomposed.encode("ascii", "ignore")
     ascii_str = ascii_bytes.decode("ascii")
-    # Convert to uppercase
     # Keep only uppercase ASCII letters A-Z
     return re.sub("[^A-Z]", "", ascii_str.upper())
 
@@ -0,0 +1,46 @@
+import pytest
+
+from blaise.analysis import index_of_coincidence, rank_key_lengths
+from blaise.ciphers import Vigenere
+
+PLAINTEXT = """It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of
+foolishness, it was the epoch of belief, it was the epoch of incredulity, it was the season of Light, it was
+the season of Darkness, it was the spring of hope, it was the winter of despair, we had everything before us,
+we had nothing before us, we were all going direct to Heaven, we were all going direct the other way"""
+
+
+def test_index_of_coincidence():
+    assert index_of_coincidence("AAAA") == 1
+    assert index_of_coincidence("ABCD") == 0
+    assert index_of_coincidence(PLAINTEXT) == pytest.approx(0.076, abs=0.01)
+    with pytest.raises(ValueError):
+        index_of_coincidence("A")
+
+
+@pytest.mark.parametrize("key", ["KEY", "LEMON", "CRYPTOGRAPHY", "ABSOLUTELYNOTHING"])
+def test_rank_key_lengths(key):
+    ciphertext = Vigenere().encrypt(PLAINTEXT, key)
+    ranked = rank_key_lengths(ciphertext, range(2, 31))
+    assert ranked.columns == ["key_length", "ioc", "kasiski", "score"]
+    assert len(ranked) == 29
+    assert ranked["key_length"][0] == len(key)
+
+
+def test_rank_key_lengths_short_text():
+    ranked = rank_key_lengths("AB", [1, 2, 3])
+    assert ranked["key_length"].to_list() == [1, 2, 3]
+    assert ranked["score"].null_count() == 2
+
+
+def test_rank_key_lengths_prefers_the_period_to_its_divisors():
+    # Periods 2 and 4 score the same here, as the columns of period 2 already reach the expected ioc.
+    ciphertext = Vigenere().encrypt(PLAINTEXT, "KEYS")
+    ranked = rank_key_lengths(ciphertext, [2, 4])
+    assert ranked["score"][0] == ranked["score"][1]
+    assert ranked["key_length"].to_list() == [4, 2]
+
+
+def test_crack_with_n_key_lengths():
+    ciphertext = Vigenere().encrypt(PLAINTEXT, "KEYS")
+    result = Vigenere().crack(ciphertext, key_length=range(3, 31), n_key_lengths=1, top_n=1)
+    assert result["key"][0] == "KEYS"
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+import blaise
+from blaise.ciphers import Caesar, Playfair, Vigenere, set_max_concurrent_cracks
+from blaise.scores.base import Scorer
+
+PLAINTEXT = (
+    "Now is the winter of our discontent made glorious summer by this sun of York and all the clouds that loured "
+    "upon our house in the deep bosom of the ocean buried"
+)
+
+
+@pytest.fixture
+def one_crack_at_a_time():
+    set_max_concurrent_cracks(1)
+    yield
+    set_max_concurrent_cracks(None)
+
+
+def test_acrack_matches_crack():
+    ciphertext = Vigenere().encrypt(PLAINTEXT, "KEY")
+    expected = Vigenere().crack(ciphertext, key_length=3)
+    assert asyncio.run(Vigenere().acrack(ciphertext, key_length=3)).equals(expected)
+
+
+def test_acrack_does_not_block_the_event_loop():
+    ciphertext = Playfair().encrypt(PLAINTEXT, "PLAYFAIREXAMPLE")
+
+    async def main():
+        crack = asyncio.create_task(Playfair().acrack(ciphertext, n_restarts=1, n_iters=10**9, time_budget=0.5, seed=0))
+        ticks = 0
+        while not crack.done():
+            await asyncio.sleep(0.01)
+            ticks += 1
+        await crack
+        return ticks
+
+    assert asyncio.run(main()) > 10
+
+
+def test_cancelling_acrack_frees_its_thread(one_crack_at_a_time):
+    ciphertext = Playfair().encrypt(PLAINTEXT, "PLAYFAIREXAMPLE")
+
+    async def main():
+        crack = asyncio.create_task(Playfair().acrack(ciphertext, n_restarts=1, n_iters=10**9, seed=0))
+        await asyncio.sleep(0.1)
+        crack.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await crack
+        # The next crack only gets the one thread once the cancelled search has stopped.
+        start = time.perf_counter()
+        results = await Caesar().acrack("KHOOR", top_n=1)
+        return results, time.perf_counter() - start
+
+    results, seconds = asyncio.run(main())
+    assert results["plaintext"][0] == "HELLO"
+    assert seconds < 2
+
+
+def test_max_concurrent_cracks(one_crack_at_a_time):
+    ciphertext = Playfair().encrypt(PLAINTEXT, "PLAYFAIREXAMPLE")
+
+    async def main():
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(Playfair().acrack(ciphertext, n_restarts=1, n_iters=10**9, time_budget=0.2) for _ in range(3))
+        )
+        return time.perf_counter() - start
+
+    # The three cracks take turns on the one thread.
+    assert asyncio.run(main()) >= 0.55
+
+
+class SleepyScorer(Scorer):
+    # Releases the GIL while scoring, as the native scorers do, so that concurrent cracks overlap.
+    def score(self, text: str) -> float:
+        time.sleep(0.001)
+        return len(text)
+
+
+def test_concurrent_acracks_add_to_the_callers_stats():
+    set_max_concurrent_cracks(4)
+
+    async def main():
+        await asyncio.gather(*(Caesar().acrack("EBIILTLOIA", scorer=SleepyScorer()) for _ in range(8)))
+
+    try:
+        with blaise.instrument() as stats:
+            asyncio.run(main())
+    finally:
+        set_max_concurrent_cracks(None)
+    assert stats.candidates == stats.stages["score"].candidates == 8 * 26
+    assert stats.stages["score"].calls == 8
+
+
+def test_lowering_max_concurrent_cracks_applies_to_waiting_cracks():
+    lock = threading.Lock()
+    scoring: set[int] = set()
+    overlaps = []
+
+    class TrackingScorer(Scorer):
+        def __init__(self, crack: int):
+            self.crack = crack
+
+        def score(self, text: str) -> float:
+            with lock:
+                scoring.add(self.crack)
+                # Cracks 0 and 1 are already running when the limit is lowered, so they're left to finish.
+                if not scoring & {0, 1}:
+                    overlaps.append(len(scoring))
+            time.sleep(0.002)
+            with lock:
+                scoring.discard(self.crack)
+            return len(text)
+
+    async def main():
+        cracks = [asyncio.create_task(Caesar().acrack("EBIILTLOIA", scorer=TrackingScorer(i))) for i in range(4)]
+        await asyncio.sleep(0.01)
+        set_max_concurrent_cracks(1)
+        cracks += [asyncio.create_task(Caesar().acrack("EBIILTLOIA", scorer=TrackingScorer(i))) for i in (4, 5)]
+        return await asyncio.gather(*cracks)
+
+    set_max_concurrent_cracks(2)
+    try:
+        results = asyncio.run(main())
+    finally:
+        set_max_concurrent_cracks(None)
+    assert [len(df) for df in results] == [26] * 6
+    assert overlaps and max(overlaps) == 1
+
+
+def test_max_concurrent_cracks_rejects_zero():
+    with pytest.raises(ValueError):
+        set_max_concurrent_cracks(0)
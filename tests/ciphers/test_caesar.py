@@ -126,3 +126,27 @@ def test_crack():
             "score": 1.1898997492680905,
         }
     )
+
+
+def test_series_matches_scalar():
+    import polars as pl
+
+    texts = pl.Series("message", ["Hello, world!", "café au lait", "", None, "xyz" * 50])
+    result = Caesar().encrypt_series(texts, 3)
+    assert result.name == "message"
+    assert result.dtype == pl.String
+    expected = [None if text is None else Caesar().encrypt(text, 3) for text in texts]
+    assert result.to_list() == expected
+    assert Caesar().decrypt_series(result, 3).to_list() == [
+        None if text is None else Caesar().encrypt(text, 0) for text in texts
+    ]
+
+
+def test_series_per_row_keys():
+    texts = ["HELLO", "HELLO", "HELLO", "HELLO"]
+    keys = [1, -1, None, 27]
+    assert Caesar().encrypt_series(texts, keys).to_list() == ["IFMMP", "GDKKN", None, "IFMMP"]
+    with pytest.raises(ValueError):
+        Caesar().encrypt_series(texts, [1, 2])
+    with pytest.raises(TypeError):
+        Caesar().encrypt_series(texts, "KEY")
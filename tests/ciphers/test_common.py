@@ -0,0 +1,148 @@
+import time
+
+import pytest
+
+import blaise
+from blaise.ciphers import Caesar, Playfair, Vigenere
+from blaise.ciphers.common import Cipher, _Budget, _TopK
+
+PLAINTEXT = (
+    "Now is the winter of our discontent made glorious summer by this sun of York and all the clouds that loured "
+    "upon our house in the deep bosom of the ocean buried"
+)
+
+
+def test_budget_batches_share_evaluations():
+    budget = _Budget(max_evaluations=5)
+    assert list(budget.batches(range(3), 2)) == [[0, 1], [2]]
+    # What the first items didn't use is left for the next ones.
+    assert list(budget.batches(range(10), 2)) == [[0, 1]]
+    assert budget.exhausted()
+
+
+def test_budget_runs_the_first_batch_however_short():
+    budget = _Budget(time_budget=0)
+    assert list(budget.batches(range(5), 2)) == [[0, 1]]
+
+
+@pytest.mark.parametrize("kwargs", [{"time_budget": -1}, {"max_evaluations": 0}])
+def test_budget_rejects_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        Caesar().crack("KHOOR", **kwargs)
+
+
+def test_caesar_max_evaluations():
+    results = Caesar().crack("KHOOR", max_evaluations=5)
+    assert sorted(results["key"]) == [0, 1, 2, 3, 4]
+
+
+def test_vigenere_max_evaluations_spans_key_lengths():
+    ciphertext = Vigenere().encrypt(PLAINTEXT, "KEY")
+    with blaise.instrument() as stats:
+        results = Vigenere().crack(ciphertext, key_length=[3, 4], n_trials=20, top_n=None, max_evaluations=30)
+    assert len(results) == 30
+    assert sorted(len(key) for key in results["key"]) == [3] * 20 + [4] * 10
+    assert stats.stages["score"].candidates == 30
+
+
+def test_vigenere_time_budget_returns_the_first_batch():
+    ciphertext = Vigenere().encrypt(PLAINTEXT, "KEY")
+    results = Vigenere().crack(ciphertext, key_length=range(3, 20), time_budget=0)
+    assert results["key"][0] == "KEY"
+    assert {len(key) for key in results["key"]} == {3}
+
+
+def test_playfair_max_evaluations():
+    ciphertext = Playfair().encrypt(PLAINTEXT, "PLAYFAIREXAMPLE")
+    with blaise.instrument() as stats:
+        results = Playfair().crack(ciphertext, n_restarts=5, n_iters=100, seed=0, max_evaluations=2 * 101 + 7)
+    assert stats.candidates == 2 * 101 + 7
+    assert len(results) <= 3
+
+
+def test_playfair_batches_continue_the_same_search():
+    ciphertext = Playfair().encrypt(PLAINTEXT, "PLAYFAIREXAMPLE")
+    whole = Playfair().crack(ciphertext, n_restarts=4, n_iters=200, seed=1, n_jobs=4)
+    batched = Playfair().crack(ciphertext, n_restarts=4, n_iters=200, seed=1, n_jobs=1)
+    assert whole.equals(batched)
+
+
+def test_playfair_time_budget_stops_a_long_search():
+    ciphertext = Playfair().encrypt(PLAINTEXT, "PLAYFAIREXAMPLE")
+    start = time.perf_counter()
+    results = Playfair().crack(ciphertext, n_restarts=4, n_iters=100_000_000, seed=0, time_budget=0.2)
+    assert time.perf_counter() - start < 5
+    assert 1 <= len(results) <= 4
+
+
+def test_crack_iter_streams_improving_results():
+    ciphertext = Vigenere().encrypt(PLAINTEXT, "KEY")
+    kwargs = {"key_length": range(2, 6), "n_trials": 2000, "top_n": 3}
+    streamed = list(Vigenere().crack_iter(ciphertext, **kwargs))
+    assert len(streamed) > 1
+    best = [results["score"][0] for results in streamed]
+    assert best == sorted(best, reverse=True)
+    assert streamed[-1].equals(Vigenere().crack(ciphertext, **kwargs))
+
+
+def test_crack_iter_can_stop_early():
+    results = Caesar().crack_iter("KHOOR", top_n=1)
+    assert next(results)["key"][0] == 3
+    results.close()
+
+
+def test_crack_iter_needs_a_cracker():
+    class Identity(Cipher):
+        def encrypt(self, plaintext, key):
+            return plaintext
+
+        def decrypt(self, ciphertext, key):
+            return ciphertext
+
+    with pytest.raises(NotImplementedError):
+        next(Identity().crack_iter("HELLO"))
+
+
+def test_top_k_keeps_the_best_in_order():
+    top = _TopK(3)
+    assert top.push(list("ABCDE"), [5.0, 1.0, 4.0, 1.0, 0.5])
+    assert not top.push(["F"], [4.0])
+    # Ties go to the candidate pushed first.
+    assert top.items() == [("E", 0.5), ("B", 1.0), ("D", 1.0)]
+
+
+def test_top_k_without_a_limit_keeps_everything():
+    top = _TopK(None)
+    top.push(list(range(100)), [float(-i) for i in range(100)])
+    assert len(top) == 100
+    assert top.items()[0] == (99, -99.0)
+
+
+def test_top_k_ranks_nan_last():
+    top = _TopK(2)
+    # A negative NaN sorts below every number in a total order, but is still no score at all.
+    assert top.push(["A", "B", "C"], [float("-nan"), 2.0, float("nan")])
+    assert not top.push(["D"], [float("-nan")])
+    assert top.push(["E"], [1.0])
+    assert [key for key, _ in top.items()] == ["E", "B"]
+
+
+def test_top_k_unique_drops_repeats():
+    top = _TopK(2, unique=True)
+    top.push(["A", "A", "B", "A"], [1.0, 1.0, 2.0, 0.5])
+    assert top.items() == [("A", 1.0), ("B", 2.0)]
+
+
+def test_top_k_needs_a_score_for_each_candidate():
+    with pytest.raises(ValueError):
+        _TopK(2).push(["A", "B"], [1.0])
+
+
+def test_bruteforce_holds_only_the_top_candidates():
+    keys = list(range(26)) * 200
+    with blaise.instrument() as stats:
+        results = Caesar().bruteforce_crack("KHOOR", keys, top_n=2)
+    assert results["plaintext"][0] == "HELLO"
+    assert stats.candidates == len(keys)
+    # The largest batch held at once is one batch of keys, plaintexts and scores, not all of them.
+    assert stats.peak_candidate_bytes <= 1024 * (8 + 5 + 8)
@@ -8,7 +8,8 @@ is the same as the primary fill character.
 
 import pytest
 
-from blaise.ciphers.playfair import Playfair, _to_bigrams
+from blaise.ciphers.playfair import Playfair, PlayfairKey, _to_bigrams
+from blaise.scores import NGramScorer
 
 
 @pytest.mark.parametrize(
@@ -53,3 +54,77 @@ def test_playfair_decrypt():
         Playfair().decrypt("BMODZBXDNABEKUDMUIXMMOUVIF", "playfairexample", remove_fill=True)
         == "HIDETHEGOLDINTHETREESTUMP"
     )
+
+
+def test_playfair_crack():
+    plaintext = (
+        "It was the best of times, it was the worst of times, it was the age of wisdom, it was the age of "
+        "foolishness, it was the epoch of belief, it was the epoch of incredulity, it was the season of Light, "
+        "it was the season of Darkness, it was the spring of hope, it was the winter of despair, we had "
+        "everything before us, we had nothing before us, we were all going direct to Heaven, we were all "
+        "going direct the other way"
+    )
+    ciphertext = Playfair().encrypt(plaintext, "monarchyplayfair")
+    result = Playfair().crack(ciphertext, n_restarts=8, seed=1, top_n=3)
+    assert result.columns == ["key", "plaintext", "score"]
+    assert len(result) == 3
+    best = result.row(0, named=True)
+    # The key found may be a rotation of the square, which is an equivalent key.
+    assert best["plaintext"] == Playfair().decrypt(ciphertext, "monarchyplayfair")
+    assert best["score"] == pytest.approx(NGramScorer(3, "en_wiki").score(best["plaintext"]))
+
+
+def test_playfair_crack_rejects_invalid_ciphertext():
+    with pytest.raises(ValueError):
+        Playfair().crack("ABC")
+    with pytest.raises(ValueError):
+        Playfair().crack("AABC")
+
+
+def test_series_matches_scalar():
+    texts = ["hide the gold in the tree stump", "balloon", "Jazz", None, ""]
+    cipher = Playfair()
+    result = cipher.encrypt_series(texts, "playfairexample")
+    assert result.to_list() == [None if text is None else cipher.encrypt(text, "playfairexample") for text in texts]
+    decrypted = cipher.decrypt_series(result, "playfairexample")
+    assert decrypted.to_list() == [None if text is None else cipher.decrypt(text, "playfairexample") for text in result]
+
+
+def test_series_per_row_keys_and_errors():
+    cipher = Playfair(missing_letter="Q->K")
+    keys = ["monarchy", "keyword", None]
+    result = cipher.encrypt_series(["quick", "quick", "quick"], keys)
+    assert result.to_list() == [cipher.encrypt("quick", "monarchy"), cipher.encrypt("quick", "keyword"), None]
+    with pytest.raises(ValueError, match="Row 1"):
+        cipher.decrypt_series(["ABCD", "ABC"], "monarchy")
+    with pytest.raises(ValueError):
+        cipher.decrypt_series(["AABC"], "monarchy")
+
+
+def test_playfair_key_tables_match_the_rules():
+    key = Playfair().key("monarchy")
+    assert key == PlayfairKey("MONARCHYBDEFGIKLPQSTUVWXZ")
+    assert Playfair().key(key) is key
+    assert Playfair().key("monarchy") is key
+    # Same row, same column, each wrapping around, and rectangle.
+    assert key.encrypt("HBAM") == "YDRO"
+    assert key.encrypt("MCUM") == "CEMC"
+    assert key.encrypt("MZ") == "RU"
+    for a in key.square:
+        for b in key.square:
+            if a != b:
+                assert key.decrypt(key.encrypt(a + b)) == a + b
+
+
+def test_playfair_key_errors():
+    key = PlayfairKey("MONARCHYBDEFGIKLPQSTUVWXZ")
+    with pytest.raises(ValueError, match="repeated"):
+        key.encrypt("ABCC")
+    with pytest.raises(ValueError, match="not in key"):
+        key.encrypt("AJ")
+    with pytest.raises(ValueError, match="even length"):
+        key.encrypt("ABC")
+    with pytest.raises(ValueError, match="even length"):
+        key.decrypt("ABC")
+    with pytest.raises(ValueError):
+        PlayfairKey("ABC")
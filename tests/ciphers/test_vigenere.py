@@ -1,6 +1,7 @@
 import pytest
 
 from blaise.ciphers.vigenere import Vigenere
+from blaise.scores.ngram import LogProbNGramScorer, NGramScorer, _PyNGramScorer
 
 
 def test_encrypt_decrypt_roundtrip():
@@ -55,3 +56,55 @@ def test_vigenere_crack():
         }
     )
     assert len(results) == 10
+
+
+def test_vigenere_crack_python_scorer_matches_native():
+    ciphertext = Vigenere().encrypt("THEVIGENERECIPHERISUSEDTOENCODEPLAINTEXTINTOCIPHERTEXT", "ARSE")
+    native = Vigenere().crack(ciphertext, key_length=4, n_trials=50, top_n=5, scorer=NGramScorer(2, "en_wiki"))
+    python = Vigenere().crack(ciphertext, key_length=4, n_trials=50, top_n=5, scorer=_PyNGramScorer(2, "en_wiki"))
+    assert native["key"].to_list() == python["key"].to_list()
+    assert native["plaintext"].to_list() == python["plaintext"].to_list()
+    assert native["score"].to_list() == pytest.approx(python["score"].to_list())
+
+
+def test_vigenere_crack_n_jobs():
+    ciphertext = Vigenere().encrypt("THEVIGENERECIPHERISUSEDTOENCODEPLAINTEXTINTOCIPHERTEXT", "ARSE")
+    single = Vigenere().crack(ciphertext, key_length=[3, 4, 5], n_trials=100)
+    parallel = Vigenere().crack(ciphertext, key_length=[3, 4, 5], n_trials=100, n_jobs=-1)
+    assert single.equals(parallel)
+
+
+def test_vigenere_crack_log_prob_scorer():
+    plaintext = "THEVIGENERECIPHERISUSEDTOENCODEPLAINTEXTINTOCIPHERTEXT"
+    ciphertext = Vigenere().encrypt(plaintext, "ARSE")
+    results = Vigenere().crack(ciphertext, key_length=4, n_trials=100, scorer=LogProbNGramScorer(3, "en_wiki"))
+    assert results["key"][0] == "ARSE"
+    assert results["plaintext"][0] == plaintext
+
+
+def test_series_matches_scalar():
+    import polars as pl
+
+    texts = pl.Series(["The Vigenère cipher", "", None, "attack at dawn" * 20])
+    result = Vigenere().encrypt_series(texts, "lemon")
+    assert result.to_list() == [None if text is None else Vigenere().encrypt(text, "lemon") for text in texts]
+    assert Vigenere().decrypt_series(result, "LEMON").to_list() == [
+        None if text is None else Vigenere().decrypt(text, "lemon") for text in result
+    ]
+
+
+def test_series_per_row_keys():
+    result = Vigenere().encrypt_series(["HELLO", "HELLO", "HELLO"], ["KEY", "a", None])
+    assert result.to_list() == [Vigenere().encrypt("HELLO", "KEY"), "HELLO", None]
+    with pytest.raises(ValueError, match="Row 1"):
+        Vigenere().encrypt_series(["HELLO", "HELLO"], ["KEY", "K3Y"])
+    with pytest.raises(ValueError):
+        Vigenere().encrypt_series(["HELLO"], "")
+
+
+@pytest.mark.parametrize("key", ["A", "KEY", "LEMON", "ABCDEFGHIJKLMNOPQRSTUVWXYZ", "LONGERTHANTHETEXT"])
+def test_encrypt_matches_letter_by_letter_shift(key):
+    plaintext = "THEQUICKBROWNFOX"
+    expected = "".join(chr(65 + (ord(c) + ord(key[i % len(key)]) - 130) % 26) for i, c in enumerate(plaintext))
+    assert Vigenere().encrypt(plaintext, key) == expected
+    assert Vigenere().decrypt(expected, key) == plaintext
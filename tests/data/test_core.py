@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.data import core
+from blaise.data.ngram import load_ngram_table, save_ngram_dist
+
+DIST = {"AB": 0.5, "BA": 0.5}
+
+
+@pytest.fixture(autouse=True)
+def user_data_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "USER_DATA_PATH", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_path_depends_on_content_and_params():
+    save_ngram_dist(DIST, "test", 2)
+    path = core.cache_path("ngram_dist", "test_2", "bin")
+    assert path.startswith(os.path.join(core.USER_DATA_PATH, "cache", "ngram_dist", "test_2."))
+    assert core.cache_path("ngram_dist", "test_2", "bin") == path
+    assert core.cache_path("ngram_dist", "test_2", "bin", dtype="float32") != path
+    # Saving the same contents again keeps the key, while new contents change it.
+    save_ngram_dist(DIST, "test", 2)
+    assert core.cache_path("ngram_dist", "test_2", "bin") == path
+    save_ngram_dist({"AB": 1.0}, "test", 2)
+    assert core.cache_path("ngram_dist", "test_2", "bin") != path
+    with pytest.raises(FileNotFoundError):
+        core.cache_path("ngram_dist", "missing_2", "bin")
+
+
+def test_load_cached_builds_once():
+    save_ngram_dist(DIST, "test", 2)
+    builds = []
+
+    def build():
+        builds.append(1)
+        return _blaise.to_dist(DIST)
+
+    for _ in range(2):
+        table = core.load_cached("ngram_dist", "test_2", "bin", build=build, load=_blaise.load_dist)
+        assert table.to_dict() == DIST
+    assert len(builds) == 1
+
+
+def test_corrupt_cache_file_is_rebuilt():
+    save_ngram_dist(DIST, "test", 2)
+    load_ngram_table("test", 2)
+    with open(core.cache_path("ngram_dist", "test_2", "bin"), "wb") as f:
+        f.write(b"corrupt")
+    assert load_ngram_table("test", 2).to_dict() == DIST
+
+
+def test_clear_cache(user_data_path):
+    save_ngram_dist(DIST, "test", 2)
+    load_ngram_table("test", 2)
+    core.clear_cache()
+    assert not os.path.exists(user_data_path / "cache")
+    assert load_ngram_table("test", 2).to_dict() == DIST
+
+
+def test_unwritable_cache_falls_back_to_building(user_data_path, monkeypatch):
+    save_ngram_dist(DIST, "test", 2)
+    # A path under a file can't be created, even by root.
+    (user_data_path / "cache").write_text("")
+    assert load_ngram_table("test", 2).to_dict() == DIST
+    assert load_ngram_table("test", 2).to_dict() == DIST
+
+
+def test_cache_path_only_hashes_changed_files(monkeypatch):
+    save_ngram_dist(DIST, "test", 2)
+    path = core.cache_path("ngram_dist", "test_2", "bin")
+    hashed = []
+    file_digest = core.hashlib.file_digest
+    monkeypatch.setattr(core.hashlib, "file_digest", lambda *args: hashed.append(1) or file_digest(*args))
+    assert core.cache_path("ngram_dist", "test_2", "bin") == path
+    # Another process finds the hash saved in the cache.
+    core._digests.clear()
+    assert core.cache_path("ngram_dist", "test_2", "bin") == path
+    assert hashed == []
+    save_ngram_dist({"AB": 1.0}, "test", 2)
+    assert core.cache_path("ngram_dist", "test_2", "bin") != path
+    assert hashed == [1]
@@ -0,0 +1,74 @@
+import tarfile
+from collections import Counter
+
+import pytest
+
+from blaise.data import core
+from blaise.data.ingest import count_corpus, ingest_corpus, iter_text_chunks
+from blaise.data.ngram import load_ngram_dist, load_ngram_table
+from blaise.data.worddist import load_word_dist
+from blaise.strings import normalize_string
+from blaise.strings.ngram import calculate_ngrams
+
+TEXT = "Il était une fois, in a café far away,\nthere lived a naïve\tcat called Zoë. The END"
+
+
+@pytest.fixture(autouse=True)
+def user_data_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "USER_DATA_PATH", str(tmp_path / "data"))
+
+
+@pytest.fixture
+def text_path(tmp_path):
+    path = tmp_path / "corpus.txt"
+    path.write_text(TEXT, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def tar_path(tmp_path, text_path):
+    path = tmp_path / "corpus.tgz"
+    with tarfile.open(path, "w:gz") as archive:
+        archive.add(text_path, arcname="a.txt")
+        archive.add(text_path, arcname="b.txt")
+    return str(path)
+
+
+def test_iter_text_chunks(text_path, tar_path):
+    assert "".join(iter_text_chunks(text_path, chunk_size=5)) == TEXT + "\n"
+    assert "".join(iter_text_chunks(tar_path, chunk_size=5)) == (TEXT + "\n") * 2
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_count_corpus(text_path, chunk_size):
+    counter = count_corpus(text_path, max_n=3, chunk_size=chunk_size)
+    normalized = normalize_string(TEXT)
+    assert counter.n_letters == len(normalized)
+    for n in [1, 2, 3]:
+        assert counter.ngram_dist(n).to_dict() == pytest.approx(calculate_ngrams(normalized, n))
+    assert counter.word_counts() == Counter(w for w in (normalize_string(w) for w in TEXT.split()) if w)
+    with pytest.raises(ValueError):
+        counter.ngram_dist(4)
+
+
+def test_count_corpus_longest_ngrams(text_path):
+    # Windows of Zs have the largest codes, which must not overflow as the window rolls along.
+    text = TEXT + " zzzzzzzzzzzzzzzz"
+    counter = count_corpus(text_path, max_n=13)
+    counter.update(text.encode())
+    normalized = normalize_string(TEXT + text)
+    assert counter.ngram_dist(13).to_dict() == pytest.approx(calculate_ngrams(normalized, 13))
+
+
+def test_count_corpus_archive(text_path, tar_path):
+    counter = count_corpus(tar_path, max_n=2)
+    assert counter.ngram_dist(2).to_dict() == pytest.approx(calculate_ngrams(normalize_string(TEXT * 2), 2))
+    assert counter.word_counts() == {w: 2 * c for w, c in count_corpus(text_path).word_counts().items()}
+
+
+def test_ingest_corpus(text_path):
+    ingest_corpus(text_path, "test", max_n=2)
+    normalized = normalize_string(TEXT)
+    assert load_ngram_dist("test", 2) == pytest.approx(calculate_ngrams(normalized, 2))
+    assert load_ngram_table("test", 1).to_dict() == pytest.approx(calculate_ngrams(normalized, 1))
+    assert load_word_dist("test")["CAFE"] == pytest.approx(1 / 18)
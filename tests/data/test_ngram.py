@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.data import core
+from blaise.data.ngram import load_ngram_dist, load_ngram_table, save_ngram_dist, save_ngram_table
+from blaise.scores.ngram import LogProbNGramScorer, NGramScorer
+
+TEXT = "THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG"
+
+
+@pytest.fixture(autouse=True)
+def user_data_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "USER_DATA_PATH", str(tmp_path))
+    return tmp_path
+
+
+def test_load_ngram_table():
+    table = load_ngram_table("en_wiki", 2)
+    assert table.n == 2
+    assert os.path.exists(core.cache_path("ngram_dist", "en_wiki_2", "bin"))
+    assert table.to_dict() == load_ngram_dist("en_wiki", 2)
+    # The second load maps the saved file.
+    assert load_ngram_table("en_wiki", 2).to_dict() == table.to_dict()
+
+
+def test_named_scorers_match_dict_scorers():
+    dist = load_ngram_dist("en_wiki", 3)
+    assert NGramScorer(3, "en_wiki").score(TEXT) == pytest.approx(NGramScorer(3, dist).score(TEXT))
+    assert LogProbNGramScorer(3, "en_wiki").score(TEXT) == pytest.approx(LogProbNGramScorer(3, dist).score(TEXT))
+    assert NGramScorer(3, "en_wiki").expected_dist == dist
+
+
+def test_save_ngram_dist_replaces_table():
+    save_ngram_dist({"AB": 0.5, "BA": 0.5}, "test", 2)
+    assert load_ngram_table("test", 2).to_dict() == {"AB": 0.5, "BA": 0.5}
+    save_ngram_dist({"AB": 0.25, "BB": 0.75}, "test", 2)
+    assert load_ngram_table("test", 2).to_dict() == {"AB": 0.25, "BB": 0.75}
+
+
+def test_write_float32(tmp_path):
+    dist = {"AB": 0.1, "ZZ": 0.9}
+    path = str(tmp_path / "test.bin")
+    _blaise.to_dist(dist).write(path, "float32")
+    assert os.path.getsize(path) == 16 + 4 * 26**2
+    assert _blaise.load_dist(path).to_dict() == pytest.approx(dist)
+    with pytest.raises(ValueError):
+        _blaise.to_dist(dist).write(path, "float16")
+
+
+def test_load_invalid_file(tmp_path):
+    path = tmp_path / "test.bin"
+    path.write_bytes(b"not an n-gram file")
+    with pytest.raises(OSError):
+        _blaise.load_dist(str(path))
+
+
+def test_long_ngram_tables_are_built_without_the_cache(user_data_path):
+    n = _blaise.MAX_TABLE_N + 1
+    dist = {"ABCDEFGH"[:n]: 0.5, "BCDEFGHI"[:n]: 0.5}
+    save_ngram_dist(dist, "test", n)
+    table = load_ngram_table("test", n)
+    assert table.to_dict() == dist
+    assert not os.path.exists(user_data_path / "cache")
+    with pytest.raises(ValueError, match="up to"):
+        save_ngram_table(table, "test", n)
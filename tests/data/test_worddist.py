@@ -0,0 +1,65 @@
+import math
+import os
+
+import pytest
+
+from blaise import _blaise  # ty: ignore[unresolved-import]
+from blaise.data import core
+from blaise.data.worddist import load_word_index, save_word_dist
+from blaise.strings.segmentation import Segmenter
+
+WORD_DIST = {"HELLO": 0.5, "WORLD": 0.25, "HELL": 0.2, "O": 0.05}
+
+
+@pytest.fixture(autouse=True)
+def user_data_path(tmp_path, monkeypatch):
+    monkeypatch.setattr(core, "USER_DATA_PATH", str(tmp_path))
+    return tmp_path
+
+
+def test_load_word_index():
+    save_word_dist(WORD_DIST, "test")
+    index = load_word_index("test")
+    assert os.path.exists(core.cache_path("word_dist", "test", "idx"))
+    assert len(index) == 4
+    assert index.to_dict() == pytest.approx(WORD_DIST)
+
+
+def test_save_word_dist_replaces_index():
+    save_word_dist(WORD_DIST, "test")
+    load_word_index("test")
+    save_word_dist({"HI": 1.0}, "test")
+    assert load_word_index("test").to_dict() == {"HI": 1.0}
+
+
+def test_segmenter_by_name():
+    save_word_dist(WORD_DIST, "test")
+    by_name = Segmenter("test").segment("HELLOWORLD")
+    by_dict = Segmenter(WORD_DIST).segment("HELLOWORLD")
+    assert by_name["text"].to_list() == by_dict["text"].to_list()
+    assert by_name["score"].to_list() == pytest.approx(by_dict["score"].to_list())
+    assert Segmenter("test").word_dist == pytest.approx(WORD_DIST)
+
+
+def test_prefixes():
+    index = _blaise.WordIndex(WORD_DIST)
+    assert index.prefixes("HELLOWORLD") == pytest.approx([(4, math.log(0.2)), (5, math.log(0.5))])
+    assert index.prefixes("HELLOWORLD", 4) == pytest.approx([(5, math.log(0.05))])
+    assert index.prefixes("HELLOWORLD", 10) == []
+    with pytest.raises(IndexError):
+        index.prefixes("HELLO", 6)
+
+
+def test_invalid_word_index_file(tmp_path):
+    path = tmp_path / "bad.idx"
+    path.write_bytes(b"not an index")
+    with pytest.raises(OSError):
+        _blaise.load_word_index(str(path))
+
+
+def test_segmenter_with_unwritable_cache(user_data_path):
+    save_word_dist(WORD_DIST, "test")
+    # The cache folder can't be created under a file, so the index is only built in memory.
+    (user_data_path / "cache").write_text("")
+    assert load_word_index("test").to_dict() == pytest.approx(WORD_DIST)
+    assert Segmenter("test").segment("HELLOWORLD")["text"][0] == "HELLO WORLD"
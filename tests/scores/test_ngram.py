@@ -0,0 +1,73 @@
+import math
+
+import pytest
+
+from blaise.scores.ngram import LogProbNGramScorer, NGramScorer, _PyNGramScorer
+
+TEXTS = ["THEQUICKBROWNFOXJUMPSOVERTHELAZYDOG", "HELLOWORLD", "QXZJQXZJ"]
+
+
+@pytest.mark.parametrize(
+    "scorer", [NGramScorer(2, "en_wiki"), _PyNGramScorer(2, "en_wiki"), LogProbNGramScorer(3, "en_wiki")]
+)
+def test_score_many_matches_score(scorer):
+    assert scorer.score_many(TEXTS) == pytest.approx([scorer.score(t) for t in TEXTS])
+
+
+def test_score_many_accepts_iterables():
+    scorer = NGramScorer(1, "en_wiki")
+    assert scorer.score_many(iter(TEXTS)) == pytest.approx(scorer.score_many(TEXTS))
+    assert scorer.score_many([]) == []
+
+
+def test_mismatched_n_raises():
+    scorer = NGramScorer(2, {"ABC": 0.5, "BCD": 0.5})
+    with pytest.raises(ValueError):
+        scorer.score("ABCD")
+
+
+def test_score_many_n_jobs():
+    scorer = NGramScorer(3, "en_wiki")
+    texts = TEXTS * 100
+    assert scorer.score_many(texts, n_jobs=-1) == scorer.score_many(texts, n_jobs=1)
+    assert scorer.score_many(texts, n_jobs=4) == scorer.score_many(texts, n_jobs=1)
+
+
+def test_log_prob_scorer():
+    dist = {"AB": 0.5, "BC": 0.25, "CD": 0.25}
+    scorer = LogProbNGramScorer(2, dist)
+    assert scorer.floor == 0.0025
+    assert scorer.score("ABCD") == pytest.approx(-(math.log(0.5) + 2 * math.log(0.25)) / 3)
+    # Unseen n-grams get the floor probability.
+    assert scorer.score("ABZ") == pytest.approx(-(math.log(0.5) + math.log(0.0025)) / 2)
+    assert scorer.score("A") == math.inf
+    assert LogProbNGramScorer(2, dist, floor=0.1).score("ZZ") == pytest.approx(-math.log(0.1))
+    with pytest.raises(ValueError):
+        LogProbNGramScorer(3, dist)
+
+
+@pytest.mark.parametrize(
+    "scorer", [NGramScorer(2, "en_wiki"), _PyNGramScorer(2, "en_wiki"), LogProbNGramScorer(3, "en_wiki")]
+)
+def test_session_matches_score(scorer):
+    text = TEXTS[0]
+    session = scorer.session(text)
+    assert session.score == pytest.approx(scorer.score(text))
+    letters = list(text)
+    for diff in [[(0, "Q")], [(3, "X"), (4, "Z")], [(len(text) - 1, "E"), (0, "T")], []]:
+        for pos, letter in diff:
+            letters[pos] = letter
+        assert session.apply(diff) == pytest.approx(scorer.score("".join(letters)))
+        assert session.text == "".join(letters)
+    assert session.score == pytest.approx(scorer.score(session.text))
+
+
+def test_session_invalid_changes():
+    session = NGramScorer(2, "en_wiki").session("HELLO")
+    with pytest.raises(ValueError):
+        session.apply([(5, "A")])
+    with pytest.raises(ValueError):
+        session.apply([(0, "a")])
+    assert session.text == "HELLO"
+    with pytest.raises(ValueError):
+        NGramScorer(2, "en_wiki").session("hello")
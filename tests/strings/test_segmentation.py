@@ -60,5 +60,50 @@ def test_n_branch_limit():
     assert df["text"].item() in {"a a a", "a aa", "aa a", "aaa"}
 
 
+def _all_segmentations(text, word_dist, length_power):
+    if not text:
+        return [("", 0.0)]
+    results = []
+    for i in range(1, len(text) + 1):
+        word = text[:i]
+        if word in word_dist:
+            cost = -(len(word) ** (1 / length_power)) * math.log(word_dist[word])
+            for rest, score in _all_segmentations(text[i:], word_dist, length_power):
+                results.append((f"{word} {rest}".strip(), cost + score))
+    return sorted(results, key=lambda r: r[1])
+
+
+@pytest.mark.parametrize("length_power", [1, 2])
+def test_segment_matches_exhaustive_search(length_power):
+    word_dist = {"a": 0.3, "ab": 0.2, "b": 0.1, "ba": 0.15, "aba": 0.05, "bab": 0.2}
+    seg = Segmenter(word_dist=word_dist, n_branch_limit=None, length_power=length_power)
+    text = "ababbaabab"
+    expected = _all_segmentations(text, seg.word_dist, length_power)
+    df = seg.segment(text)
+    assert sorted(df["text"]) == sorted(t for t, _ in expected)
+    assert df["score"].to_list() == pytest.approx([s for _, s in expected])
+    top = seg.segment(text, n_best=3)
+    assert top["score"].to_list() == pytest.approx([s for _, s in expected[:3]])
+
+
+def test_segment_long_text():
+    seg = Segmenter(word_dist={"THE": 0.5, "CAT": 0.3, "SAT": 0.2}, n_branch_limit=5)
+    df = seg.segment("THECATSAT" * 1000)
+    assert df["text"][0] == " ".join(["THE", "CAT", "SAT"] * 1000)
+    assert len(df) == 1
+
+
+def test_segment_long_ambiguous_text():
+    # With every letter a word, text of n letters has 2^(n-1) segmentations, so only a limited beam is tractable.
+    words = "THE QUICK BROWN FOX JUMPS OVER LAZY DOG".split()
+    word_dist = {**{w: 0.1 for w in words}, **{chr(c): 0.001 for c in range(ord("A"), ord("Z") + 1)}}
+    sentence = ["THE", "QUICK", "BROWN", "FOX", "JUMPS", "OVER", "THE", "LAZY", "DOG"]
+    text = "".join(sentence) * 286
+    assert len(text) >= 10_000
+    df = Segmenter(word_dist).segment(text)
+    assert len(df) == 10
+    assert df["text"][0] == " ".join(sentence * 286)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
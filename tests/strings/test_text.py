@@ -0,0 +1,41 @@
+import pytest
+
+from blaise.ciphers import Caesar, Playfair, Vigenere
+from blaise.scores import NGramScorer
+from blaise.strings import Text, calculate_ngrams, normalize_string, restore_string
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [("HELLO", "HELLO"), ("hello", "HELLO"), ("Hello, world!", "HELLOWORLD"), ("Crème", "CREME"), ("", "")],
+)
+def test_text_is_normalized(text, expected):
+    result = Text(text)
+    assert isinstance(result, str)
+    assert result == expected
+
+
+def test_normalized_text_is_not_normalized_again():
+    text = Text("Hello, world!")
+    assert Text(text) is text
+    assert normalize_string(text) is text
+    assert type(text[1:]) is str
+
+
+@pytest.mark.parametrize(
+    "cipher, key",
+    [(Caesar(), 3), (Vigenere(), "KEY"), (Playfair(), "monarchy")],
+)
+def test_ciphers_return_text(cipher, key):
+    ciphertext = cipher.encrypt("Attack at dawn!", key)
+    assert isinstance(ciphertext, Text)
+    plaintext = cipher.decrypt(ciphertext, key)
+    assert isinstance(plaintext, Text)
+    assert normalize_string(plaintext) is plaintext
+
+
+def test_text_works_with_scorers_and_strings():
+    text = Vigenere().decrypt(Vigenere().encrypt("Attack at dawn!", "KEY"), "KEY")
+    assert NGramScorer(3, "en_wiki").score(text) == NGramScorer(3, "en_wiki").score("ATTACKATDAWN")
+    assert calculate_ngrams(text, 1) == calculate_ngrams("ATTACKATDAWN", 1)
+    assert restore_string("Attack at dawn!", text) == "ATTACK AT DAWN!"
@@ -0,0 +1,39 @@
+import polars as pl
+import pytest
+
+from blaise.strings import normalize_string, normalize_strings
+from blaise.strings.utils import _py_normalize_string
+
+# Every character up to the CJK blocks, in runs, to cover the native table of NFKD forms.
+ALL_CHARS = "".join(chr(c) for c in range(1, 0x3000))
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "HELLO",
+        "Hello, World!",
+        "Crème brûlée",
+        "Straße",
+        "ﬁne Ⅻ ＡＢ ①",
+        "Ǆemal ǉubljana",
+        "",
+        "123 !?",
+        *(ALL_CHARS[i : i + 100] for i in range(0, len(ALL_CHARS), 100)),
+    ],
+)
+def test_normalize_string_matches_python(text):
+    assert normalize_string(text) == _py_normalize_string(text)
+
+
+def test_normalize_strings():
+    texts = ["Hello, World!", "Crème brûlée", ""]
+    expected = [_py_normalize_string(text) for text in texts]
+    assert normalize_strings(texts) == expected
+    assert normalize_strings(texts, n_jobs=-1) == expected
+
+
+def test_normalize_strings_series():
+    result = normalize_strings(pl.Series("text", ["Crème brûlée", None, "abc"]))
+    assert result.name == "text"
+    assert result.to_list() == ["CREMEBRULEE", None, "ABC"]
@@ -0,0 +1,32 @@
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        "import blaise",
+        "from blaise.strings import normalize_string; normalize_string('Hello')",
+        "from blaise.ciphers import Caesar; Caesar().encrypt('HELLO', 3)",
+        "from blaise.ciphers import Vigenere; Vigenere().encrypt('HELLO', 'KEY')",
+        "from blaise.scores import NGramScorer",
+    ],
+)
+def test_light_imports_skip_heavy_dependencies(statement):
+    # Run in a fresh interpreter, as this one has imported everything already.
+    check = f"import sys; {statement}; print(sorted(m for m in ['polars', 'requests'] if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", check], capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_attributes():
+    import blaise.ciphers
+    import blaise.strings
+
+    assert blaise.strings.Segmenter.__name__ == "Segmenter"
+    assert "Segmenter" in dir(blaise.strings)
+    assert {"Caesar", "Vigenere", "Playfair"} <= set(dir(blaise.ciphers))
+    with pytest.raises(AttributeError):
+        blaise.ciphers.Enigma
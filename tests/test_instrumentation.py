@@ -0,0 +1,94 @@
+import contextvars
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import blaise
+from blaise.ciphers import Caesar, Playfair, Vigenere
+from blaise.scores.base import Scorer
+
+
+class LengthScorer(Scorer):
+    def score(self, text: str) -> float:
+        return len(text)
+
+
+def test_caesar_stages():
+    with blaise.instrument() as stats:
+        Caesar().crack("EBIILTLOIA")
+    assert list(stats.stages) == ["normalize", "generate", "score", "rank"]
+    assert stats.stages["score"].candidates == stats.candidates == 26
+    assert stats.letters == 26 * 10
+    # Ranking keeps the best of the one batch, then makes the results of them.
+    assert [stage.calls for stage in stats.stages.values()] == [1, 1, 1, 2]
+    assert all(stage.seconds >= 0 for stage in stats.stages.values())
+    assert stats.seconds == pytest.approx(sum(stage.seconds for stage in stats.stages.values()))
+    assert stats.candidates_per_second > 0
+    assert stats.peak_candidate_bytes > 0
+
+
+def test_vigenere_counts_native_scoring_and_inner_cracks():
+    with blaise.instrument() as stats:
+        Vigenere().crack("DLCFMEORCBIASTFOV", key_length=[3, 4], n_trials=50, n_key_lengths=1)
+    assert list(stats.stages) == ["normalize", "key_lengths", "generate", "score", "rank"]
+    assert stats.stages["score"].candidates == 50
+    # The Caesar cracks of the interleaved columns count towards generating keys.
+    assert stats.stages["generate"].candidates in {26 * 3, 26 * 4}
+
+
+def test_playfair_counts_native_search():
+    ciphertext = Playfair().encrypt("Hide the gold in the tree stump", "PLAYFAIREXAMPLE")
+    with blaise.instrument() as stats:
+        Playfair().crack(ciphertext, n_restarts=2, n_iters=100, seed=0)
+    assert list(stats.stages) == ["normalize", "search", "rank"]
+    assert stats.stages["search"].candidates == 2 * 101
+    assert stats.stages["search"].letters == 2 * 101 * len(ciphertext)
+
+
+def test_python_scorer_is_counted():
+    with blaise.instrument() as stats:
+        Caesar().crack("EBIILTLOIA", scorer=LengthScorer())
+    assert stats.candidates == 26
+
+
+def test_nothing_is_recorded_outside_a_block():
+    with blaise.instrument() as stats:
+        pass
+    Caesar().crack("EBIILTLOIA")
+    assert stats.stages == {} and stats.candidates == 0
+
+
+def test_nested_blocks_and_threads_collect_separately():
+    with blaise.instrument() as outer:
+        Caesar().crack("EBIILTLOIA")
+        with blaise.instrument() as inner:
+            Caesar().crack("EBIILTLOIA")
+        thread = threading.Thread(target=Caesar().crack, args=("EBIILTLOIA",))
+        thread.start()
+        thread.join()
+    assert outer.candidates == inner.candidates == 26
+    assert outer.stages["score"].calls == 1
+
+
+def test_threads_sharing_a_context_add_to_its_stats():
+    def crack_many():
+        for _ in range(50):
+            Caesar().crack("EBIILTLOIA")
+
+    with blaise.instrument() as stats:
+        with ThreadPoolExecutor(4) as executor:
+            futures = [executor.submit(contextvars.copy_context().run, crack_many) for _ in range(4)]
+            for future in futures:
+                future.result()
+    assert stats.candidates == stats.stages["score"].candidates == 4 * 50 * 26
+    assert stats.stages["score"].calls == stats.stages["generate"].calls == 4 * 50
+
+
+def test_to_dict():
+    with blaise.instrument() as stats:
+        Caesar().crack("EBIILTLOIA")
+    result = stats.to_dict()
+    assert result["candidates"] == 26
+    assert set(result["stages"]) == {"normalize", "generate", "score", "rank"}
+    assert set(result["stages"]["score"]) == {"seconds", "calls", "candidates", "letters"}
@@ -1,4 +1,9 @@
-from blaise.iterators import product_index_ordered
+import random
+from itertools import islice, product
+
+import pytest
+
+from blaise.iterators import product_index_ordered, product_score_ordered
 
 
 class TestProductIndexOrdered:
@@ -23,8 +28,37 @@ class TestProductIndexOrdered:
             ("A", 1, "D"),
             ("A", 2, "C"),
             ("B", 1, "C"),
-            ("A", 3, "D"),
+            ("A", 2, "D"),
+            ("A", 3, "C"),
             ("B", 1, "D"),
             ("B", 2, "C"),
+            ("A", 3, "D"),
+            ("B", 2, "D"),
+            ("B", 3, "C"),
             ("B", 3, "D"),
         ]
+
+    def test_first_few_of_large_product(self):
+        combos = product_index_ordered(range(1000), range(1000), range(1000))
+        assert list(islice(combos, 4)) == [(0, 0, 0), (0, 0, 1), (0, 1, 0), (1, 0, 0)]
+
+
+class TestProductScoreOrdered:
+    def test_empty(self):
+        assert list(product_score_ordered([("A", 1.0)], [])) == []
+
+    def test_orders_by_summed_score(self):
+        columns = [[("A", 3.0), ("B", 1.0), ("C", 2.0)], [("X", 0.5), ("Y", 0.0)]]
+        result = list(product_score_ordered(*columns))
+        assert len(result) == 6
+        assert [combo for combo, _ in result[:3]] == [("B", "Y"), ("B", "X"), ("C", "Y")]
+        scores = [score for _, score in result]
+        assert scores == sorted(scores)
+        assert set(combo for combo, _ in result) == set(product("ABC", "XY"))
+
+    def test_matches_sorted_product(self):
+        rng = random.Random(0)
+        columns = [[(c, rng.random()) for c in "ABCDE"] for _ in range(4)]
+        expected = sorted(sum(score for _, score in items) for items in product(*columns))
+        result = [score for _, score in product_score_ordered(*columns)]
+        assert result == pytest.approx(expected)